@@ -1 +1,68 @@
-"""Agno-based AI agents for GA-shift."""
+"""Agno-based AI agents for GA-shift.
+
+agno の import は重いため、パッケージ属性は初回アクセス時に遅延 import する。
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from agno.agent import Agent
+    from agno.team import Team
+
+    from ga_shift.agno_agents.adjuster import create_adjuster_agent
+    from ga_shift.agno_agents.compliance import create_compliance_agent
+    from ga_shift.agno_agents.handover import create_handover_agent
+    from ga_shift.agno_agents.hearing import create_hearing_agent
+    from ga_shift.agno_agents.monitoring import create_monitoring_agent
+    from ga_shift.agno_agents.neo4j_bridge import create_neo4j_bridge_agent
+    from ga_shift.agno_agents.optimizer import create_optimizer_agent
+    from ga_shift.agno_agents.report import create_report_agent
+    from ga_shift.agno_agents.simulation import create_simulation_agent
+    from ga_shift.agno_agents.team import create_shift_team
+
+# 公開名 → 定義元モジュール
+_LAZY_ATTRS: dict[str, str] = {
+    "Agent": "agno.agent",
+    "Team": "agno.team",
+    "create_adjuster_agent": "ga_shift.agno_agents.adjuster",
+    "create_compliance_agent": "ga_shift.agno_agents.compliance",
+    "create_handover_agent": "ga_shift.agno_agents.handover",
+    "create_hearing_agent": "ga_shift.agno_agents.hearing",
+    "create_monitoring_agent": "ga_shift.agno_agents.monitoring",
+    "create_neo4j_bridge_agent": "ga_shift.agno_agents.neo4j_bridge",
+    "create_optimizer_agent": "ga_shift.agno_agents.optimizer",
+    "create_report_agent": "ga_shift.agno_agents.report",
+    "create_simulation_agent": "ga_shift.agno_agents.simulation",
+    "create_shift_team": "ga_shift.agno_agents.team",
+}
+
+__all__ = [
+    "Agent",
+    "Team",
+    "create_adjuster_agent",
+    "create_compliance_agent",
+    "create_handover_agent",
+    "create_hearing_agent",
+    "create_monitoring_agent",
+    "create_neo4j_bridge_agent",
+    "create_optimizer_agent",
+    "create_report_agent",
+    "create_simulation_agent",
+    "create_shift_team",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # 2回目以降は通常の属性参照になる
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,29 @@
+"""各エージェント共通の MCPTools 生成ヘルパー.
+
+起動コマンドの解析（シェル分割・実行ファイルの PATH 探索）はコマンドごとに一度だけ行い、
+MCPTools 自体はエージェントごとに新しく作る（接続状態を共有しないため）。
+"""
+
+from __future__ import annotations
+
+import functools
+
+from agno.tools.mcp import MCPTools
+from agno.utils.mcp import prepare_command
+from mcp import StdioServerParameters
+from mcp.client.stdio import get_default_environment
+
+DEFAULT_GA_MCP_COMMAND = "uv run python -m ga_shift.mcp.server"
+DEFAULT_NEO4J_MCP_COMMAND = "uvx mcp-server-neo4j"
+
+
+@functools.lru_cache(maxsize=32)
+def _server_params(command: str) -> StdioServerParameters:
+    """起動コマンドを stdio 用のサーバーパラメータに変換する（コマンドごとにキャッシュ）."""
+    cmd, *args = prepare_command(command)
+    return StdioServerParameters(command=cmd, args=args, env=get_default_environment())
+
+
+def mcp_tools(command: str) -> MCPTools:
+    """指定コマンドで起動する MCP サーバーの MCPTools を作成する."""
+    return MCPTools(server_params=_server_params(command))
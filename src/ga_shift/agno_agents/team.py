@@ -12,6 +12,7 @@ Agno Memory を有効にすると、事業所設定を永続化してセッシ
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 
 from agno.agent import Agent
@@ -34,69 +35,11 @@ from ga_shift.agno_agents.simulation import create_simulation_agent
 _DEFAULT_MEMORY_DB = "data/ga_shift_memory.db"
 
 
-def create_shift_team(
-    mcp_server_command: str | None = None,
-    enable_memory: bool = False,
-    memory_db_path: str | None = None,
-    enable_neo4j: bool = False,
-    neo4j_mcp_command: str | None = None,
-    enable_ops: bool = False,
-    enable_extended: bool = False,
-) -> Team:
-    """シフト最適化チームを作成する。
-
-    Args:
-        mcp_server_command: MCPサーバーの起動コマンド。
-        enable_memory: Agno Memoryを有効にするか。
-        memory_db_path: メモリDBのパス（enable_memory=Trueの場合）。
-        enable_neo4j: Neo4jブリッジAgentを追加するか。
-        neo4j_mcp_command: Neo4j MCPサーバーの起動コマンド。
-        enable_ops: 運用支援Agent群を追加するか。
-        enable_extended: 拡張Agent群（レポート・シミュレーション）を追加するか。
-
-    Returns:
-        設定済みのAgno Team
-    """
-    hearing = create_hearing_agent(mcp_server_command)
-    optimizer = create_optimizer_agent(mcp_server_command)
-    adjuster = create_adjuster_agent(mcp_server_command)
-
-    # Optional: Neo4j Bridge Agent
-    members: list[Agent] = [hearing, optimizer, adjuster]
-    if enable_neo4j:
-        neo4j_bridge = create_neo4j_bridge_agent(
-            ga_mcp_command=mcp_server_command,
-            neo4j_mcp_command=neo4j_mcp_command,
-        )
-        members.append(neo4j_bridge)
-
-    # Optional: Operations Agents (Phase C)
-    if enable_ops:
-        monitoring = create_monitoring_agent(mcp_server_command)
-        compliance = create_compliance_agent(mcp_server_command)
-        handover = create_handover_agent(mcp_server_command)
-        members.extend([monitoring, compliance, handover])
-
-    # Optional: Extended Agents (Phase D)
-    if enable_extended:
-        report = create_report_agent(mcp_server_command)
-        simulation = create_simulation_agent(mcp_server_command)
-        members.extend([report, simulation])
-
-    # --- Memory configuration ---
-    db = None
-    if enable_memory:
-        try:
-            from agno.db.sqlite import SqliteDb
-
-            db_path = memory_db_path or _DEFAULT_MEMORY_DB
-            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
-            db = SqliteDb(db_file=db_path)
-        except ImportError:
-            # agno.db.sqlite が利用できない場合は Memory なしで続行
-            pass
-
-    # --- Build instructions ---
+@functools.lru_cache(maxsize=8)
+def _build_instructions(
+    enable_neo4j: bool, enable_ops: bool, enable_extended: bool
+) -> tuple[str, ...]:
+    """有効なメンバー構成に応じたリーダーの instructions を組み立てる（構成ごとにキャッシュ）."""
     base_instructions = [
         "あなたは福祉事業所の月次シフト作成を対話的に支援するチームのリーダーです。",
         "",
@@ -187,11 +130,76 @@ def create_shift_team(
         "- 専門用語は避け、やさしい日本語で対話してください",
     ])
 
+    return tuple(base_instructions)
+
+
+def create_shift_team(
+    mcp_server_command: str | None = None,
+    enable_memory: bool = False,
+    memory_db_path: str | None = None,
+    enable_neo4j: bool = False,
+    neo4j_mcp_command: str | None = None,
+    enable_ops: bool = False,
+    enable_extended: bool = False,
+) -> Team:
+    """シフト最適化チームを作成する。
+
+    Args:
+        mcp_server_command: MCPサーバーの起動コマンド。
+        enable_memory: Agno Memoryを有効にするか。
+        memory_db_path: メモリDBのパス（enable_memory=Trueの場合）。
+        enable_neo4j: Neo4jブリッジAgentを追加するか。
+        neo4j_mcp_command: Neo4j MCPサーバーの起動コマンド。
+        enable_ops: 運用支援Agent群を追加するか。
+        enable_extended: 拡張Agent群（レポート・シミュレーション）を追加するか。
+
+    Returns:
+        設定済みのAgno Team
+    """
+    hearing = create_hearing_agent(mcp_server_command)
+    optimizer = create_optimizer_agent(mcp_server_command)
+    adjuster = create_adjuster_agent(mcp_server_command)
+
+    # Optional: Neo4j Bridge Agent
+    members: list[Agent] = [hearing, optimizer, adjuster]
+    if enable_neo4j:
+        neo4j_bridge = create_neo4j_bridge_agent(
+            ga_mcp_command=mcp_server_command,
+            neo4j_mcp_command=neo4j_mcp_command,
+        )
+        members.append(neo4j_bridge)
+
+    # Optional: Operations Agents (Phase C)
+    if enable_ops:
+        monitoring = create_monitoring_agent(mcp_server_command)
+        compliance = create_compliance_agent(mcp_server_command)
+        handover = create_handover_agent(mcp_server_command)
+        members.extend([monitoring, compliance, handover])
+
+    # Optional: Extended Agents (Phase D)
+    if enable_extended:
+        report = create_report_agent(mcp_server_command)
+        simulation = create_simulation_agent(mcp_server_command)
+        members.extend([report, simulation])
+
+    # --- Memory configuration ---
+    db = None
+    if enable_memory:
+        try:
+            from agno.db.sqlite import SqliteDb
+
+            db_path = memory_db_path or _DEFAULT_MEMORY_DB
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            db = SqliteDb(db_file=db_path)
+        except ImportError:
+            # agno.db.sqlite が利用できない場合は Memory なしで続行
+            pass
+
     team = Team(
         name="シフト最適化チーム",
         members=members,
         model=Claude(id="claude-sonnet-4-5-20250929"),
-        instructions=base_instructions,
+        instructions=list(_build_instructions(enable_neo4j, enable_ops, enable_extended)),
         markdown=True,
         # --- Memory ---
         **({"db": db, "enable_user_memories": True} if db else {}),
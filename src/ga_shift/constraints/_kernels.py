@@ -0,0 +1,83 @@
+"""Numeric kernels shared by constraint templates.
+
+When numba is installed (``pip install ga-shift[fast]``) the kernels are
+JIT-compiled with ``@njit(cache=True)``; ``consecutive_work_overrun`` is also
+``parallel=True`` (``prange`` over employees). Without numba an equivalent
+NumPy implementation is used. ``warmup`` also compiles the models-layer
+``workers_per_day`` kernel (``ga_shift.models._kernels``).
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ga_shift.models._kernels import workers_per_day
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional
+    njit = None
+    prange = range
+
+HAS_NUMBA = njit is not None
+
+
+def work_runs(binary: NDArray[np.int8]) -> tuple[NDArray[np.intp], NDArray[np.intp]]:
+    """Employee index and length of every maximal run of work days (binary == 0).
+
+    Runs are returned in row-major order: by employee, then by start day.
+    """
+    num_employees, num_days = binary.shape
+    padded = np.zeros((num_employees, num_days + 2), dtype=np.int8)
+    padded[:, 1:-1] = binary == 0
+    edges = np.diff(padded, axis=1)
+    # Row-major order keeps starts and ends paired run by run.
+    starts = np.argwhere(edges == 1)
+    ends = np.argwhere(edges == -1)
+    return starts[:, 0], ends[:, 1] - starts[:, 1]
+
+
+def _consecutive_work_overrun_numpy(binary: NDArray[np.int8], max_days: int) -> NDArray[np.int64]:
+    """Per-employee sum of days by which each work run exceeds ``max_days``."""
+    rows, lengths = work_runs(binary)
+    over = np.maximum(lengths - max_days, 0)
+    return np.bincount(rows, weights=over, minlength=binary.shape[0]).astype(np.int64)
+
+
+def _consecutive_work_overrun_loop(binary: NDArray[np.int8], max_days: int) -> NDArray[np.int64]:
+    num_employees, num_days = binary.shape
+    out = np.zeros(num_employees, dtype=np.int64)
+    for i in prange(num_employees):
+        run = 0
+        over = 0
+        for j in range(num_days):
+            if binary[i, j] == 0:
+                run += 1
+            else:
+                if run > max_days:
+                    over += run - max_days
+                run = 0
+        if run > max_days:
+            over += run - max_days
+        out[i] = over
+    return out
+
+
+if HAS_NUMBA:
+    consecutive_work_overrun = njit(cache=True, parallel=True)(_consecutive_work_overrun_loop)
+else:
+    consecutive_work_overrun = _consecutive_work_overrun_numpy
+
+
+def warmup() -> None:
+    """Compile (or load from numba's on-disk cache) every kernel for int8 input.
+
+    A no-op without numba. Calling it once up front keeps JIT latency out of
+    the first fitness evaluation.
+    """
+    if not HAS_NUMBA:
+        return
+    binary = np.zeros((1, 1), dtype=np.int8)
+    consecutive_work_overrun(binary, 1)
+    workers_per_day(binary)
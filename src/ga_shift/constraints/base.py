@@ -3,25 +3,102 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any, Callable, Protocol
 
+import numpy as np
+from numpy.typing import NDArray
+
 from ga_shift.models.constraint import ParameterDef
 from ga_shift.models.schedule import ScheduleContext
 
 
 class PenaltyResult:
-    """Result of a penalty function evaluation."""
+    """Result of a penalty function evaluation.
+
+    Row-decomposable constraints may also keep their per-employee penalties and
+    details so that a later delta evaluation can recompute only changed rows.
 
-    __slots__ = ("penalty", "details")
+    ``details`` may be given as a zero-argument callable; it is then formatted
+    only when first read, which the GA's fitness loop never does.
+    """
 
-    def __init__(self, penalty: float = 0.0, details: str = "") -> None:
+    __slots__ = ("penalty", "_details", "row_penalties", "row_details")
+
+    def __init__(
+        self,
+        penalty: float = 0.0,
+        details: str | Callable[[], str] = "",
+        row_penalties: NDArray[np.float64] | None = None,
+        row_details: list[str] | None = None,
+    ) -> None:
         self.penalty = penalty
-        self.details = details
+        self._details = details
+        self.row_penalties = row_penalties
+        self.row_details = row_details
+
+    @property
+    def details(self) -> str:
+        if callable(self._details):
+            self._details = self._details()
+        return self._details
+
+    @details.setter
+    def details(self, value: str | Callable[[], str]) -> None:
+        self._details = value
 
 
 # Type alias for compiled penalty functions
 PenaltyFunction = Callable[[ScheduleContext], PenaltyResult]
+# Delta penalty function: (ctx with changed_cells, previous result) -> new result
+DeltaFunction = Callable[[ScheduleContext, PenaltyResult], PenaltyResult]
+# Row-decomposable penalty over a set of employees:
+# (binary schedule, employee indices or None for all) -> (penalty per row, details per row)
+RowsPenaltyFunction = Callable[
+    [NDArray[np.int8], Sequence[int] | None], tuple[NDArray[np.float64], list[str]]
+]
+
+
+def _rows_result(row_penalties: NDArray[np.float64], row_details: list[str]) -> PenaltyResult:
+    return PenaltyResult(
+        penalty=float(row_penalties.sum()),
+        details="; ".join(d for d in row_details if d),
+        row_penalties=row_penalties,
+        row_details=row_details,
+    )
+
+
+def rowwise_penalty(ctx: ScheduleContext, rows_fn: RowsPenaltyFunction) -> PenaltyResult:
+    """Evaluate a row-decomposable constraint over every employee in one call."""
+    row_penalties, row_details = rows_fn(ctx.binary_schedule, None)
+    return _rows_result(np.asarray(row_penalties, dtype=np.float64), list(row_details))
+
+
+def rowwise_delta(
+    ctx: ScheduleContext, prev_result: PenaltyResult, rows_fn: RowsPenaltyFunction
+) -> PenaltyResult:
+    """Re-evaluate only the employees touched by ``ctx.changed_cells``, in one call.
+
+    Falls back to a full evaluation when the previous result carries no
+    per-row cache or no changed cells are known.
+    """
+    if (
+        ctx.changed_cells is None
+        or prev_result.row_penalties is None
+        or prev_result.row_details is None
+    ):
+        return rowwise_penalty(ctx, rows_fn)
+
+    rows = sorted({i for i, _ in ctx.changed_cells})
+    row_penalties = prev_result.row_penalties.copy()
+    row_details = list(prev_result.row_details)
+    if rows:
+        penalties, details = rows_fn(ctx.binary_schedule, rows)
+        row_penalties[rows] = penalties
+        for emp_idx, text in zip(rows, details):
+            row_details[emp_idx] = text
+    return _rows_result(row_penalties, row_details)
 
 
 class ConstraintTemplate(ABC):
@@ -62,6 +139,14 @@ class ConstraintTemplate(ABC):
     def compile(self, params: dict[str, Any]) -> PenaltyFunction:
         """Compile this template with given parameters into a penalty function."""
 
+    def compile_delta(self, params: dict[str, Any]) -> DeltaFunction | None:
+        """Compile an incremental penalty function, if this template supports one.
+
+        Returns None by default, meaning delta evaluation falls back to the
+        full penalty function.
+        """
+        return None
+
 
 @dataclass
 class CompiledConstraint:
@@ -71,3 +156,19 @@ class CompiledConstraint:
     name_ja: str
     penalty_fn: PenaltyFunction
     parameters: dict[str, Any]
+    delta_fn: DeltaFunction | None = None
+
+    def evaluate_delta(self, ctx: ScheduleContext, prev_result: PenaltyResult) -> PenaltyResult:
+        """Evaluate ``ctx`` given the result for ``ctx.prev_schedule``.
+
+        An empty ``ctx.changed_cells`` reuses ``prev_result``; otherwise the
+        template's delta function is used when available, and the full
+        penalty function when it is not or the changed cells are unknown.
+        """
+        if ctx.changed_cells is None:
+            return self.penalty_fn(ctx)
+        if not ctx.changed_cells:
+            return prev_result
+        if self.delta_fn is None:
+            return self.penalty_fn(ctx)
+        return self.delta_fn(ctx, prev_result)
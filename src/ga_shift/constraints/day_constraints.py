@@ -51,23 +51,15 @@ class RequiredWorkersMatch(ConstraintTemplate):
         penalty_per_diff = float(params["penalty_per_diff"])
 
         def penalty_fn(ctx: ScheduleContext) -> PenaltyResult:
-            binary = ctx.binary_schedule
             required = ctx.shift_input.required_workers
-            total_penalty = 0.0
-            details_parts: list[str] = []
-
-            for day_idx in range(ctx.num_days):
-                col = binary[:, day_idx]
-                holiday_count = int(np.sum(col))
-                workers = ctx.num_employees - holiday_count
-                diff = abs(workers - int(required[day_idx]))
-                if diff > 0:
-                    p = diff * penalty_per_diff
-                    total_penalty += p
-                    details_parts.append(
-                        f"{day_idx+1}日: {workers}人(必要{required[day_idx]}人)"
-                    )
-
+            workers = ctx.workers_per_day
+            diff = np.abs(workers - required)
+            off_days = np.flatnonzero(diff)
+            details_parts = [
+                f"{day_idx+1}日: {workers[day_idx]}人(必要{required[day_idx]}人)"
+                for day_idx in off_days
+            ]
+            total_penalty = float(diff.sum()) * penalty_per_diff
             return PenaltyResult(penalty=total_penalty, details="; ".join(details_parts))
 
         return penalty_fn
@@ -129,12 +121,12 @@ class MinWorkersOnDate(ConstraintTemplate):
         def penalty_fn(ctx: ScheduleContext) -> PenaltyResult:
             if not target_days:
                 return PenaltyResult()
-            binary = ctx.binary_schedule
+            workers_per_day = ctx.workers_per_day
             total_penalty = 0.0
             for day_1indexed in target_days:
                 day_idx = day_1indexed - 1
                 if 0 <= day_idx < ctx.num_days:
-                    workers = ctx.num_employees - int(np.sum(binary[:, day_idx]))
+                    workers = int(workers_per_day[day_idx])
                     if workers < min_workers:
                         total_penalty += (min_workers - workers) * penalty_per
             return PenaltyResult(penalty=total_penalty)
@@ -198,12 +190,12 @@ class MaxWorkersOnDate(ConstraintTemplate):
         def penalty_fn(ctx: ScheduleContext) -> PenaltyResult:
             if not target_days:
                 return PenaltyResult()
-            binary = ctx.binary_schedule
+            workers_per_day = ctx.workers_per_day
             total_penalty = 0.0
             for day_1indexed in target_days:
                 day_idx = day_1indexed - 1
                 if 0 <= day_idx < ctx.num_days:
-                    workers = ctx.num_employees - int(np.sum(binary[:, day_idx]))
+                    workers = int(workers_per_day[day_idx])
                     if workers > max_workers:
                         total_penalty += (workers - max_workers) * penalty_per
             return PenaltyResult(penalty=total_penalty)
@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Any
 
 import numpy as np
 
-from ga_shift.constraints.base import ConstraintTemplate, PenaltyFunction, PenaltyResult
+from ga_shift.constraints._kernels import consecutive_work_overrun
+from ga_shift.constraints.base import (
+    ConstraintTemplate,
+    DeltaFunction,
+    PenaltyFunction,
+    PenaltyResult,
+    RowsPenaltyFunction,
+    rowwise_delta,
+    rowwise_penalty,
+)
 from ga_shift.models.constraint import ParameterDef, ParameterType
 from ga_shift.models.schedule import ScheduleContext
 
@@ -51,38 +61,56 @@ class MaxConsecutiveWork(ConstraintTemplate):
             ),
         ]
 
-    def compile(self, params: dict[str, Any]) -> PenaltyFunction:
+    @staticmethod
+    def _row_details(emp_idx: int, row: np.ndarray, max_days: int) -> str:
+        """Details for one row; only called for rows the kernel found to overrun."""
+        details_parts: list[str] = []
+        consecutive = 0
+        for value in row:
+            if value == 0:  # work
+                consecutive += 1
+            else:
+                if consecutive > max_days:
+                    details_parts.append(f"社員{emp_idx}: {consecutive}連勤(上限{max_days})")
+                consecutive = 0
+        return "; ".join(details_parts)
+
+    def _evaluate_rows(self, params: dict[str, Any]) -> RowsPenaltyFunction:
+        """Penalties and details for the given employee rows (None = all), one kernel call."""
         max_days = int(params["max_days"])
         penalty_per_day = float(params["penalty_per_day"])
 
-        def penalty_fn(ctx: ScheduleContext) -> PenaltyResult:
-            binary = ctx.binary_schedule
-            total_penalty = 0.0
-            details_parts: list[str] = []
+        def evaluate(
+            binary: np.ndarray, emp_indices: Sequence[int] | None
+        ) -> tuple[np.ndarray, list[str]]:
+            if emp_indices is None:
+                rows, emp_indices = binary, range(len(binary))
+            else:
+                rows = binary[emp_indices]
+            overrun = consecutive_work_overrun(rows, max_days)
+            details = [""] * len(rows)
+            for i in np.flatnonzero(overrun):
+                details[i] = self._row_details(emp_indices[i], rows[i], max_days)
+            return overrun * penalty_per_day, details
+
+        return evaluate
 
-            for emp_idx in range(ctx.num_employees):
-                row = binary[emp_idx]
-                consecutive = 0
-                for day_idx in range(ctx.num_days):
-                    if row[day_idx] == 0:  # work
-                        consecutive += 1
-                    else:
-                        if consecutive > max_days:
-                            over = consecutive - max_days
-                            p = over * penalty_per_day
-                            total_penalty += p
-                            details_parts.append(
-                                f"社員{emp_idx}: {consecutive}連勤(上限{max_days})"
-                            )
-                        consecutive = 0
-                if consecutive > max_days:
-                    over = consecutive - max_days
-                    total_penalty += over * penalty_per_day
+    def compile(self, params: dict[str, Any]) -> PenaltyFunction:
+        evaluate = self._evaluate_rows(params)
 
-            return PenaltyResult(penalty=total_penalty, details="; ".join(details_parts))
+        def penalty_fn(ctx: ScheduleContext) -> PenaltyResult:
+            return rowwise_penalty(ctx, evaluate)
 
         return penalty_fn
 
+    def compile_delta(self, params: dict[str, Any]) -> DeltaFunction:
+        evaluate = self._evaluate_rows(params)
+
+        def delta_fn(ctx: ScheduleContext, prev_result: PenaltyResult) -> PenaltyResult:
+            return rowwise_delta(ctx, prev_result, evaluate)
+
+        return delta_fn
+
 
 class WeekendRest(ConstraintTemplate):
     """Ensure employees get some weekends off."""
@@ -130,23 +158,13 @@ class WeekendRest(ConstraintTemplate):
         penalty_per = float(params["penalty_per_missing"])
 
         def penalty_fn(ctx: ScheduleContext) -> PenaltyResult:
-            binary = ctx.binary_schedule
-            weekdays = ctx.shift_input.weekdays
-            total_penalty = 0.0
-
-            # Find weekend day indices (Sat=5, Sun=6)
-            weekend_indices = [d for d, w in enumerate(weekdays) if w in (5, 6)]
-            if not weekend_indices:
+            is_weekend = ctx.shift_input.is_weekend
+            if not is_weekend.any():
                 return PenaltyResult()
 
-            for emp_idx in range(ctx.num_employees):
-                row = binary[emp_idx]
-                weekend_offs = sum(1 for d in weekend_indices if row[d] == 1)
-                if weekend_offs < min_offs:
-                    shortfall = min_offs - weekend_offs
-                    total_penalty += shortfall * penalty_per
-
-            return PenaltyResult(penalty=total_penalty)
+            weekend_offs = (ctx.binary_schedule[:, is_weekend] == 1).sum(axis=1)
+            shortfall = np.maximum(min_offs - weekend_offs, 0)
+            return PenaltyResult(penalty=float(shortfall.sum()) * penalty_per)
 
         return penalty_fn
 
@@ -57,18 +57,12 @@ class EqualWeekendDistribution(ConstraintTemplate):
         penalty_per = float(params["penalty_per_excess"])
 
         def penalty_fn(ctx: ScheduleContext) -> PenaltyResult:
-            binary = ctx.binary_schedule
-            weekdays = ctx.shift_input.weekdays
-            weekend_indices = [d for d, w in enumerate(weekdays) if w in (5, 6)]
-            if not weekend_indices:
+            is_weekend = ctx.shift_input.is_weekend
+            if not is_weekend.any():
                 return PenaltyResult()
 
-            weekend_offs = []
-            for emp_idx in range(ctx.num_employees):
-                count = sum(1 for d in weekend_indices if binary[emp_idx, d] == 1)
-                weekend_offs.append(count)
-
-            actual_diff = max(weekend_offs) - min(weekend_offs)
+            weekend_offs = (ctx.binary_schedule[:, is_weekend] == 1).sum(axis=1)
+            actual_diff = int(weekend_offs.max() - weekend_offs.min())
             if actual_diff > max_diff:
                 penalty = (actual_diff - max_diff) * penalty_per
                 return PenaltyResult(
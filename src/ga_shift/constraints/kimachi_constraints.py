@@ -16,10 +16,19 @@ import numpy as np
 
 from ga_shift.constraints.base import ConstraintTemplate, PenaltyFunction, PenaltyResult
 from ga_shift.models.constraint import ParameterDef, ParameterType
-from ga_shift.models.employee import EmployeeType, Section
+from ga_shift.models.employee import EMPLOYEE_TYPE_CODES, EmployeeType, Section
 from ga_shift.models.schedule import ScheduleContext
 
 
+def _parse_int_list(value: Any) -> tuple[int, ...]:
+    """Parse a comma-separated string of ints ("5,6"), a single int, or a sequence of ints."""
+    if isinstance(value, (int, np.integer)):
+        return (int(value),)
+    if isinstance(value, str):
+        return tuple(int(x) for x in value.split(",") if x.strip())
+    return tuple(int(x) for x in value)
+
+
 class KitchenMinWorkers(ConstraintTemplate):
     """Ensure minimum kitchen workers per day.
 
@@ -158,36 +167,22 @@ class SubstituteConstraint(ConstraintTemplate):
         penalty_weight = float(params["penalty_weight"])
 
         def penalty_fn(ctx: ScheduleContext) -> PenaltyResult:
-            # Find primary and substitute employee indices
-            primary_idx = None
-            sub_idx = None
-            for emp in ctx.shift_input.employees:
-                if emp.name == primary_name:
-                    primary_idx = emp.index
-                if emp.name == substitute_name:
-                    sub_idx = emp.index
-
+            index_by_name = ctx.shift_input.employee_index_by_name
+            primary_idx = index_by_name.get(primary_name)
+            sub_idx = index_by_name.get(substitute_name)
             if primary_idx is None or sub_idx is None:
                 return PenaltyResult()
 
             binary = ctx.binary_schedule
-            total_penalty = 0.0
-            details_parts: list[str] = []
-
-            for day_idx in range(ctx.num_days):
-                # Primary is absent (holiday/preferred off/unavailable)
-                primary_absent = binary[primary_idx, day_idx] != 0
-                # Substitute is also absent
-                sub_absent = binary[sub_idx, day_idx] != 0
-
-                if primary_absent and sub_absent:
-                    total_penalty += penalty_weight
-                    details_parts.append(
-                        f"{day_idx+1}日: {primary_name}不在で{substitute_name}も休み"
-                    )
-
+            # Primary absent (holiday/preferred off/unavailable) and substitute absent too
+            both_absent = (binary[primary_idx] != 0) & (binary[sub_idx] != 0)
+            violation_days = np.flatnonzero(both_absent)
+            details_parts = [
+                f"{day_idx+1}日: {primary_name}不在で{substitute_name}も休み"
+                for day_idx in violation_days.tolist()
+            ]
             return PenaltyResult(
-                penalty=total_penalty, details="; ".join(details_parts)
+                penalty=len(violation_days) * penalty_weight, details="; ".join(details_parts)
             )
 
         return penalty_fn
@@ -297,25 +292,19 @@ class UnavailableDayHard(ConstraintTemplate):
         penalty_per = float(params["penalty_per_violation"])
 
         def penalty_fn(ctx: ScheduleContext) -> PenaltyResult:
-            total_penalty = 0.0
-            details_parts: list[str] = []
-
-            base = ctx.shift_input.base_schedule
-            schedule = ctx.schedule
-
-            for emp in ctx.shift_input.employees:
-                for day_idx in emp.unavailable_days:
-                    d = day_idx - 1  # Convert 1-indexed to 0-indexed
-                    if 0 <= d < ctx.num_days:
-                        # Check if originally unavailable (3) but now set to work (0)
-                        if base[emp.index, d] == 3 and schedule[emp.index, d] == 0:
-                            total_penalty += penalty_per
-                            details_parts.append(
-                                f"{emp.name}: {day_idx}日が出勤不可なのに出勤"
-                            )
+            si = ctx.shift_input
+            # Originally unavailable (3) but now set to work (0)
+            violated = si.unavailable_mask & (si.base_schedule == 3) & (ctx.schedule == 0)
+            violations = np.argwhere(violated)
+            if len(violations) == 0:
+                return PenaltyResult()
 
+            details_parts = [
+                f"{si.employee_names[e]}: {d + 1}日が出勤不可なのに出勤"
+                for e, d in violations
+            ]
             return PenaltyResult(
-                penalty=total_penalty, details="; ".join(details_parts)
+                penalty=len(violations) * penalty_per, details="; ".join(details_parts)
             )
 
         return penalty_fn
@@ -394,81 +383,51 @@ class ClosedDayConstraint(ConstraintTemplate):
         ]
 
     def compile(self, params: dict[str, Any]) -> PenaltyFunction:
-        # Parse closed weekdays (e.g. "5,6" → [5, 6])
-        closed_str = str(params.get("closed_weekdays", "5,6")).strip()
-        closed_weekdays: list[int] = []
-        if closed_str:
-            closed_weekdays = [
-                int(x.strip()) for x in closed_str.split(",") if x.strip()
-            ]
-
-        # Parse override open days (e.g. "8,15" → [8, 15])
-        override_str = str(params.get("override_open_days", "")).strip()
-        override_days_1indexed: set[int] = set()
-        if override_str:
-            override_days_1indexed = {
-                int(x.strip()) for x in override_str.split(",") if x.strip()
-            }
+        # Comma-separated strings (e.g. "5,6") or sequences of ints (e.g. (5, 6))
+        closed_weekdays = _parse_int_list(params.get("closed_weekdays", "5,6"))
+        override_days_1indexed = set(_parse_int_list(params.get("override_open_days", "")))
 
         penalty_closed = float(params["penalty_closed_day"])
         penalty_parttime = float(params["penalty_parttime_override"])
 
+        closed_weekdays_arr = np.array(closed_weekdays, dtype=np.int8)
+        # Convert override days from 1-indexed to 0-indexed
+        override_days_0indexed = np.array(sorted(override_days_1indexed), dtype=np.intp) - 1
+
         def penalty_fn(ctx: ScheduleContext) -> PenaltyResult:
-            weekdays = ctx.shift_input.weekdays
-            if not weekdays or not closed_weekdays:
+            si = ctx.shift_input
+            # Closed day indices (0-based) in the schedule; unknown weekdays (-1) never match
+            closed_days = np.flatnonzero(np.isin(si.weekday_arr, closed_weekdays_arr))
+            if len(closed_days) == 0:
                 return PenaltyResult()
 
-            # Find closed day indices (0-based) in the schedule
-            closed_day_indices = [
-                d for d, w in enumerate(weekdays) if w in closed_weekdays
-            ]
-            if not closed_day_indices:
+            is_override = np.isin(closed_days, override_days_0indexed)
+            is_part_time = si.employee_type_arr == EMPLOYEE_TYPE_CODES[EmployeeType.PART_TIME]
+            # (closed day, employee): working on a closed day
+            working = ctx.binary_schedule[:, closed_days].T == 0
+            # 通常の定休日: 誰も出勤してはいけない
+            hard = working & ~is_override[:, None]
+            # 臨時営業日: 正規職員は OK、パートはペナルティ
+            soft = working & is_override[:, None] & is_part_time[None, :]
+            violating = hard | soft
+            if not violating.any():
                 return PenaltyResult()
 
-            # Convert override days from 1-indexed to 0-indexed
-            override_set_0indexed = {d - 1 for d in override_days_1indexed}
-
-            # Build employee type lookup
-            emp_types: dict[int, EmployeeType] = {}
-            for emp in ctx.shift_input.employees:
-                emp_types[emp.index] = emp.employee_type
-
-            binary = ctx.binary_schedule
-            total_penalty = 0.0
-            details_parts: list[str] = []
-
-            for day_idx in closed_day_indices:
-                is_override = day_idx in override_set_0indexed
-                day_num = day_idx + 1  # 1-indexed for display
-
-                for emp_idx in range(ctx.num_employees):
-                    if binary[emp_idx, day_idx] == 0:  # working
-                        if is_override:
-                            # 臨時営業日: 正規職員は OK、パートはペナルティ
-                            emp_type = emp_types.get(
-                                emp_idx, EmployeeType.FULL_TIME
-                            )
-                            if emp_type == EmployeeType.PART_TIME:
-                                total_penalty += penalty_parttime
-                                emp_name = (
-                                    ctx.shift_input.employee_names[emp_idx]
-                                )
-                                details_parts.append(
-                                    f"{day_num}日(臨時営業): "
-                                    f"{emp_name}(パート)は出勤不可"
-                                )
-                        else:
-                            # 通常の定休日: 誰も出勤してはいけない
-                            total_penalty += penalty_closed
-                            emp_name = (
-                                ctx.shift_input.employee_names[emp_idx]
-                            )
-                            details_parts.append(
-                                f"{day_num}日(定休日): {emp_name}が出勤"
-                            )
-
-            return PenaltyResult(
-                penalty=total_penalty, details="; ".join(details_parts)
-            )
+            total_penalty = int(hard.sum()) * penalty_closed + int(soft.sum()) * penalty_parttime
+            # Day-major like the schedule display; formatted only if details are read
+            violations = np.argwhere(violating)
+
+            def format_details() -> str:
+                names = si.employee_names
+                parts: list[str] = []
+                for c, emp_idx in violations.tolist():
+                    day_num = int(closed_days[c]) + 1  # 1-indexed for display
+                    if is_override[c]:
+                        parts.append(f"{day_num}日(臨時営業): {names[emp_idx]}(パート)は出勤不可")
+                    else:
+                        parts.append(f"{day_num}日(定休日): {names[emp_idx]}が出勤")
+                return "; ".join(parts)
+
+            return PenaltyResult(penalty=total_penalty, details=format_details)
 
         return penalty_fn
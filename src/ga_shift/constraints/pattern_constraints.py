@@ -6,6 +6,7 @@ from typing import Any
 
 import numpy as np
 
+from ga_shift.constraints._kernels import work_runs
 from ga_shift.constraints.base import ConstraintTemplate, PenaltyFunction, PenaltyResult
 from ga_shift.models.constraint import ParameterDef, ParameterType
 from ga_shift.models.schedule import ScheduleContext
@@ -62,31 +63,21 @@ class AvoidLongConsecutiveWork(ConstraintTemplate):
         weight = float(params["penalty_weight"])
 
         def penalty_fn(ctx: ScheduleContext) -> PenaltyResult:
-            binary = ctx.binary_schedule  # 1=holiday, 0=work
-            total_penalty = 0.0
-            details_parts: list[str] = []
-
-            for emp_idx in range(ctx.num_employees):
-                row = binary[emp_idx]
-                consecutive = 0
-                for day_idx in range(ctx.num_days):
-                    if row[day_idx] == 0:  # work
-                        consecutive += 1
-                    else:
-                        if consecutive >= threshold:
-                            p = ((consecutive - (threshold - 1)) ** 2) * weight
-                            total_penalty += p
-                            details_parts.append(
-                                f"社員{emp_idx}: {consecutive}連勤 (penalty={p:.1f})"
-                            )
-                        consecutive = 0
-                # Check tail
-                if consecutive >= threshold:
-                    p = ((consecutive - (threshold - 1)) ** 2) * weight
-                    total_penalty += p
-                    details_parts.append(
-                        f"社員{emp_idx}: {consecutive}連勤 (penalty={p:.1f})"
-                    )
+            emp_indices, lengths = work_runs(ctx.binary_schedule)
+            long_runs = lengths >= threshold
+            if not long_runs.any():
+                return PenaltyResult()
+
+            emp_indices = emp_indices[long_runs]
+            lengths = lengths[long_runs]
+            penalties = ((lengths - (threshold - 1)) ** 2) * weight
+            details_parts = [
+                f"社員{emp_idx}: {length}連勤 (penalty={p:.1f})"
+                for emp_idx, length, p in zip(
+                    emp_indices.tolist(), lengths.tolist(), penalties.tolist()
+                )
+            ]
+            total_penalty = float(penalties.sum())
 
             return PenaltyResult(penalty=total_penalty, details="; ".join(details_parts))
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cached_property
 from typing import Any
 
 from ga_shift.constraints.base import CompiledConstraint, ConstraintTemplate
@@ -16,6 +17,8 @@ class ConstraintRegistry:
 
     def register(self, template: ConstraintTemplate) -> None:
         self._templates[template.template_id] = template
+        # Invalidate the cached category index
+        self.__dict__.pop("by_category", None)
 
     def get(self, template_id: str) -> ConstraintTemplate:
         if template_id not in self._templates:
@@ -28,8 +31,16 @@ class ConstraintRegistry:
     def list_all(self) -> list[ConstraintTemplate]:
         return list(self._templates.values())
 
+    @cached_property
+    def by_category(self) -> dict[str, tuple[ConstraintTemplate, ...]]:
+        """Templates grouped by category, in registration order. Rebuilt after register()."""
+        grouped: dict[str, list[ConstraintTemplate]] = {}
+        for t in self._templates.values():
+            grouped.setdefault(t.category, []).append(t)
+        return {category: tuple(ts) for category, ts in grouped.items()}
+
     def list_by_category(self, category: str) -> list[ConstraintTemplate]:
-        return [t for t in self._templates.values() if t.category == category]
+        return list(self.by_category.get(category, ()))
 
     def compile_config(self, config: ConstraintConfig) -> CompiledConstraint:
         """Compile a single constraint config into an executable constraint."""
@@ -44,6 +55,7 @@ class ConstraintRegistry:
             name_ja=template.name_ja,
             penalty_fn=penalty_fn,
             parameters=merged,
+            delta_fn=template.compile_delta(merged),
         )
 
     def compile_set(self, constraint_set: ConstraintSet) -> list[CompiledConstraint]:
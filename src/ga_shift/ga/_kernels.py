@@ -0,0 +1,81 @@
+"""Numeric kernels for the GA operators.
+
+Like ``ga_shift.constraints._kernels``: JIT-compiled with ``@njit(cache=True)``
+when numba is installed, an equivalent NumPy implementation otherwise. Both
+paths consume the same pre-drawn random keys, so they give identical results.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import NDArray
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
+HAS_NUMBA = njit is not None
+
+
+def _fix_holidays_numpy(
+    schedule: NDArray[np.int8], targets: NDArray[np.int64], keys: NDArray[np.float64]
+) -> None:
+    """Flip 0/1 cells in place so each row has ``targets[i]`` non-work days.
+
+    Rows with a negative target are left alone. Within a row, the cells to
+    flip are the candidates (1s when there are too many holidays, 0s when
+    there are too few) with the smallest ``keys``; if there are not enough
+    candidates, all of them are flipped. Codes 2 and 3 are never touched.
+    """
+    diff = np.count_nonzero(schedule, axis=1) - targets
+    diff[targets < 0] = 0
+    need = np.abs(diff)
+    candidate_code = (diff > 0).astype(schedule.dtype)
+    candidates = (schedule == candidate_code[:, None]) & (need > 0)[:, None]
+
+    # Rank candidates by key within each row; non-candidates sort last.
+    order = np.argsort(np.where(candidates, keys, np.inf), axis=1, kind="stable")
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(schedule.shape[1])[None, :], axis=1)
+    flip = candidates & (ranks < need[:, None])
+    schedule[flip] = 1 - schedule[flip]
+
+
+def _fix_holidays_loop(
+    schedule: NDArray[np.int8], targets: NDArray[np.int64], keys: NDArray[np.float64]
+) -> None:
+    """Loop form of ``_fix_holidays_numpy``, compiled by numba."""
+    num_rows, num_days = schedule.shape
+    candidates = np.empty(num_days, dtype=np.int64)
+    for i in range(num_rows):
+        if targets[i] < 0:
+            continue
+        nonwork = 0
+        for j in range(num_days):
+            if schedule[i, j] != 0:
+                nonwork += 1
+        diff = nonwork - targets[i]
+        if diff == 0:
+            continue
+        code = 1 if diff > 0 else 0
+        need = diff if diff > 0 else -diff
+
+        n = 0
+        for j in range(num_days):
+            if schedule[i, j] == code:
+                candidates[n] = j
+                n += 1
+        if n > need:
+            chosen = candidates[:n][np.argsort(keys[i, candidates[:n]], kind="mergesort")[:need]]
+        else:
+            chosen = candidates[:n]
+        for j in chosen:
+            schedule[i, j] = 1 - code
+
+
+if HAS_NUMBA:
+    # Rows are independent, but a schedule is too small to benefit from threads.
+    fix_holidays = njit(cache=True)(_fix_holidays_loop)
+else:
+    fix_holidays = _fix_holidays_numpy
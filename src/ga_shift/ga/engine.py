@@ -34,25 +34,28 @@ class GARunner:
         constraints: list[CompiledConstraint],
         config: GAConfig | None = None,
         progress_callback: ProgressCallback | None = None,
+        rng: np.random.Generator | None = None,
     ) -> None:
         self.shift_input = shift_input
         self.constraints = constraints
         self.config = config or GAConfig()
         self.progress_callback = progress_callback
+        self.rng = rng if rng is not None else np.random.default_rng()
 
     def run(self) -> ShiftResult:
         cfg = self.config
         si = self.shift_input
+        rng = self.rng
 
         # 1. Generate initial population
-        population: list[tuple[float, NDArray[np.int_]]] = []
+        population: list[tuple[float, NDArray[np.int8]]] = []
         for _ in range(cfg.initial_population):
-            ind = create_individual(si)
-            ind = holiday_fix(ind, si)
+            ind = create_individual(si, rng)
+            ind = holiday_fix(ind, si, rng)
             score, _ = evaluate_with_constraints(ind, si, self.constraints)
             population.append((score, ind))
 
-        top: tuple[float, NDArray[np.int_]] | None = None
+        top: tuple[float, NDArray[np.int8]] | None = None
         history: list[float] = []
 
         # 2. Generation loop
@@ -77,17 +80,19 @@ class GARunner:
             if self.progress_callback:
                 self.progress_callback(gen + 1, population[0][0], top[0])
 
-            # Crossover: all combinations of elite pairs
-            children: list[tuple[float, NDArray[np.int_]]] = []
-            for k1, k2 in itertools.combinations(range(len(population)), 2):
-                p1 = population[k1][1]
-                p2 = population[k2][1]
-
-                ch1, ch2 = crossover_uniform(p1, p2, cfg.crossover_rate)
-                ch1 = mutation(ch1, cfg.mutation_rate, cfg.mutation_gene_ratio)
-                ch2 = mutation(ch2, cfg.mutation_rate, cfg.mutation_gene_ratio)
-                ch1 = holiday_fix(ch1, si)
-                ch2 = holiday_fix(ch2, si)
+            # Crossover: all combinations of elite pairs, stacked into one batch
+            schedules = np.stack([ind for _, ind in population])
+            first, second = np.array(list(itertools.combinations(range(len(population)), 2))).T
+            batch1, batch2 = crossover_uniform(
+                schedules[first], schedules[second], cfg.crossover_rate, rng
+            )
+
+            children: list[tuple[float, NDArray[np.int8]]] = []
+            for ch1, ch2 in zip(batch1, batch2):
+                ch1 = mutation(ch1, cfg.mutation_rate, cfg.mutation_gene_ratio, rng)
+                ch2 = mutation(ch2, cfg.mutation_rate, cfg.mutation_gene_ratio, rng)
+                ch1 = holiday_fix(ch1, si, rng)
+                ch2 = holiday_fix(ch2, si, rng)
 
                 sc1, _ = evaluate_with_constraints(ch1, si, self.constraints)
                 sc2, _ = evaluate_with_constraints(ch2, si, self.constraints)
@@ -10,7 +10,7 @@ from ga_shift.models.schedule import ScheduleContext, ShiftInput
 
 
 def evaluate_with_constraints(
-    schedule: NDArray[np.int_],
+    schedule: NDArray[np.int8],
     shift_input: ShiftInput,
     constraints: list[CompiledConstraint],
 ) -> tuple[float, list[tuple[str, PenaltyResult]]]:
@@ -33,3 +33,35 @@ def evaluate_with_constraints(
     # Score is negative penalty (0 = best, more negative = worse)
     score = -total_penalty
     return score, results
+
+
+def evaluate_delta_with_constraints(
+    schedule: NDArray[np.int8],
+    shift_input: ShiftInput,
+    constraints: list[CompiledConstraint],
+    prev_schedule: NDArray[np.int8],
+    prev_results: list[tuple[str, PenaltyResult]],
+) -> tuple[float, list[tuple[str, PenaltyResult]]]:
+    """Evaluate ``schedule`` incrementally against the results for ``prev_schedule``.
+
+    Only the cells that differ from ``prev_schedule`` are handed to each
+    constraint's delta hook; constraints without one are fully re-evaluated.
+    ``prev_results`` must come from the same ``constraints`` list, in order.
+    """
+    changed = np.argwhere(schedule != prev_schedule)
+    ctx = ScheduleContext(
+        schedule=schedule,
+        shift_input=shift_input,
+        prev_schedule=prev_schedule,
+        changed_cells=[(int(i), int(j)) for i, j in changed],
+    )
+
+    total_penalty = 0.0
+    results: list[tuple[str, PenaltyResult]] = []
+
+    for constraint, (_, prev_result) in zip(constraints, prev_results):
+        result = constraint.evaluate_delta(ctx, prev_result)
+        total_penalty += result.penalty
+        results.append((constraint.template_id, result))
+
+    return -total_penalty, results
@@ -5,109 +5,102 @@ from __future__ import annotations
 import numpy as np
 from numpy.typing import NDArray
 
+from ga_shift.ga._kernels import fix_holidays
+from ga_shift.ga.rng import resolve_rng
 from ga_shift.models.schedule import ShiftInput
 
 
+def _require_int8(*schedules: NDArray[np.int8]) -> None:
+    """Reject schedules that are not int8 (a wider dtype multiplies memory traffic)."""
+    for schedule in schedules:
+        if schedule.dtype != np.int8:
+            raise TypeError(f"schedule must be int8, got {schedule.dtype}")
+
+
 def crossover_uniform(
-    parent1: NDArray[np.int_],
-    parent2: NDArray[np.int_],
+    parent1: NDArray[np.int8],
+    parent2: NDArray[np.int8],
     rate: float = 0.5,
-) -> tuple[NDArray[np.int_], NDArray[np.int_]]:
-    """Uniform crossover on flattened arrays.
+    rng: np.random.Generator | None = None,
+) -> tuple[NDArray[np.int8], NDArray[np.int8]]:
+    """Uniform crossover, gene by gene.
 
     Migrated from ga_shift_v2.py:crossover().
     - Same genes → inherit directly
     - Different genes → swap with probability (1-rate)
-    """
-    p1 = parent1.flatten()
-    p2 = parent2.flatten()
 
-    # Vectorized: create mask for different genes
-    diff_mask = p1 != p2
-    swap_mask = diff_mask & (np.random.random(len(p1)) >= rate)
-
-    ch1 = p1.copy()
-    ch2 = p2.copy()
-    ch1[swap_mask] = p2[swap_mask]
-    ch2[swap_mask] = p1[swap_mask]
-
-    shape = parent1.shape
-    return ch1.reshape(shape), ch2.reshape(shape)
+    Parents may also be stacks of schedules, shape (num_pairs, E, D); every
+    pair is then crossed in one call, each gene with its own draw.
+    """
+    _require_int8(parent1, parent2)
+    swap_mask = _swap_mask(parent1.shape, rate, resolve_rng(rng))
+    # Branchless blend: d holds the genes that differ and are swapped, and XOR
+    # with d exchanges exactly those. Much faster than np.where on int8.
+    d = np.bitwise_xor(parent1, parent2)
+    d &= swap_mask
+    return parent1 ^ d, parent2 ^ d
+
+
+def _swap_mask(
+    shape: tuple[int, ...], rate: float, rng: np.random.Generator
+) -> NDArray[np.int8]:
+    """Byte mask that is -1 (all bits set) with probability (1 - rate) per gene, else 0.
+
+    For the default rate of 0.5 the mask is unpacked from random bytes, one
+    bit per gene, instead of drawing a float64 per gene.
+    """
+    if rate == 0.5:
+        n = int(np.prod(shape))
+        bits = np.frombuffer(rng.bytes((n + 7) // 8), dtype=np.uint8)
+        mask = np.unpackbits(bits, count=n).view(np.int8).reshape(shape)
+    else:
+        mask = (rng.random(shape) >= rate).view(np.int8)
+    return np.negative(mask, out=mask)
 
 
 def mutation(
-    child: NDArray[np.int_],
+    child: NDArray[np.int8],
     mutation_rate: float = 0.05,
     gene_ratio: float = 0.1,
-) -> NDArray[np.int_]:
+    rng: np.random.Generator | None = None,
+) -> NDArray[np.int8]:
     """Mutation operator.
 
     - mutation_rate chance of triggering mutation
-    - When triggered, flip gene_ratio fraction of mutable genes (0↔1)
+    - When triggered, each mutable gene flips (0↔1) with probability gene_ratio,
+      with at least one gene flipped
     - Codes 2 (preferred off) and 3 (unavailable) are never changed
     """
-    if np.random.random() >= mutation_rate:
+    _require_int8(child)
+    rng = resolve_rng(rng)
+    if rng.random() >= mutation_rate:
         return child
 
-    result = child.copy()
-    flat = result.flatten()
-
-    # Only mutate genes that are 0 or 1 (mutable)
-    mutable_indices = np.where((flat == 0) | (flat == 1))[0]
-    if len(mutable_indices) == 0:
-        return result
-
-    mutation_count = max(1, int(len(mutable_indices) * gene_ratio))
-    chosen = np.random.choice(mutable_indices, size=min(mutation_count, len(mutable_indices)), replace=False)
+    # x ^ 1 swaps 0 and 1, so one XOR applies the flip; codes 2/3 (x >= 2) are masked out.
+    flip = rng.random(child.shape) < gene_ratio
+    flip &= child < 2
+    if not flip.any():
+        mutable_indices = np.flatnonzero(child < 2)
+        if len(mutable_indices) == 0:
+            return child.copy()
+        flip.flat[rng.choice(mutable_indices)] = True
 
-    for idx in chosen:
-        if flat[idx] == 0:
-            flat[idx] = 1
-        elif flat[idx] == 1:
-            flat[idx] = 0
-
-    return flat.reshape(child.shape)
+    return np.bitwise_xor(child, flip.view(np.int8))
 
 
 def holiday_fix(
-    schedule: NDArray[np.int_],
+    schedule: NDArray[np.int8],
     shift_input: ShiftInput,
-) -> NDArray[np.int_]:
+    rng: np.random.Generator | None = None,
+) -> NDArray[np.int8]:
     """Adjust holiday counts to match contract requirements.
 
-    Uses np.random.choice for efficiency.
     Codes 2 (preferred off) and 3 (unavailable) count as non-work days
-    and are never modified. Only values 0 and 1 are adjusted.
+    and are never modified. Only values 0 and 1 are adjusted; which cells
+    flip is decided by one batch of random keys (see ``ga._kernels``).
     """
+    _require_int8(schedule)
     result = schedule.copy()
-
-    for emp in shift_input.employees:
-        row = result[emp.index]
-        target = emp.required_holidays
-
-        # Count all non-work days: 1 (GA holiday), 2 (preferred off), 3 (unavailable)
-        actual = int(np.count_nonzero(row))
-        diff = actual - target
-
-        if diff == 0:
-            continue
-
-        if diff > 0:
-            # Too many holidays → convert some GA-assigned holidays (1) back to work (0)
-            holiday_indices = np.where(row == 1)[0]
-            if len(holiday_indices) >= diff:
-                to_remove = np.random.choice(holiday_indices, size=diff, replace=False)
-                row[to_remove] = 0
-            else:
-                row[holiday_indices] = 0
-        else:
-            # Too few holidays → convert some available work days (0) to holiday (1)
-            work_indices = np.where(row == 0)[0]
-            need = -diff
-            if len(work_indices) >= need:
-                to_add = np.random.choice(work_indices, size=need, replace=False)
-                row[to_add] = 1
-            else:
-                row[work_indices] = 1
-
+    keys = resolve_rng(rng).random(result.shape)
+    fix_holidays(result, shift_input.holiday_targets, keys)
     return result
@@ -5,10 +5,13 @@ from __future__ import annotations
 import numpy as np
 from numpy.typing import NDArray
 
+from ga_shift.ga.rng import resolve_rng
 from ga_shift.models.schedule import ShiftInput
 
 
-def create_individual(shift_input: ShiftInput) -> NDArray[np.int_]:
+def create_individual(
+    shift_input: ShiftInput, rng: np.random.Generator | None = None
+) -> NDArray[np.int8]:
     """Create a single individual (schedule) as numpy array.
 
     - Copies the base schedule
@@ -19,6 +22,7 @@ def create_individual(shift_input: ShiftInput) -> NDArray[np.int_]:
     Returns:
         numpy array of shape (num_employees, num_days)
     """
+    rng = resolve_rng(rng)
     schedule = shift_input.base_schedule.copy()
 
     for emp in shift_input.employees:
@@ -32,7 +36,7 @@ def create_individual(shift_input: ShiftInput) -> NDArray[np.int_]:
         work_indices = np.where(row == 0)[0]
         needed = target - existing
         if needed > 0 and len(work_indices) >= needed:
-            chosen = np.random.choice(work_indices, size=needed, replace=False)
+            chosen = rng.choice(work_indices, size=needed, replace=False)
             row[chosen] = 1
 
     return schedule
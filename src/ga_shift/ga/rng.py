@@ -0,0 +1,14 @@
+"""Random number generation shared by the GA operators and population setup."""
+
+from __future__ import annotations
+
+import numpy as np
+
+# Used when the caller does not pass a generator. Seeded from OS entropy once,
+# so that operator calls do not each pay for default_rng() construction.
+DEFAULT_RNG = np.random.default_rng()
+
+
+def resolve_rng(rng: np.random.Generator | None) -> np.random.Generator:
+    """Return ``rng``, or the shared ``DEFAULT_RNG`` when it is None."""
+    return DEFAULT_RNG if rng is None else rng
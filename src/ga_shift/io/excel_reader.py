@@ -3,13 +3,23 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import BinaryIO
 
 import numpy as np
 import pandas as pd
 
-from ga_shift.models.employee import EmployeeInfo, EmployeeType, Section
+from ga_shift.models.employee import EMPLOYEE_LIST_ADAPTER, EmployeeType, Section
 from ga_shift.models.schedule import ShiftInput
 
+# python-calamine (the ``fast`` extra) parses xlsx in Rust without building an
+# XML DOM; fall back to openpyxl when it is not installed.
+try:
+    import python_calamine  # noqa: F401
+
+    _EXCEL_ENGINE = "calamine"
+except ImportError:  # pragma: no cover - depends on installed extras
+    _EXCEL_ENGINE = "openpyxl"
+
 # Mapping of Japanese weekday names to weekday index (0=Mon..6=Sun)
 _WEEKDAY_MAP = {"月": 0, "火": 1, "水": 2, "木": 3, "金": 4, "土": 5, "日": 6}
 
@@ -27,7 +37,7 @@ _DAY_COL_START = 4  # 0-indexed column where day data starts
 
 
 def read_shift_input(
-    filepath: str | Path,
+    filepath: str | Path | BinaryIO,
     sheet_name: str = "シフト表",
 ) -> ShiftInput:
     """Read shift input data from Excel file.
@@ -39,10 +49,16 @@ def read_shift_input(
         - Row 3: Weekday row
         - Row 4+: Employee data (dynamic count)
         - After employees: empty row, then required workers row
+
+    ``filepath`` may also be a binary file-like object such as Streamlit's
+    ``UploadedFile``.
     """
-    filepath = Path(filepath)
+    if isinstance(filepath, str):
+        filepath = Path(filepath)
     pd.set_option("future.no_silent_downcasting", True)
-    df = pd.read_excel(filepath, sheet_name=sheet_name, header=None)
+    df = pd.read_excel(
+        filepath, sheet_name=sheet_name, header=None, engine=_EXCEL_ENGINE
+    )
 
     # --- Auto-detect number of days from header row ---
     header_row = df.iloc[2]
@@ -164,11 +180,8 @@ def read_shift_input(
         weekdays.append(weekday)
 
     # --- Build EmployeeInfo list ---
-    employees: list[EmployeeInfo] = []
+    employee_rows: list[dict[str, object]] = []
     for i in range(num_employees):
-        preferred = [j + 1 for j in range(num_days) if base_schedule[i, j] == 2]
-        unavailable = [j + 1 for j in range(num_days) if base_schedule[i, j] == 3]
-
         # Parse employee type
         emp_type_str = emp_types_raw[i].strip()
         if emp_type_str == "パート":
@@ -186,18 +199,19 @@ def read_shift_input(
         except (ValueError, TypeError):
             vac_days = 0
 
-        employees.append(
-            EmployeeInfo(
-                index=i,
-                name=employee_names[i],
-                required_holidays=int(holiday_counts[i]),
-                preferred_days_off=preferred,
-                employee_type=emp_type,
-                section=section,
-                available_vacation_days=vac_days,
-                unavailable_days=unavailable,
-            )
+        employee_rows.append(
+            {
+                "index": i,
+                "name": employee_names[i],
+                "required_holidays": int(holiday_counts[i]),
+                "preferred_days_off": (np.flatnonzero(base_schedule[i] == 2) + 1).tolist(),
+                "employee_type": emp_type,
+                "section": section,
+                "available_vacation_days": vac_days,
+                "unavailable_days": (np.flatnonzero(base_schedule[i] == 3) + 1).tolist(),
+            }
         )
+    employees = EMPLOYEE_LIST_ADAPTER.validate_python(employee_rows)
 
     return ShiftInput(
         num_employees=num_employees,
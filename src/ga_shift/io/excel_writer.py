@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import BinaryIO
 
 import numpy as np
 from openpyxl import Workbook
@@ -18,20 +19,24 @@ _DAY_COL_OFFSET = 4  # 0-indexed: day 1 starts at column index 4 (openpyxl col 5
 
 
 def write_result_excel(
-    filepath: str | Path,
+    target: str | Path | BinaryIO,
     shift_result: ShiftResult,
     shift_input: ShiftInput,
     validation_report: ValidationReport | None = None,
 ) -> None:
-    """Write GA result to Excel file."""
-    filepath = Path(filepath)
+    """Write GA result to Excel.
+
+    Args:
+        target: Output file path, or a writable binary file object
+            (e.g. ``io.BytesIO``) to serialize in memory without touching disk.
+    """
     wb = Workbook()
 
     _write_schedule_sheet(wb.active, shift_result, shift_input)
     if validation_report:
         _write_validation_sheet(wb, validation_report)
 
-    wb.save(str(filepath))
+    wb.save(str(target) if isinstance(target, (str, Path)) else target)
 
 
 def _write_schedule_sheet(
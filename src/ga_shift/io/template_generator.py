@@ -5,6 +5,7 @@ from __future__ import annotations
 import calendar
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import BinaryIO
 
 from openpyxl import Workbook
 from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
@@ -13,7 +14,7 @@ from openpyxl.utils import get_column_letter
 _WEEKDAY_JA = ["月", "火", "水", "木", "金", "土", "日"]
 
 
-@dataclass
+@dataclass(slots=True)
 class EmployeePreset:
     """Preset employee data for template generation."""
 
@@ -31,7 +32,7 @@ _DAY_COL_OFFSET = 4  # Day 1 starts at column 5 (E)
 
 
 def generate_template(
-    filepath: str | Path,
+    filepath: str | Path | BinaryIO,
     year: int,
     month: int,
     num_employees: int = 10,
@@ -41,11 +42,12 @@ def generate_template(
     employee_presets: list[EmployeePreset] | None = None,
     kitchen_required: int | None = None,
     closed_weekdays: list[int] | None = None,
-) -> Path:
+) -> Path | BinaryIO:
     """Generate an Excel template for shift input.
 
     Args:
-        filepath: Output file path.
+        filepath: Output file path, or a writable binary file object
+            (e.g. ``io.BytesIO``) to serialize in memory without touching disk.
         year: Target year (e.g. 2026).
         month: Target month (1-12).
         num_employees: Number of employees (default: 10).
@@ -58,7 +60,7 @@ def generate_template(
             regular closed days.  Required count is set to 0 on these days.
 
     Returns:
-        Path to the generated file.
+        Path to the generated file (or the file object passed in).
 
     The generated layout:
         Row 1: Title
@@ -69,14 +71,19 @@ def generate_template(
         Row (5+num_employees): (empty)
         Row (5+num_employees+1): Required workers (kitchen) - "必要人数（キッチン）", N, N, ...
     """
-    filepath = Path(filepath)
+    if isinstance(filepath, str):
+        filepath = Path(filepath)
     num_days = calendar.monthrange(year, month)[1]
 
     wb = Workbook()
     ws = wb.active
     ws.title = "シフト表"
 
+    # Weekday index (0=Mon..6=Sun) per day, computed once for all rows
+    day_weekdays = [calendar.weekday(year, month, d) for d in range(1, num_days + 1)]
+
     # --- Styles ---
+    # Created once and shared by every cell (no per-cell Font/PatternFill objects)
     title_font = Font(bold=True, size=14, name="Arial")
     header_font = Font(bold=True, size=11, name="Arial")
     center = Alignment(horizontal="center", vertical="center")
@@ -96,6 +103,12 @@ def generate_template(
     weekday_font = Font(size=10, name="Arial")
     sat_font = Font(size=10, name="Arial", color="0000FF")
     sun_font = Font(size=10, name="Arial", color="FF0000")
+    sat_header_font = Font(bold=True, size=11, name="Arial", color="0000FF")
+    sun_header_font = Font(bold=True, size=11, name="Arial", color="FF0000")
+    body_font = Font(name="Arial", size=11)
+    body_bold_font = Font(name="Arial", size=11, bold=True)
+    sat_light_fill = PatternFill("solid", fgColor="EBF5FF")
+    sun_light_fill = PatternFill("solid", fgColor="FFF0F0")
 
     # --- Row 1: Title ---
     ws.cell(row=1, column=1, value=f"シフト表（{year}年{month}月）")
@@ -119,7 +132,7 @@ def generate_template(
         cell.border = thin_border
 
     # Day columns: E onwards
-    for d in range(1, num_days + 1):
+    for d, weekday_idx in enumerate(day_weekdays, 1):
         col = _DAY_COL_OFFSET + d
         cell = ws.cell(row=header_row, column=col, value=d)
         cell.font = header_font
@@ -127,13 +140,12 @@ def generate_template(
         cell.alignment = center
         cell.border = thin_border
 
-        weekday_idx = calendar.weekday(year, month, d)
         if weekday_idx == 5:  # Saturday
             cell.fill = sat_fill
-            cell.font = Font(bold=True, size=11, name="Arial", color="0000FF")
+            cell.font = sat_header_font
         elif weekday_idx == 6:  # Sunday
             cell.fill = sun_fill
-            cell.font = Font(bold=True, size=11, name="Arial", color="FF0000")
+            cell.font = sun_header_font
 
     holiday_col = _DAY_COL_OFFSET + num_days + 1
     cell = ws.cell(row=header_row, column=holiday_col, value="休日数")
@@ -157,9 +169,8 @@ def generate_template(
         cell.border = thin_border
         cell.fill = blue_fill
 
-    for d in range(1, num_days + 1):
+    for d, weekday_idx in enumerate(day_weekdays, 1):
         col = _DAY_COL_OFFSET + d
-        weekday_idx = calendar.weekday(year, month, d)
         weekday_name = _WEEKDAY_JA[weekday_idx]
 
         cell = ws.cell(row=weekday_row, column=col, value=weekday_name)
@@ -206,53 +217,51 @@ def generate_template(
 
         # A: Employee name
         cell = ws.cell(row=row, column=1, value=emp_name)
-        cell.font = Font(name="Arial", size=11)
+        cell.font = body_font
         cell.fill = green_fill
         cell.alignment = center
         cell.border = thin_border
 
         # B: Employment type
         cell = ws.cell(row=row, column=2, value=emp_type)
-        cell.font = Font(name="Arial", size=11)
+        cell.font = body_font
         cell.alignment = center
         cell.border = thin_border
 
         # C: Section
         cell = ws.cell(row=row, column=3, value=emp_section)
-        cell.font = Font(name="Arial", size=11)
+        cell.font = body_font
         cell.alignment = center
         cell.border = thin_border
 
         # D: Available vacation days
         cell = ws.cell(row=row, column=4, value=emp_vacation)
-        cell.font = Font(name="Arial", size=11)
+        cell.font = body_font
         cell.alignment = center
         cell.border = thin_border
 
         # Day cells
-        for d in range(1, num_days + 1):
+        for d, weekday_idx in enumerate(day_weekdays, 1):
             col = _DAY_COL_OFFSET + d
             cell = ws.cell(row=row, column=col)
             cell.alignment = center
             cell.border = thin_border
 
-            weekday_idx = calendar.weekday(year, month, d)
-
             # Mark unavailable days with ×
             if weekday_idx in unavailable_wdays:
                 cell.value = "×"
                 cell.fill = unavailable_fill
-                cell.font = Font(name="Arial", size=11, bold=True)
+                cell.font = body_bold_font
             else:
                 # Light background for Sat/Sun
                 if weekday_idx == 5:
-                    cell.fill = PatternFill("solid", fgColor="EBF5FF")
+                    cell.fill = sat_light_fill
                 elif weekday_idx == 6:
-                    cell.fill = PatternFill("solid", fgColor="FFF0F0")
+                    cell.fill = sun_light_fill
 
         # Holiday count
         cell = ws.cell(row=row, column=holiday_col, value=emp_holidays)
-        cell.font = Font(name="Arial", size=11)
+        cell.font = body_font
         cell.fill = yellow_fill
         cell.alignment = center
         cell.border = thin_border
@@ -270,12 +279,11 @@ def generate_template(
     cell.border = thin_border
 
     _closed_set = set(closed_weekdays) if closed_weekdays else set()
-    for d in range(1, num_days + 1):
+    for d, weekday_idx in enumerate(day_weekdays, 1):
         col = _DAY_COL_OFFSET + d
-        weekday_idx = calendar.weekday(year, month, d)
         day_req = 0 if weekday_idx in _closed_set else req_count
         cell = ws.cell(row=req_row, column=col, value=day_req)
-        cell.font = Font(name="Arial", size=11)
+        cell.font = body_font
         cell.fill = orange_fill
         cell.alignment = center
         cell.border = thin_border
@@ -297,15 +305,15 @@ def generate_template(
     freeze_col = get_column_letter(_DAY_COL_OFFSET + 1)
     ws.freeze_panes = f"{freeze_col}5"
 
-    wb.save(str(filepath))
+    wb.save(str(filepath) if isinstance(filepath, Path) else filepath)
     return filepath
 
 
 def generate_kimachiya_template(
-    filepath: str | Path,
+    filepath: str | Path | BinaryIO,
     year: int,
     month: int,
-) -> Path:
+) -> Path | BinaryIO:
     """Generate a kimachiya-specific shift template.
 
     Presets 5 kitchen staff with their employment info and constraints:
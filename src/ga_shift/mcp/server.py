@@ -11,7 +11,8 @@ Usage:
 
 from __future__ import annotations
 
-import json
+import functools
+import operator
 import tempfile
 from pathlib import Path
 from typing import Any
@@ -59,6 +60,48 @@ def _get_output_dir() -> Path:
     return out
 
 
+@functools.cache
+def _available_template_ids() -> frozenset[str]:
+    """Template IDs of the global constraint registry.
+
+    The registry is populated once per process, so the ID set is cached.
+    Call ``_available_template_ids.cache_clear()`` after registering new
+    templates at runtime.
+    """
+    return frozenset(t.template_id for t in get_registry().list_all())
+
+
+def _preset_from_staff(staff: dict[str, Any]) -> EmployeePreset:
+    """Build an EmployeePreset from a staff dict (setup_facility / transfer_staff format)."""
+    return EmployeePreset(
+        name=staff["name"],
+        employee_type=staff.get("employee_type", "正規"),
+        section=staff.get("section", ""),
+        vacation_days=staff.get("vacation_days", 0),
+        holidays=staff.get("holidays", 9),
+        unavailable_weekdays=staff.get("unavailable_weekdays", []),
+    )
+
+
+_get_staff_name = operator.itemgetter("staff_name")
+
+
+def _visits_for_staff(staff_name: str) -> list[dict[str, Any]]:
+    """Registered accompanied visits assigned to the given staff member."""
+    return [
+        v for v in _facility_state.get("accompanied_visits", [])
+        if _get_staff_name(v) == staff_name
+    ]
+
+
+_RISK_LEVELS = ("高", "中", "低")
+
+
+def _risk_level(staff_count: int, minimum: int) -> str:
+    """人員数と最低基準からリスクレベルを返す（下回る=高, 同数=中, 上回る=低）。"""
+    return _RISK_LEVELS[(staff_count > minimum) + (staff_count >= minimum)]
+
+
 # ---------------------------------------------------------------------------
 # Tool 1: setup_facility
 # ---------------------------------------------------------------------------
@@ -98,18 +141,7 @@ def setup_facility(
         _facility_state["output_dir"] = output_dir
 
     # Build employee presets
-    presets = []
-    for s in _facility_state["staff"]:
-        presets.append(
-            EmployeePreset(
-                name=s["name"],
-                employee_type=s.get("employee_type", "正規"),
-                section=s.get("section", ""),
-                vacation_days=s.get("vacation_days", 0),
-                holidays=s.get("holidays", 9),
-                unavailable_weekdays=s.get("unavailable_weekdays", []),
-            )
-        )
+    presets = [_preset_from_staff(s) for s in _facility_state["staff"]]
     _facility_state["employee_presets"] = presets
 
     return {
@@ -1087,16 +1119,7 @@ def transfer_staff(
 
         # Also update employee_presets
         presets = _facility_state.get("employee_presets", [])
-        presets.append(
-            EmployeePreset(
-                name=staff_name,
-                employee_type=new_staff.get("employee_type", "正規"),
-                section=new_staff.get("section", ""),
-                vacation_days=new_staff.get("vacation_days", 0),
-                holidays=new_staff.get("holidays", 9),
-                unavailable_weekdays=new_staff.get("unavailable_weekdays", []),
-            )
-        )
+        presets.append(_preset_from_staff(new_staff))
         _facility_state["employee_presets"] = presets
 
         return {
@@ -1125,10 +1148,7 @@ def transfer_staff(
         ]
 
         # Check accompanied visits impact
-        affected_visits = [
-            v for v in _facility_state.get("accompanied_visits", [])
-            if v["staff_name"] == staff_name
-        ]
+        affected_visits = _visits_for_staff(staff_name)
 
         return {
             "status": "ok",
@@ -1409,22 +1429,24 @@ def simulate_scenario(
 
     params = scenario_params or {}
 
-    # --- Baseline analysis ---
-    balance_fn = getattr(analyze_schedule_balance, "fn", analyze_schedule_balance)
-    baseline_balance = balance_fn(result_path=base_template_path)
+    # --- Baseline analysis (Excel parse + constraint evaluation) ---
+    # Only the staffing scenarios use it, so it is computed on demand.
+    def _baseline() -> dict[str, Any]:
+        balance_fn = getattr(analyze_schedule_balance, "fn", analyze_schedule_balance)
+        baseline_balance = balance_fn(result_path=base_template_path)
 
-    compliance_fn = getattr(check_compliance, "fn", check_compliance)
-    baseline_compliance = compliance_fn(
-        result_path=base_template_path, constraint_preset=constraint_preset
-    )
+        compliance_fn = getattr(check_compliance, "fn", check_compliance)
+        baseline_compliance = compliance_fn(
+            result_path=base_template_path, constraint_preset=constraint_preset
+        )
 
-    baseline_summary = {
-        "staff_count": baseline_balance.get("staff_count", 0),
-        "average_work_days": baseline_balance.get("average_work_days"),
-        "work_days_std": baseline_balance.get("work_days_std"),
-        "is_compliant": baseline_compliance.get("is_compliant"),
-        "violations_count": len(baseline_compliance.get("violations", [])),
-    }
+        return {
+            "staff_count": baseline_balance.get("staff_count", 0),
+            "average_work_days": baseline_balance.get("average_work_days"),
+            "work_days_std": baseline_balance.get("work_days_std"),
+            "is_compliant": baseline_compliance.get("is_compliant"),
+            "violations_count": len(baseline_compliance.get("violations", [])),
+        }
 
     # --- Scenario analysis ---
     if scenario_type == "remove_staff":
@@ -1445,10 +1467,7 @@ def simulate_scenario(
         new_staff_count = len(current_staff) - (1 if staff_found else 0)
 
         # Check accompanied visits impact
-        affected_visits = [
-            v for v in _facility_state.get("accompanied_visits", [])
-            if v.get("staff_name") == staff_name
-        ]
+        affected_visits = _visits_for_staff(staff_name)
 
         impact = {
             "scenario_type": "remove_staff",
@@ -1459,11 +1478,7 @@ def simulate_scenario(
             "daily_minimum_required": daily_min,
             "meets_minimum": new_staff_count >= daily_min,
             "affected_accompanied_visits": len(affected_visits),
-            "risk_level": (
-                "高" if new_staff_count < daily_min
-                else "中" if new_staff_count == daily_min
-                else "低"
-            ),
+            "risk_level": _risk_level(new_staff_count, daily_min),
         }
 
         recommendations = []
@@ -1484,7 +1499,7 @@ def simulate_scenario(
         return {
             "status": "ok",
             "scenario": impact,
-            "baseline": baseline_summary,
+            "baseline": _baseline(),
             "recommendations": recommendations,
         }
 
@@ -1508,6 +1523,7 @@ def simulate_scenario(
             "new_staff_count": new_staff_count,
             "daily_minimum_required": daily_min,
             "staffing_buffer": new_staff_count - daily_min,
+            "risk_level": _risk_level(new_staff_count, daily_min),
         }
 
         recommendations = []
@@ -1527,7 +1543,7 @@ def simulate_scenario(
         return {
             "status": "ok",
             "scenario": impact,
-            "baseline": baseline_summary,
+            "baseline": _baseline(),
             "recommendations": recommendations,
         }
 
@@ -1558,6 +1574,7 @@ def simulate_scenario(
             "current_staff_count": current_staff_count,
             "meets_new_minimum": current_staff_count >= new_daily_min,
             "staff_gap": current_staff_count - new_daily_min,
+            "risk_level": _risk_level(current_staff_count, new_daily_min),
         }
 
         recommendations = []
@@ -1583,7 +1600,7 @@ def simulate_scenario(
         return {
             "status": "ok",
             "scenario": impact,
-            "baseline": baseline_summary,
+            "baseline": _baseline(),
             "recommendations": recommendations,
         }
 
@@ -1595,14 +1612,13 @@ def simulate_scenario(
             return {"status": "error", "message": "constraint_type が必要です"}
 
         # Validate constraint exists
-        registry = get_registry()
-        available = [t.template_id for t in registry.list_all()]
+        available = _available_template_ids()
 
         if constraint_type not in available:
             return {
                 "status": "error",
                 "message": f"制約 '{constraint_type}' は存在しません",
-                "available_constraints": available,
+                "available_constraints": sorted(available),
             }
 
         return {
@@ -1616,7 +1632,7 @@ def simulate_scenario(
                     "add_constraint → run_optimization の順序で実行します。"
                 ),
             },
-            "baseline": baseline_summary,
+            "baseline": {"note": "制約変更シナリオではベースライン分析を省略します"},
             "recommendations": [
                 f"制約 '{constraint_type}' を追加/変更後、再最適化を実行してください。",
                 "結果を analyze_schedule_balance で確認し、品質劣化がないか確認してください。",
@@ -0,0 +1,42 @@
+"""Numeric kernels used by the models layer.
+
+Lives here rather than in ``ga_shift.constraints._kernels`` so that the models
+do not depend on the constraints package (constraints import models, not the
+other way round). Compiled with ``@njit(cache=True)`` when numba is installed,
+NumPy otherwise.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import NDArray
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
+HAS_NUMBA = njit is not None
+
+
+def _workers_per_day_numpy(binary: NDArray[np.int8]) -> NDArray[np.int64]:
+    """Number of employees working (binary == 0) on each day."""
+    # Any nonzero code means "off", so workers = rows - nonzero count per column.
+    return binary.shape[0] - np.count_nonzero(binary, axis=0)
+
+
+def _workers_per_day_loop(binary: NDArray[np.int8]) -> NDArray[np.int64]:
+    num_employees, num_days = binary.shape
+    out = np.zeros(num_days, dtype=np.int64)
+    for i in range(num_employees):
+        for j in range(num_days):
+            if binary[i, j] == 0:
+                out[j] += 1
+    return out
+
+
+if HAS_NUMBA:
+    # A single row-major pass; the matrix is too small to benefit from threads.
+    workers_per_day = njit(cache=True)(_workers_per_day_loop)
+else:
+    workers_per_day = _workers_per_day_numpy
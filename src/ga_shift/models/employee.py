@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class EmployeeType(str, Enum):
@@ -14,6 +14,10 @@ class EmployeeType(str, Enum):
     PART_TIME = "パート"
 
 
+# int8 codes used by ShiftInput.employee_type_arr
+EMPLOYEE_TYPE_CODES: dict[EmployeeType, int] = {t: i for i, t in enumerate(EmployeeType)}
+
+
 class Section(str, Enum):
     """Work section assignment."""
 
@@ -26,20 +30,28 @@ class Section(str, Enum):
 class EmployeeAttribute(BaseModel):
     """Employee skill or attribute."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     name: str
     level: int = Field(default=1, ge=1, le=5)
 
 
 class EmployeeInfo(BaseModel):
-    """Individual employee information."""
+    """Individual employee information.
+
+    Frozen (and therefore hashable) so it can key caches; derive modified
+    copies with ``model_copy(update=...)``.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
     index: int = Field(description="Zero-based row index in the schedule")
     name: str
     required_holidays: int = Field(ge=0, description="Contract-specified holiday count")
-    preferred_days_off: list[int] = Field(
-        default_factory=list, description="1-indexed day numbers marked as preferred off"
+    preferred_days_off: tuple[int, ...] = Field(
+        default=(), description="1-indexed day numbers marked as preferred off"
     )
-    attributes: list[EmployeeAttribute] = Field(default_factory=list)
+    attributes: tuple[EmployeeAttribute, ...] = Field(default=())
     employee_type: EmployeeType = Field(
         default=EmployeeType.FULL_TIME, description="Employment type"
     )
@@ -47,7 +59,12 @@ class EmployeeInfo(BaseModel):
     available_vacation_days: int = Field(
         default=0, ge=0, description="Available paid leave days for the month"
     )
-    unavailable_days: list[int] = Field(
-        default_factory=list,
+    unavailable_days: tuple[int, ...] = Field(
+        default=(),
         description="1-indexed day numbers marked as unavailable (code 3 / ×)",
     )
+
+
+# Built once at import so readers can validate a whole roster of raw dicts in
+# one call instead of constructing EmployeeInfo row by row.
+EMPLOYEE_LIST_ADAPTER = TypeAdapter(list[EmployeeInfo])
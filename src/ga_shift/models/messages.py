@@ -5,7 +5,7 @@ from __future__ import annotations
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class MessageType(str, Enum):
@@ -26,3 +26,21 @@ class AgentMessage(BaseModel):
     action: str
     payload: dict[str, Any] = Field(default_factory=dict)
     error: str | None = None
+
+
+# Built once at import; validating a batch through a cached adapter avoids
+# rebuilding the list schema and the json.loads + dict round-trip per call.
+_AGENT_MESSAGE_LIST = TypeAdapter(list[AgentMessage])
+
+
+def dump_messages_json(messages: list[AgentMessage]) -> bytes:
+    """Serialize a batch of messages to JSON bytes."""
+    return _AGENT_MESSAGE_LIST.dump_json(messages)
+
+
+def load_messages_json(raw: str | bytes) -> list[AgentMessage]:
+    """Validate a JSON array of messages directly (no intermediate dicts).
+
+    For a single message use ``AgentMessage.model_validate_json``.
+    """
+    return _AGENT_MESSAGE_LIST.validate_json(raw)
@@ -2,11 +2,27 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field, replace
+
 import numpy as np
 from numpy.typing import NDArray
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator, model_validator
+
+from ga_shift.models._kernels import workers_per_day
+from ga_shift.models.employee import EMPLOYEE_TYPE_CODES, EmployeeInfo
+
+
+def _as_int8(value: object) -> NDArray[np.int8]:
+    """Coerce an array-like of small integers (schedule codes, worker counts) to contiguous int8."""
+    arr = np.asarray(value)
+    if arr.size and (arr.min() < np.iinfo(np.int8).min or arr.max() > np.iinfo(np.int8).max):
+        raise ValueError(f"values out of int8 range: [{arr.min()}, {arr.max()}]")
+    return np.ascontiguousarray(arr, dtype=np.int8)
+
 
-from ga_shift.models.employee import EmployeeInfo
+def _day_indices(days_1indexed: list[int], num_days: int) -> list[int]:
+    """Convert 1-indexed day numbers to 0-indexed, dropping out-of-range days."""
+    return [day - 1 for day in days_1indexed if 1 <= day <= num_days]
 
 
 class ShiftInput(BaseModel):
@@ -18,10 +34,10 @@ class ShiftInput(BaseModel):
     num_days: int
     employee_names: list[str]
     employees: list[EmployeeInfo]
-    required_workers: NDArray[np.int_] = Field(
+    required_workers: NDArray[np.int8] = Field(
         description="Required workers per day, shape=(num_days,)"
     )
-    base_schedule: NDArray[np.int_] = Field(
+    base_schedule: NDArray[np.int8] = Field(
         description="Base schedule matrix, shape=(num_employees, num_days). 0=work, 2=preferred off, 3=unavailable"
     )
     day_labels: list[str] = Field(
@@ -30,30 +46,136 @@ class ShiftInput(BaseModel):
     weekdays: list[int] = Field(
         default_factory=list, description="Weekday indices (0=Mon..6=Sun) for each day"
     )
-    required_kitchen_workers: NDArray[np.int_] | None = Field(
+    required_kitchen_workers: NDArray[np.int8] | None = Field(
         default=None, description="Required kitchen workers per day, shape=(num_days,)"
     )
 
+    @field_validator(
+        "base_schedule", "required_workers", "required_kitchen_workers", mode="before"
+    )
+    @classmethod
+    def _coerce_int8(cls, v: object) -> NDArray[np.int8] | None:
+        return None if v is None else _as_int8(v)
+
+    # Per-employee data flattened into arrays (built once in _build_employee_arrays)
+    _required_holidays_arr: NDArray[np.int8] = PrivateAttr()
+    _holiday_targets: NDArray[np.int64] = PrivateAttr()
+    _employee_type_arr: NDArray[np.int8] = PrivateAttr()
+    _unavailable_mask: NDArray[np.bool_] = PrivateAttr()
+    _preferred_off_mask: NDArray[np.bool_] = PrivateAttr()
+    _employee_index_by_name: dict[str, int] = PrivateAttr()
+
+    @model_validator(mode="after")
+    def _build_employee_arrays(self) -> ShiftInput:
+        n, d = self.num_employees, self.num_days
+        self._required_holidays_arr = np.zeros(n, dtype=np.int8)
+        self._holiday_targets = np.full(n, -1, dtype=np.int64)
+        self._employee_type_arr = np.zeros(n, dtype=np.int8)
+        self._unavailable_mask = np.zeros((n, d), dtype=bool)
+        self._preferred_off_mask = np.zeros((n, d), dtype=bool)
+        for emp in self.employees:
+            self._required_holidays_arr[emp.index] = emp.required_holidays
+            self._holiday_targets[emp.index] = emp.required_holidays
+            self._employee_type_arr[emp.index] = EMPLOYEE_TYPE_CODES[emp.employee_type]
+            self._unavailable_mask[emp.index, _day_indices(emp.unavailable_days, d)] = True
+            self._preferred_off_mask[emp.index, _day_indices(emp.preferred_days_off, d)] = True
+        self._employee_index_by_name = {emp.name: emp.index for emp in self.employees}
+        return self
+
+    # Per-day calendar arrays (built once in _build_day_arrays)
+    _weekday_arr: NDArray[np.int8] = PrivateAttr()
+    _is_weekend: NDArray[np.bool_] = PrivateAttr()
+
+    @model_validator(mode="after")
+    def _build_day_arrays(self) -> ShiftInput:
+        # -1 marks days without a known weekday
+        self._weekday_arr = np.full(self.num_days, -1, dtype=np.int8)
+        known = self.weekdays[: self.num_days]
+        self._weekday_arr[: len(known)] = known
+        self._is_weekend = self._weekday_arr >= 5
+        return self
+
+    @property
+    def weekday_arr(self) -> NDArray[np.int8]:
+        """Weekday index per day (0=Mon..6=Sun, -1=unknown), shape=(num_days,)."""
+        return self._weekday_arr
+
+    @property
+    def is_weekend(self) -> NDArray[np.bool_]:
+        """True on Saturdays and Sundays, shape=(num_days,)."""
+        return self._is_weekend
+
+    @property
+    def required_holidays_arr(self) -> NDArray[np.int8]:
+        """Contract holiday count per employee, shape=(num_employees,)."""
+        return self._required_holidays_arr
+
+    @property
+    def holiday_targets(self) -> NDArray[np.int64]:
+        """Holiday target per schedule row for holiday_fix (-1 = no employee), int64."""
+        return self._holiday_targets
+
+    @property
+    def employee_type_arr(self) -> NDArray[np.int8]:
+        """EmployeeType code per employee (see EMPLOYEE_TYPE_CODES), shape=(num_employees,)."""
+        return self._employee_type_arr
+
+    @property
+    def unavailable_mask(self) -> NDArray[np.bool_]:
+        """True where an employee is unavailable, shape=(num_employees, num_days)."""
+        return self._unavailable_mask
+
+    @property
+    def preferred_off_mask(self) -> NDArray[np.bool_]:
+        """True on preferred days off, shape=(num_employees, num_days)."""
+        return self._preferred_off_mask
+
+    @property
+    def employee_index_by_name(self) -> dict[str, int]:
+        """Employee index keyed by name (the last employee wins on duplicate names)."""
+        return self._employee_index_by_name
 
-class ScheduleContext(BaseModel):
+
+@dataclass(slots=True)
+class ScheduleContext:
     """Context for constraint evaluation.
 
     Provides a unified view of a schedule for penalty functions.
+    This is a plain dataclass rather than a pydantic model: one is built per
+    candidate schedule in the GA loop and it never crosses an I/O boundary,
+    so validation would only add overhead.
     """
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-
-    schedule: NDArray[np.int_] = Field(
-        description="Schedule matrix, shape=(num_employees, num_days). 0=work, 1=holiday, 2=preferred off, 3=unavailable"
-    )
+    # Schedule matrix, shape=(num_employees, num_days).
+    # 0=work, 1=holiday, 2=preferred off, 3=unavailable
+    schedule: NDArray[np.int8]
     shift_input: ShiftInput
-    employee_index: int | None = Field(
-        default=None, description="If set, evaluate only this employee"
-    )
-    day_index: int | None = Field(
-        default=None, description="If set, evaluate only this day"
+    # If set, evaluate only this employee / day
+    employee_index: int | None = None
+    day_index: int | None = None
+    # Delta evaluation: the schedule this one was derived from and the
+    # (employee, day) cells that differ from it. None = unknown, evaluate fully.
+    prev_schedule: NDArray[np.int8] | None = None
+    changed_cells: list[tuple[int, int]] | None = None
+
+    _binary: NDArray[np.int8] | None = field(default=None, init=False, repr=False, compare=False)
+    _work: NDArray[np.int8] | None = field(default=None, init=False, repr=False, compare=False)
+    _workers: NDArray[np.int64] | None = field(
+        default=None, init=False, repr=False, compare=False
     )
 
+    def __post_init__(self) -> None:
+        # Constraint kernels are specialized for contiguous int8; no-op if already so.
+        self.schedule = np.ascontiguousarray(self.schedule, dtype=np.int8)
+
+    def with_schedule(self, schedule: NDArray[np.int8]) -> ScheduleContext:
+        """Full-evaluation context for ``schedule`` on the same ShiftInput.
+
+        Schedule-derived caches start empty; ShiftInput-derived arrays live on
+        the shared ``shift_input`` and are reused as-is.
+        """
+        return replace(self, schedule=schedule, prev_schedule=None, changed_cells=None)
+
     @property
     def num_employees(self) -> int:
         return self.shift_input.num_employees
@@ -63,14 +185,28 @@ class ScheduleContext(BaseModel):
         return self.shift_input.num_days
 
     @property
-    def binary_schedule(self) -> NDArray[np.int_]:
-        """Schedule where 2 (preferred off) and 3 (unavailable) are treated as 1 (holiday)."""
-        return np.where(self.schedule >= 2, 1, self.schedule)
+    def binary_schedule(self) -> NDArray[np.int8]:
+        """Schedule where 2 (preferred off) and 3 (unavailable) are treated as 1 (holiday).
+
+        Computed once per context and shared by all penalty functions; treat as read-only.
+        """
+        if self._binary is None:
+            self._binary = np.where(self.schedule >= 2, 1, self.schedule)
+        return self._binary
+
+    @property
+    def work_schedule(self) -> NDArray[np.int8]:
+        """Binary work schedule: 1=work, 0=off. Cached like ``binary_schedule``."""
+        if self._work is None:
+            self._work = 1 - self.binary_schedule
+        return self._work
 
     @property
-    def work_schedule(self) -> NDArray[np.int_]:
-        """Binary work schedule: 1=work, 0=off."""
-        return 1 - self.binary_schedule
+    def workers_per_day(self) -> NDArray[np.int64]:
+        """Employees working on each day, shape=(num_days,). Cached like ``binary_schedule``."""
+        if self._workers is None:
+            self._workers = workers_per_day(self.binary_schedule)
+        return self._workers
 
 
 class ShiftResult(BaseModel):
@@ -78,9 +214,14 @@ class ShiftResult(BaseModel):
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    best_schedule: NDArray[np.int_] = Field(
+    best_schedule: NDArray[np.int8] = Field(
         description="Best schedule found, shape=(num_employees, num_days)"
     )
     best_score: float
     score_history: list[float] = Field(default_factory=list)
     generation_count: int = 0
+
+    @field_validator("best_schedule", mode="before")
+    @classmethod
+    def _coerce_int8(cls, v: object) -> NDArray[np.int8]:
+        return _as_int8(v)
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from enum import Enum
+from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class ViolationSeverity(str, Enum):
@@ -42,15 +44,21 @@ class ValidationReport(BaseModel):
     constraint_scores: list[ConstraintScore] = Field(default_factory=list)
     violations: list[Violation] = Field(default_factory=list)
 
+    # Violations per severity, tallied once at construction
+    _severity_counts: Counter[ViolationSeverity] = PrivateAttr(default_factory=Counter)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._severity_counts = Counter(v.severity for v in self.violations)
+
     @property
     def is_compliant(self) -> bool:
         """True if no error-level violations exist."""
-        return not any(v.severity == ViolationSeverity.ERROR for v in self.violations)
+        return self.error_count == 0
 
     @property
     def error_count(self) -> int:
-        return sum(1 for v in self.violations if v.severity == ViolationSeverity.ERROR)
+        return self._severity_counts[ViolationSeverity.ERROR]
 
     @property
     def warning_count(self) -> int:
-        return sum(1 for v in self.violations if v.severity == ViolationSeverity.WARNING)
+        return self._severity_counts[ViolationSeverity.WARNING]
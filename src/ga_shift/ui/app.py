@@ -4,40 +4,36 @@ from __future__ import annotations
 
 import streamlit as st
 
+from ga_shift.ui.pages.constraints import render_constraints_page
+from ga_shift.ui.pages.execution import render_execution_page
+from ga_shift.ui.pages.results import render_results_page
+from ga_shift.ui.pages.template import render_template_page
+from ga_shift.ui.pages.upload import render_upload_page
+
 st.set_page_config(
     page_title="GA-Shift シフトスケジューラー",
     page_icon="📅",
     layout="wide",
 )
 
+# (tab label, page renderer) in display order
+_PAGES = [
+    ("テンプレート生成", render_template_page),
+    ("入力データ", render_upload_page),
+    ("制約設定", render_constraints_page),
+    ("GA実行", render_execution_page),
+    ("結果", render_results_page),
+]
+
 
 def main() -> None:
     st.title("GA-Shift シフトスケジューラー")
     st.caption("遺伝的アルゴリズムによるシフト表自動作成")
 
-    tab_template, tab_upload, tab_constraints, tab_execution, tab_results = st.tabs(
-        ["テンプレート生成", "入力データ", "制約設定", "GA実行", "結果"]
-    )
-
-    with tab_template:
-        from ga_shift.ui.pages.template import render_template_page
-        render_template_page()
-
-    with tab_upload:
-        from ga_shift.ui.pages.upload import render_upload_page
-        render_upload_page()
-
-    with tab_constraints:
-        from ga_shift.ui.pages.constraints import render_constraints_page
-        render_constraints_page()
-
-    with tab_execution:
-        from ga_shift.ui.pages.execution import render_execution_page
-        render_execution_page()
-
-    with tab_results:
-        from ga_shift.ui.pages.results import render_results_page
-        render_results_page()
+    tabs = st.tabs([label for label, _ in _PAGES])
+    for tab, (_, render_page) in zip(tabs, _PAGES):
+        with tab:
+            render_page()
 
 
 if __name__ == "__main__":
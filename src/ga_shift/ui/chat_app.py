@@ -11,11 +11,16 @@ Usage:
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import heapq
 import os
+import shutil
 from pathlib import Path
 
 import streamlit as st
 
+from ga_shift.agno_agents.team import create_shift_team
+
 # ---------------------------------------------------------------------------
 # Page config
 # ---------------------------------------------------------------------------
@@ -38,6 +43,9 @@ if "team" not in st.session_state:
 if "facility_name" not in st.session_state:
     st.session_state.facility_name = ""
 
+if "loop" not in st.session_state:
+    st.session_state.loop = None
+
 
 # ---------------------------------------------------------------------------
 # Helper: lazy-init the ShiftTeam
@@ -47,8 +55,6 @@ def _get_team():
     if st.session_state.team is not None:
         return st.session_state.team
 
-    from ga_shift.agno_agents.team import create_shift_team
-
     # MCP server command - uvを使ってga_shift.mcpモジュールを起動
     mcp_cmd = os.environ.get(
         "GA_SHIFT_MCP_CMD",
@@ -63,6 +69,29 @@ def _get_team():
     return team
 
 
+# ---------------------------------------------------------------------------
+# Helper: persistent event loop for async team runs
+# ---------------------------------------------------------------------------
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """セッション内で使い回すイベントループを返す（MCP接続をメッセージ間で維持する）。"""
+    loop = st.session_state.loop
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        st.session_state.loop = loop
+    return loop
+
+
+# ---------------------------------------------------------------------------
+# Helper: recent output files
+# ---------------------------------------------------------------------------
+@st.cache_data(ttl=5, show_spinner=False)
+def _recent_outputs(output_dir: str, limit: int = 5) -> list[Path]:
+    """直近に生成された xlsx を新しい順に最大 limit 件返す（5秒キャッシュ）。"""
+    return heapq.nlargest(
+        limit, Path(output_dir).glob("*.xlsx"), key=lambda p: p.stat().st_mtime
+    )
+
+
 # ---------------------------------------------------------------------------
 # Sidebar: File upload / download + settings
 # ---------------------------------------------------------------------------
@@ -76,29 +105,36 @@ with st.sidebar:
         help="テンプレートに希望休を入力したExcelファイルをアップロードしてください。",
     )
     if uploaded is not None:
-        # Save uploaded file to temp dir
-        upload_dir = Path("data/uploads")
-        upload_dir.mkdir(parents=True, exist_ok=True)
-        upload_path = upload_dir / uploaded.name
-        upload_path.write_bytes(uploaded.getvalue())
-        st.success(f"✅ アップロード完了: {uploaded.name}")
-        st.session_state["uploaded_file"] = str(upload_path)
+        # Save uploaded file to temp dir, only when name or contents changed.
+        # Hash and copy stream in chunks instead of materializing the bytes.
+        uploaded.seek(0)
+        digest = hashlib.file_digest(uploaded, lambda: hashlib.blake2b(digest_size=16))
+        upload_key = f"{uploaded.name}:{digest.hexdigest()}"
+        if st.session_state.get("_uploaded_hash") != upload_key:
+            upload_dir = Path("data/uploads")
+            upload_dir.mkdir(parents=True, exist_ok=True)
+            upload_path = upload_dir / uploaded.name
+            uploaded.seek(0)
+            with upload_path.open("wb") as dst:
+                shutil.copyfileobj(uploaded, dst, length=1 << 20)
+            st.success(f"✅ アップロード完了: {uploaded.name}")
+            st.session_state["uploaded_file"] = str(upload_path)
+            st.session_state["_uploaded_hash"] = upload_key
 
     # Download section
     st.divider()
     st.subheader("📥 生成ファイル")
     output_dir = Path("data/ga_shift_output")
     if output_dir.exists():
-        xlsx_files = sorted(output_dir.glob("*.xlsx"), key=lambda p: p.stat().st_mtime, reverse=True)
-        for f in xlsx_files[:5]:  # Show last 5 files
-            with open(f, "rb") as fp:
-                st.download_button(
-                    label=f"⬇️ {f.name}",
-                    data=fp.read(),
-                    file_name=f.name,
-                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                    key=f"dl_{f.name}",
-                )
+        for f in _recent_outputs(str(output_dir)):
+            # Bytes are read only when the button is clicked
+            st.download_button(
+                label=f"⬇️ {f.name}",
+                data=f.read_bytes,
+                file_name=f.name,
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                key=f"dl_{f.name}",
+            )
     else:
         st.info("まだ生成ファイルはありません。")
 
@@ -116,6 +152,9 @@ with st.sidebar:
     if st.button("🔄 チャットをリセット"):
         st.session_state.messages = []
         st.session_state.team = None
+        if st.session_state.loop is not None:
+            st.session_state.loop.close()
+            st.session_state.loop = None
         st.rerun()
 
 
@@ -148,8 +187,8 @@ if prompt := st.chat_input("シフトについて何でも聞いてください"
                 if "uploaded_file" in st.session_state:
                     context_prompt += f"\n\n[アップロード済みファイル: {st.session_state['uploaded_file']}]"
 
-                # Run the team (synchronous wrapper)
-                response = team.run(context_prompt)
+                # Run the team on the session's persistent event loop
+                response = _get_loop().run_until_complete(team.arun(context_prompt))
 
                 if response and response.content:
                     assistant_msg = response.content
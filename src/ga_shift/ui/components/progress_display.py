@@ -2,19 +2,39 @@
 
 from __future__ import annotations
 
+import time
+
 import streamlit as st
 
+# Upper bound on widget refreshes per run, and minimum seconds between them.
+_MAX_UPDATES = 50
+_MIN_INTERVAL = 0.1
+
 
 class ProgressDisplay:
-    """Manages progress bar and status text during GA execution."""
+    """Manages progress bar and status text during GA execution.
+
+    Updates are throttled to every ``total // 50`` generations and at most
+    ~10 per second; the final generation is always shown.
+    """
 
     def __init__(self, total_generations: int) -> None:
         self.total = total_generations
         self.progress_bar = st.progress(0)
         self.status_text = st.empty()
         self.score_text = st.empty()
+        self._stride = max(1, total_generations // _MAX_UPDATES)
+        self._last_update = 0.0
 
     def update(self, generation: int, current_score: float, top_score: float) -> None:
+        if generation != self.total:
+            if generation % self._stride:
+                return
+            now = time.monotonic()
+            if now - self._last_update < _MIN_INTERVAL:
+                return
+            self._last_update = now
+
         progress = generation / self.total
         self.progress_bar.progress(progress)
         self.status_text.text(f"世代: {generation}/{self.total}")
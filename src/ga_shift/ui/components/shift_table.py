@@ -8,30 +8,59 @@ import streamlit as st
 
 from ga_shift.models.schedule import ShiftInput, ShiftResult
 
+# Display label per schedule code (0=work, 1=holiday, 2=preferred off, 3=unavailable)
+_CELL_LABELS = np.array(["出", "休", "◎", "×"], dtype=object)
+
+
+@st.cache_data(show_spinner=False)
+def _compute_shift_display(
+    schedule_bytes: bytes,
+    shape: tuple[int, int],
+    emp_indices: tuple[int, ...],
+    names: tuple[str, ...],
+    contract_holidays: tuple[int, ...],
+    required_bytes: bytes,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Build the shift table and worker summary frames.
+
+    Takes hashable arguments only so Streamlit reruns with an unchanged
+    result hit the cache instead of rebuilding both frames.
+    """
+    schedule = np.frombuffer(schedule_bytes, dtype=np.int8).reshape(shape)
+    num_days = shape[1]
+
+    rows = schedule[list(emp_indices)]
+    df = pd.DataFrame(
+        _CELL_LABELS[rows],
+        index=pd.Index(names, name="社員名"),
+        columns=[str(d + 1) for d in range(num_days)],
+    )
+    df["実休日"] = np.count_nonzero((rows == 1) | (rows == 2), axis=1)
+    df["契約"] = contract_holidays
+
+    workers = np.count_nonzero(schedule == 0, axis=0)
+    required_arr = np.frombuffer(required_bytes, dtype=np.int8)
+    summary_df = pd.DataFrame(
+        [workers, required_arr, workers - required_arr],
+        index=["出勤人数", "必要人数", "差分"],
+        columns=pd.Index(range(1, num_days + 1), name="日"),
+    )
+    return df, summary_df
+
 
 def render_shift_table(shift_result: ShiftResult, shift_input: ShiftInput) -> None:
     """Render the shift table as a styled dataframe."""
-    schedule = shift_result.best_schedule
-    num_employees = shift_input.num_employees
-    num_days = shift_input.num_days
-
-    label_map = {0: "出", 1: "休", 2: "◎"}
-    data: list[dict[str, str | int]] = []
-
-    for emp in shift_input.employees:
-        row_data: dict[str, str | int] = {"社員名": emp.name}
-        actual_holidays = 0
-        for d in range(num_days):
-            val = int(schedule[emp.index, d])
-            row_data[str(d + 1)] = label_map.get(val, str(val))
-            if val in (1, 2):
-                actual_holidays += 1
-        row_data["実休日"] = actual_holidays
-        row_data["契約"] = emp.required_holidays
-        data.append(row_data)
-
-    df = pd.DataFrame(data)
-    df = df.set_index("社員名")
+    schedule = np.ascontiguousarray(shift_result.best_schedule, dtype=np.int8)
+    employees = shift_input.employees
+
+    df, summary_df = _compute_shift_display(
+        schedule.tobytes(),
+        schedule.shape,
+        tuple(emp.index for emp in employees),
+        tuple(emp.name for emp in employees),
+        tuple(emp.required_holidays for emp in employees),
+        shift_input.required_workers.tobytes(),
+    )
 
     def style_cell(val):
         if val == "休":
@@ -42,22 +71,10 @@ def render_shift_table(shift_result: ShiftResult, shift_input: ShiftInput) -> No
             return "background-color: #FFFFFF; color: #333"
         return ""
 
-    day_cols = [str(d + 1) for d in range(num_days)]
+    day_cols = [str(d + 1) for d in range(shift_input.num_days)]
     styled = df.style.map(style_cell, subset=day_cols)
     st.dataframe(styled, use_container_width=True, height=400)
 
     # Worker count summary
     st.subheader("出勤人数サマリー")
-    binary = np.where(schedule == 2, 1, schedule)
-    worker_data: dict[str, list] = {"日": [], "出勤人数": [], "必要人数": [], "差分": []}
-    for d in range(num_days):
-        holiday_count = int(np.sum(binary[:, d]))
-        workers = num_employees - holiday_count
-        required = int(shift_input.required_workers[d])
-        worker_data["日"].append(d + 1)
-        worker_data["出勤人数"].append(workers)
-        worker_data["必要人数"].append(required)
-        worker_data["差分"].append(workers - required)
-
-    summary_df = pd.DataFrame(worker_data).set_index("日").T
     st.dataframe(summary_df, use_container_width=True)
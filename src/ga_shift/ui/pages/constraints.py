@@ -61,9 +61,10 @@ def render_constraints_page() -> None:
 
     # Render by category
     new_configs: list[ConstraintConfig] = []
+    enabled_names: list[str] = []
 
     for category in _CATEGORY_ORDER:
-        templates = registry.list_by_category(category)
+        templates = registry.by_category.get(category, ())
         if not templates:
             continue
 
@@ -84,6 +85,7 @@ def render_constraints_page() -> None:
                 )
                 if config is not None:
                     new_configs.append(config)
+                    enabled_names.append(template.name_ja)
 
     # Save back to session state
     st.session_state["constraint_set"] = ConstraintSet(
@@ -94,8 +96,7 @@ def render_constraints_page() -> None:
     st.divider()
     st.subheader("有効な制約")
     if new_configs:
-        for c in new_configs:
-            template = registry.get(c.template_id)
-            st.write(f"- **{template.name_ja}** ({c.template_id})")
+        for name_ja, c in zip(enabled_names, new_configs):
+            st.write(f"- **{name_ja}** ({c.template_id})")
     else:
         st.info("制約が設定されていません。")
@@ -23,38 +23,50 @@ def render_execution_page() -> None:
         "constraint_set", ConstraintSet.default_set()
     )
 
-    # GA configuration
+    # GA configuration (batched in a form so widget edits rerun only on submit)
     st.subheader("GA設定")
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        generation_count = st.number_input(
-            "世代数", value=50, min_value=1, max_value=500, step=10
-        )
-    with col2:
-        elite_count = st.number_input(
-            "エリート数", value=20, min_value=2, max_value=100, step=5
-        )
-    with col3:
-        initial_pop = st.number_input(
-            "初期個体数", value=100, min_value=10, max_value=1000, step=10
-        )
+    current: GAConfig = st.session_state.get("ga_config", GAConfig())
+    with st.form("ga_config"):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            generation_count = st.number_input(
+                "世代数", value=current.generation_count, min_value=1, max_value=500, step=10
+            )
+        with col2:
+            elite_count = st.number_input(
+                "エリート数", value=current.elite_count, min_value=2, max_value=100, step=5
+            )
+        with col3:
+            initial_pop = st.number_input(
+                "初期個体数",
+                value=current.initial_population,
+                min_value=10,
+                max_value=1000,
+                step=10,
+            )
 
-    col4, col5, col6 = st.columns(3)
-    with col4:
-        crossover_rate = st.slider("交叉率", 0.0, 1.0, 0.5, 0.05)
-    with col5:
-        mutation_rate = st.slider("突然変異率", 0.0, 0.5, 0.05, 0.01)
-    with col6:
-        mutation_gene_ratio = st.slider("変異遺伝子割合", 0.0, 0.5, 0.1, 0.01)
-
-    ga_config = GAConfig(
-        generation_count=generation_count,
-        elite_count=elite_count,
-        initial_population=initial_pop,
-        crossover_rate=crossover_rate,
-        mutation_rate=mutation_rate,
-        mutation_gene_ratio=mutation_gene_ratio,
-    )
+        col4, col5, col6 = st.columns(3)
+        with col4:
+            crossover_rate = st.slider("交叉率", 0.0, 1.0, current.crossover_rate, 0.05)
+        with col5:
+            mutation_rate = st.slider("突然変異率", 0.0, 0.5, current.mutation_rate, 0.01)
+        with col6:
+            mutation_gene_ratio = st.slider(
+                "変異遺伝子割合", 0.0, 0.5, current.mutation_gene_ratio, 0.01
+            )
+
+        submitted = st.form_submit_button("適用")
+
+    if submitted:
+        st.session_state["ga_config"] = GAConfig(
+            generation_count=generation_count,
+            elite_count=elite_count,
+            initial_population=initial_pop,
+            crossover_rate=crossover_rate,
+            mutation_rate=mutation_rate,
+            mutation_gene_ratio=mutation_gene_ratio,
+        )
+    ga_config: GAConfig = st.session_state.get("ga_config", current)
 
     # Active constraints summary
     enabled = [c for c in constraint_set.constraints if c.enabled]
@@ -2,16 +2,57 @@
 
 from __future__ import annotations
 
+import hashlib
 import io
-import tempfile
-from pathlib import Path
 
 import streamlit as st
 
 from ga_shift.io.excel_writer import write_result_excel
+from ga_shift.models.schedule import ShiftInput, ShiftResult
 from ga_shift.models.validation import ValidationReport, ViolationSeverity
 from ga_shift.ui.components.shift_table import render_shift_table
 
+_SHIFT_INPUT_ARRAYS = ("required_workers", "base_schedule", "required_kitchen_workers")
+
+
+def _shift_input_digest(si: ShiftInput) -> str:
+    """Stable digest of everything in a ShiftInput that ends up in the workbook.
+
+    The numpy fields are not JSON-serializable, so they are hashed as shape + raw bytes.
+    """
+    fields = si.model_dump_json(exclude=set(_SHIFT_INPUT_ARRAYS))
+    h = hashlib.blake2b(fields.encode(), digest_size=16)
+    for name in _SHIFT_INPUT_ARRAYS:
+        arr = getattr(si, name)
+        h.update(b"none" if arr is None else repr(arr.shape).encode() + arr.tobytes())
+    return h.hexdigest()
+
+
+def _report_digest(report: ValidationReport) -> str:
+    return hashlib.blake2b(report.model_dump_json().encode(), digest_size=16).hexdigest()
+
+
+@st.cache_data(show_spinner=False)
+def _result_excel_bytes(
+    schedule_bytes: bytes,
+    schedule_shape: tuple[int, ...],
+    best_score: float,
+    shift_input_digest: str,
+    report_digest: str,
+    _shift_result: ShiftResult,
+    _shift_input: ShiftInput,
+    _validation_report: ValidationReport,
+) -> bytes:
+    """Serialize the result workbook.
+
+    Underscore-prefixed arguments are excluded from Streamlit's cache key, so the
+    key carries the schedule (contents and shape), the score and digests of the
+    input and the validation report instead.
+    """
+    buf = io.BytesIO()
+    write_result_excel(buf, _shift_result, _shift_input, _validation_report)
+    return buf.getvalue()
+
 
 def render_results_page() -> None:
     """Render the results page."""
@@ -65,18 +106,20 @@ def render_results_page() -> None:
 
     # Download
     st.subheader("ダウンロード")
-    buf = io.BytesIO()
-    with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
-        write_result_excel(tmp.name, shift_result, si, validation_report)
-        tmp_path = Path(tmp.name)
-
-    buf.write(tmp_path.read_bytes())
-    tmp_path.unlink()
-    buf.seek(0)
+    xlsx_bytes = _result_excel_bytes(
+        shift_result.best_schedule.tobytes(),
+        shift_result.best_schedule.shape,
+        shift_result.best_score,
+        _shift_input_digest(si),
+        _report_digest(validation_report),
+        shift_result,
+        si,
+        validation_report,
+    )
 
     st.download_button(
         label="結果Excelをダウンロード",
-        data=buf,
+        data=xlsx_bytes,
         file_name="shift_result.xlsx",
         mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         use_container_width=True,
@@ -3,16 +3,28 @@
 from __future__ import annotations
 
 import io
-import tempfile
-from pathlib import Path
 
 import streamlit as st
 
 from ga_shift.io.template_generator import EmployeePreset, generate_template
 
 _WEEKDAY_LABELS = ["月曜", "火曜", "水曜", "木曜", "金曜", "土曜", "日曜"]
+_fmt_weekday = _WEEKDAY_LABELS.__getitem__
+_WEEKDAY_OPTIONS: tuple[int, ...] = tuple(range(7))
+_DEFAULT_CLOSED: tuple[int, ...] = (5, 6)
 _SECTION_OPTIONS = ["", "仕込み", "ランチ", "仕込み・ランチ", "ホール"]
 _TYPE_OPTIONS = ["正規", "パート"]
+_SECTION_INDEX = {v: i for i, v in enumerate(_SECTION_OPTIONS)}
+_TYPE_INDEX = {v: i for i, v in enumerate(_TYPE_OPTIONS)}
+# Per-field defaults for new employee rows (name is generated per row).
+# Immutable values so the repeated entries can safely share one object.
+_DEFAULT_EMPLOYEE_TEMPLATE: dict[str, object] = {
+    "type": "正規",
+    "section": "",
+    "vacation": 0,
+    "holidays": 9,
+    "unavailable": (),
+}
 
 
 def render_template_page() -> None:
@@ -51,9 +63,9 @@ def render_template_page() -> None:
     with col_closed:
         closed_days = st.multiselect(
             "定休日（曜日）",
-            options=list(range(7)),
-            default=[5, 6],
-            format_func=lambda x: _WEEKDAY_LABELS[x],
+            options=_WEEKDAY_OPTIONS,
+            default=list(_DEFAULT_CLOSED),
+            format_func=_fmt_weekday,
             help="定休日の曜日を選択（必要出勤人数が0になります）",
         )
 
@@ -65,55 +77,47 @@ def render_template_page() -> None:
         "社員数", value=5, min_value=1, max_value=30, step=1
     )
 
-    # Initialize employee data in session state
+    # Employee data is kept column-wise (one list per field) in session state
     if "template_employees" not in st.session_state:
         st.session_state["template_employees"] = _default_employees(5)
 
     # Adjust list size
-    current = st.session_state["template_employees"]
-    if len(current) < num_employees:
-        for i in range(len(current), num_employees):
-            current.append({
-                "name": f"社員{i + 1}",
-                "type": "正規",
-                "section": "",
-                "vacation": 0,
-                "holidays": 9,
-                "unavailable": [],
-            })
-    elif len(current) > num_employees:
-        st.session_state["template_employees"] = current[:num_employees]
-        current = st.session_state["template_employees"]
+    cols: dict[str, list] = st.session_state["template_employees"]
+    current_count = len(cols["name"])
+    if current_count < num_employees:
+        extra = _default_employees(num_employees, start=current_count)
+        for key, values in extra.items():
+            cols[key].extend(values)
+    elif current_count > num_employees:
+        for values in cols.values():
+            del values[num_employees:]
 
     # Employee input form
     for i in range(num_employees):
-        emp = current[i]
-        with st.expander(f"社員{i + 1}: {emp['name']}", expanded=(i < 3)):
+        with st.expander(f"社員{i + 1}: {cols['name'][i]}", expanded=(i < 3)):
             c1, c2, c3, c4 = st.columns([3, 2, 3, 2])
             with c1:
-                emp["name"] = st.text_input(
-                    "名前", value=emp["name"], key=f"emp_name_{i}"
+                cols["name"][i] = st.text_input(
+                    "名前", value=cols["name"][i], key=f"emp_name_{i}"
                 )
             with c2:
-                type_idx = _TYPE_OPTIONS.index(emp["type"]) if emp["type"] in _TYPE_OPTIONS else 0
-                emp["type"] = st.selectbox(
+                cols["type"][i] = st.selectbox(
                     "雇用形態",
                     options=_TYPE_OPTIONS,
-                    index=type_idx,
+                    index=_TYPE_INDEX.get(cols["type"][i], 0),
                     key=f"emp_type_{i}",
                 )
             with c3:
-                sec_idx = _SECTION_OPTIONS.index(emp["section"]) if emp["section"] in _SECTION_OPTIONS else 0
-                emp["section"] = st.selectbox(
+                cols["section"][i] = st.selectbox(
                     "セクション",
                     options=_SECTION_OPTIONS,
-                    index=sec_idx,
+                    index=_SECTION_INDEX.get(cols["section"][i], 0),
                     key=f"emp_section_{i}",
                 )
             with c4:
-                emp["holidays"] = st.number_input(
+                cols["holidays"][i] = st.number_input(
                     "休日数",
-                    value=emp["holidays"],
+                    value=cols["holidays"][i],
                     min_value=1,
                     max_value=25,
                     step=1,
@@ -122,20 +126,20 @@ def render_template_page() -> None:
 
             c5, c6 = st.columns(2)
             with c5:
-                emp["vacation"] = st.number_input(
+                cols["vacation"][i] = st.number_input(
                     "有休残日数",
-                    value=emp["vacation"],
+                    value=cols["vacation"][i],
                     min_value=0,
                     max_value=40,
                     step=1,
                     key=f"emp_vacation_{i}",
                 )
             with c6:
-                emp["unavailable"] = st.multiselect(
+                cols["unavailable"][i] = st.multiselect(
                     "出勤不可曜日",
-                    options=list(range(7)),
-                    default=emp["unavailable"],
-                    format_func=lambda x: _WEEKDAY_LABELS[x],
+                    options=_WEEKDAY_OPTIONS,
+                    default=cols["unavailable"][i],
+                    format_func=_fmt_weekday,
                     key=f"emp_unavail_{i}",
                 )
 
@@ -143,24 +147,22 @@ def render_template_page() -> None:
 
     # --- Generate button ---
     if st.button("テンプレートExcelを生成", type="primary", use_container_width=True):
-        presets = []
-        for emp in current:
-            presets.append(
-                EmployeePreset(
-                    name=emp["name"],
-                    employee_type=emp["type"],
-                    section=emp["section"],
-                    vacation_days=emp["vacation"],
-                    holidays=emp["holidays"],
-                    unavailable_weekdays=emp["unavailable"],
-                )
+        # Columns are listed in EmployeePreset field order
+        presets = list(
+            map(
+                EmployeePreset,
+                cols["name"],
+                cols["type"],
+                cols["section"],
+                cols["vacation"],
+                cols["holidays"],
+                cols["unavailable"],
             )
+        )
 
-        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
-            tmp_path = tmp.name
-
+        buf = io.BytesIO()
         generate_template(
-            filepath=tmp_path,
+            filepath=buf,
             year=int(year),
             month=int(month),
             employee_presets=presets,
@@ -168,10 +170,6 @@ def render_template_page() -> None:
             kitchen_required=int(default_required) if use_kitchen else None,
             closed_weekdays=closed_days if closed_days else None,
         )
-
-        buf = io.BytesIO()
-        buf.write(Path(tmp_path).read_bytes())
-        Path(tmp_path).unlink(missing_ok=True)
         buf.seek(0)
 
         filename = f"shift_template_{int(year)}_{int(month):02d}.xlsx"
@@ -186,16 +184,10 @@ def render_template_page() -> None:
         )
 
 
-def _default_employees(count: int) -> list[dict]:
-    """Create default employee data list."""
-    return [
-        {
-            "name": f"社員{i + 1}",
-            "type": "正規",
-            "section": "",
-            "vacation": 0,
-            "holidays": 9,
-            "unavailable": [],
-        }
-        for i in range(count)
-    ]
+def _default_employees(count: int, start: int = 0) -> dict[str, list]:
+    """Create default employee data as one list per field, for rows start..count-1."""
+    n = count - start
+    cols: dict[str, list] = {"name": [f"社員{i + 1}" for i in range(start, count)]}
+    for key, value in _DEFAULT_EMPLOYEE_TEMPLATE.items():
+        cols[key] = [value] * n
+    return cols
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
 from ga_shift.io.excel_reader import read_shift_input
+from ga_shift.models.schedule import ShiftInput
+
+_PREFERRED_CSS = "background-color: #FCE4EC; color: #FF0000; font-weight: bold"
 
 
 def render_upload_page() -> None:
@@ -37,38 +41,69 @@ def render_upload_page() -> None:
 
     # Employee info table
     st.subheader("社員情報")
-    emp_data = []
-    for emp in si.employees:
-        emp_data.append({
-            "社員名": emp.name,
-            "契約休日数": emp.required_holidays,
-            "希望休": ", ".join(str(d) for d in emp.preferred_days_off) or "なし",
-        })
-    st.dataframe(pd.DataFrame(emp_data), use_container_width=True, hide_index=True)
+    st.dataframe(_build_emp_table(si), use_container_width=True, hide_index=True)
 
     # Base schedule preview
     st.subheader("入力シフト表（希望休マーク付き）")
-    label_map = {0: "出", 2: "◎"}
-    preview_data: list[dict[str, str]] = []
-    for emp in si.employees:
-        row: dict[str, str] = {"社員名": emp.name}
-        for d in range(si.num_days):
-            val = int(si.base_schedule[emp.index, d])
-            row[str(d + 1)] = label_map.get(val, str(val))
-        preview_data.append(row)
-
-    preview_df = pd.DataFrame(preview_data).set_index("社員名")
-
-    def style_preferred(val):
-        if val == "◎":
-            return "background-color: #FCE4EC; color: #FF0000; font-weight: bold"
-        return ""
-
-    styled = preview_df.style.map(style_preferred)
+    preview_df, css = _build_preview(si)
+    styled = preview_df.style.apply(
+        lambda df: pd.DataFrame(css, index=df.index, columns=df.columns), axis=None
+    )
     st.dataframe(styled, use_container_width=True, height=400)
 
     # Required workers
     st.subheader("必要出勤人数")
-    req_data = {"日": list(range(1, si.num_days + 1)), "必要人数": si.required_workers.tolist()}
-    req_df = pd.DataFrame(req_data).set_index("日").T
-    st.dataframe(req_df, use_container_width=True)
+    st.dataframe(_build_required_table(si), use_container_width=True)
+
+
+def _shift_input_key(si: ShiftInput) -> tuple:
+    """Cheap cache key covering everything the preview tables read."""
+    return (
+        tuple(si.employees),
+        si.num_days,
+        si.base_schedule.tobytes(),
+        si.required_workers.tobytes(),
+    )
+
+
+_CACHE_BY_INPUT = st.cache_data(show_spinner=False, hash_funcs={ShiftInput: _shift_input_key})
+
+
+@_CACHE_BY_INPUT
+def _build_emp_table(si: ShiftInput) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "社員名": [emp.name for emp in si.employees],
+            "契約休日数": [emp.required_holidays for emp in si.employees],
+            "希望休": [
+                ", ".join(map(str, emp.preferred_days_off)) or "なし" for emp in si.employees
+            ],
+        }
+    )
+
+
+@_CACHE_BY_INPUT
+def _build_preview(si: ShiftInput) -> tuple[pd.DataFrame, np.ndarray]:
+    """Preview frame plus a same-shape CSS array for Styler.apply."""
+    base = si.base_schedule[[emp.index for emp in si.employees]]
+    # Codes without a mark (e.g. 3) are shown as their number
+    cells = base.astype(str).astype(object)
+    cells[base == 0] = "出"
+    cells[base == 2] = "◎"
+    preview_df = pd.DataFrame(
+        cells,
+        index=pd.Index([emp.name for emp in si.employees], name="社員名"),
+        columns=[str(d + 1) for d in range(si.num_days)],
+    )
+    # Whole-frame CSS in one pass instead of a Python callback per cell
+    css = np.where(base == 2, _PREFERRED_CSS, "")
+    return preview_df, css
+
+
+@_CACHE_BY_INPUT
+def _build_required_table(si: ShiftInput) -> pd.DataFrame:
+    return pd.DataFrame(
+        si.required_workers[np.newaxis],
+        index=["必要人数"],
+        columns=pd.RangeIndex(1, si.num_days + 1, name="日"),
+    )
@@ -0,0 +1,12 @@
+"""Test suite for ga_shift.
+
+Under pytest-xdist every worker is a separate process, so NumPy's BLAS pool
+and numba's parallel kernels are capped at one thread per worker to avoid
+oversubscribing the CPU. This runs before any conftest imports NumPy.
+"""
+
+import os
+
+if "PYTEST_XDIST_WORKER" in os.environ:
+    for _var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS", "NUMBA_NUM_THREADS"):
+        os.environ.setdefault(_var, "1")
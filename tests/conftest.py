@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import calendar
+import copy
+import hashlib
+import os
 import tempfile
 from pathlib import Path
 
 import numpy as np
 import pytest
 
+from ga_shift.io import template_generator
 from ga_shift.io.excel_reader import read_shift_input
 from ga_shift.io.template_generator import generate_kimachiya_template
 from ga_shift.models.constraint import ConstraintSet
@@ -17,23 +22,99 @@ from ga_shift.models.schedule import ScheduleContext, ShiftInput
 
 
 @pytest.fixture
-def sample_shift_input() -> ShiftInput:
-    """Load sample shift input from the test Excel file.
+def sample_shift_input(shared_sample_shift_input: ShiftInput) -> ShiftInput:
+    """Per-test copy of ``shared_sample_shift_input`` that tests may modify."""
+    return copy.deepcopy(shared_sample_shift_input)
 
-    Always generates a kimachiya template to ensure compatibility
-    with the current column layout.
+
+@pytest.fixture(scope="session")
+def shared_sample_shift_input() -> ShiftInput:
+    """Kimachiya staff for March 2026, built in memory once per session.
+
+    Mirrors what read_shift_input() returns for
+    generate_kimachiya_template(path, 2026, 3) without the Excel round-trip;
+    test_excel_reader checks the two stay identical. Read-only: for
+    session/module-scoped fixtures; tests should use ``sample_shift_input``.
     """
-    with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as f:
-        tmppath = f.name
-    generate_kimachiya_template(tmppath, 2026, 3)
-    si = read_shift_input(tmppath)
-    Path(tmppath).unlink()
-    return si
+    year, month = 2026, 3
+    num_days = calendar.monthrange(year, month)[1]
+    weekdays = [calendar.weekday(year, month, d) for d in range(1, num_days + 1)]
+
+    # (name, type, section, vacation days, contract holidays, unavailable weekdays)
+    presets = [
+        ("川崎聡", EmployeeType.FULL_TIME, Section.PREP, 10, 9, ()),
+        ("斎藤駿児", EmployeeType.FULL_TIME, Section.PREP_LUNCH, 10, 9, ()),
+        ("平田園美", EmployeeType.PART_TIME, Section.PREP, 5, 8, ()),
+        ("島村誠", EmployeeType.FULL_TIME, Section.LUNCH, 10, 9, (2,)),  # 水曜出勤不可
+        ("橋本由紀", EmployeeType.PART_TIME, Section.LUNCH, 5, 8, ()),
+    ]
+
+    base_schedule = np.zeros((len(presets), num_days), dtype=int)
+    employees = []
+    for i, (name, emp_type, section, vacation, holidays, unavailable_wdays) in enumerate(presets):
+        unavailable = [d + 1 for d, w in enumerate(weekdays) if w in unavailable_wdays]
+        base_schedule[i, [d - 1 for d in unavailable]] = 3
+        employees.append(
+            EmployeeInfo(
+                index=i,
+                name=name,
+                required_holidays=holidays,
+                employee_type=emp_type,
+                section=section,
+                available_vacation_days=vacation,
+                unavailable_days=unavailable,
+            )
+        )
+
+    # Kitchen requirement 3, closed on Sat/Sun
+    required = np.array([0 if w in (5, 6) else 3 for w in weekdays])
+
+    return ShiftInput(
+        num_employees=len(presets),
+        num_days=num_days,
+        employee_names=[p[0] for p in presets],
+        employees=employees,
+        required_workers=required,
+        base_schedule=base_schedule,
+        day_labels=[str(d) for d in range(1, num_days + 1)],
+        weekdays=weekdays,
+        required_kitchen_workers=required.copy(),
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_shift_input_from_excel() -> ShiftInput:
+    """Load sample shift input through the Excel template and reader.
+
+    Parsed once per session; only for tests that exercise the reader path.
+    Treat as read-only. The generated workbook is cached in the system temp
+    dir under a name keyed on the generator's source, so later runs skip the
+    write and any change to the generator produces a fresh file.
+    """
+    source_hash = hashlib.blake2b(
+        Path(template_generator.__file__).read_bytes(), digest_size=8
+    ).hexdigest()
+    cached = Path(tempfile.gettempdir()) / f"ga_shift_tmpl_2026_03_{source_hash}.xlsx"
+    if not cached.exists() or cached.stat().st_size == 0:
+        # Write then rename so concurrent runs never read a partial file
+        partial = cached.with_suffix(f".{os.getpid()}.tmp")
+        generate_kimachiya_template(partial, 2026, 3)
+        partial.replace(cached)
+    return read_shift_input(cached)
 
 
 @pytest.fixture
-def small_shift_input() -> ShiftInput:
-    """Create a minimal ShiftInput for fast unit tests."""
+def small_shift_input(shared_small_shift_input: ShiftInput) -> ShiftInput:
+    """Per-test copy of ``shared_small_shift_input`` that tests may modify."""
+    return copy.deepcopy(shared_small_shift_input)
+
+
+@pytest.fixture(scope="session")
+def shared_small_shift_input() -> ShiftInput:
+    """Minimal 3-employee, 7-day ShiftInput, built once per session.
+
+    Read-only: for session/module-scoped fixtures; tests should use ``small_shift_input``.
+    """
     num_employees = 3
     num_days = 7
 
@@ -157,9 +238,9 @@ def kimachi_constraint_set() -> ConstraintSet:
     return ConstraintSet.kimachi_default()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fast_ga_config() -> GAConfig:
-    """Fast GA config for tests."""
+    """Fast GA config for tests (shared; do not modify)."""
     return GAConfig(
         initial_population=20,
         elite_count=5,
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -12,13 +11,20 @@ from ga_shift.models.ga_config import GAConfig
 from ga_shift.models.schedule import ShiftInput
 
 
+@pytest.fixture(scope="module")
+def conductor_result_small(shared_sample_shift_input, tmp_path_factory):
+    """One small pipeline run (with Excel output) shared by the shape checks."""
+    output_path = tmp_path_factory.mktemp("conductor") / "result.xlsx"
+    return ConductorAgent().run_full_pipeline(
+        shift_input=shared_sample_shift_input,
+        ga_config=GAConfig(generation_count=3, initial_population=20, elite_count=5),
+        output_path=str(output_path),
+    )
+
+
 class TestConductorAgent:
-    def test_full_pipeline(self, sample_shift_input):
-        conductor = ConductorAgent()
-        result = conductor.run_full_pipeline(
-            shift_input=sample_shift_input,
-            ga_config=GAConfig(generation_count=5, initial_population=20, elite_count=5),
-        )
+    def test_full_pipeline(self, shared_sample_shift_input, conductor_result_small):
+        result = conductor_result_small
 
         assert "shift_result" in result
         assert "validation_report" in result
@@ -26,25 +32,14 @@ class TestConductorAgent:
         vr = result["validation_report"]
 
         assert sr.best_schedule.shape == (
-            sample_shift_input.num_employees,
-            sample_shift_input.num_days,
+            shared_sample_shift_input.num_employees,
+            shared_sample_shift_input.num_days,
         )
         assert sr.best_score <= 0
         assert vr.total_penalty >= 0
 
-    def test_pipeline_with_excel_output(self, sample_shift_input):
-        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as f:
-            output_path = f.name
-
-        conductor = ConductorAgent()
-        result = conductor.run_full_pipeline(
-            shift_input=sample_shift_input,
-            ga_config=GAConfig(generation_count=3, initial_population=20, elite_count=5),
-            output_path=output_path,
-        )
-
-        assert Path(result["output_path"]).exists()
-        Path(output_path).unlink()
+    def test_pipeline_with_excel_output(self, conductor_result_small):
+        assert Path(conductor_result_small["output_path"]).exists()
 
     def test_pipeline_with_progress(self, sample_shift_input):
         progress_calls = []
@@ -0,0 +1,99 @@
+"""Agno テスト用の共通フィクスチャ.
+
+エージェント/チームの構築はテストごとに繰り返さず、セッション内で一度だけ行う。
+（テストは構築結果を参照するだけで変更しない）
+"""
+
+from __future__ import annotations
+
+import functools
+from collections.abc import Callable
+
+import pytest
+from agno.agent import Agent
+from agno.team import Team
+
+from ga_shift.agno_agents.adjuster import create_adjuster_agent
+from ga_shift.agno_agents.compliance import create_compliance_agent
+from ga_shift.agno_agents.handover import create_handover_agent
+from ga_shift.agno_agents.hearing import create_hearing_agent
+from ga_shift.agno_agents.monitoring import create_monitoring_agent
+from ga_shift.agno_agents.neo4j_bridge import create_neo4j_bridge_agent
+from ga_shift.agno_agents.optimizer import create_optimizer_agent
+from ga_shift.agno_agents.report import create_report_agent
+from ga_shift.agno_agents.simulation import create_simulation_agent
+from ga_shift.agno_agents.team import create_shift_team
+
+
+@pytest.fixture(scope="session")
+def hearing_agent() -> Agent:
+    return create_hearing_agent()
+
+
+@pytest.fixture(scope="session")
+def optimizer_agent() -> Agent:
+    return create_optimizer_agent()
+
+
+@pytest.fixture(scope="session")
+def adjuster_agent() -> Agent:
+    return create_adjuster_agent()
+
+
+@pytest.fixture(scope="session")
+def neo4j_bridge_agent() -> Agent:
+    return create_neo4j_bridge_agent()
+
+
+@pytest.fixture(scope="session")
+def monitoring_agent() -> Agent:
+    return create_monitoring_agent()
+
+
+@pytest.fixture(scope="session")
+def compliance_agent() -> Agent:
+    return create_compliance_agent()
+
+
+@pytest.fixture(scope="session")
+def handover_agent() -> Agent:
+    return create_handover_agent()
+
+
+@pytest.fixture(scope="session")
+def report_agent() -> Agent:
+    return create_report_agent()
+
+
+@pytest.fixture(scope="session")
+def simulation_agent() -> Agent:
+    return create_simulation_agent()
+
+
+@pytest.fixture(scope="session")
+def all_agents(
+    hearing_agent: Agent, optimizer_agent: Agent, adjuster_agent: Agent
+) -> tuple[Agent, Agent, Agent]:
+    """(ヒアリング, 最適化, 調整) の3エージェント。個別フィクスチャと同じインスタンス。"""
+    return hearing_agent, optimizer_agent, adjuster_agent
+
+
+@pytest.fixture(scope="session")
+def team_cache() -> Callable[..., Team]:
+    """create_shift_team の引数の組み合わせごとに一度だけ Team を構築するファクトリ.
+
+    構築は初回要求時に行うため、xdist の各ワーカーは自分が実行するテストで
+    使う組み合わせだけを構築する。
+    """
+    return functools.lru_cache(maxsize=None)(create_shift_team)
+
+
+@pytest.fixture(scope="session")
+def shift_team(team_cache: Callable[..., Team]) -> Team:
+    return team_cache()
+
+
+@pytest.fixture(scope="session")
+def full_team(team_cache: Callable[..., Team]) -> Team:
+    """Neo4j・運用・拡張をすべて有効にした9メンバーの Team."""
+    return team_cache(enable_neo4j=True, enable_ops=True, enable_extended=True)
@@ -6,47 +6,48 @@ APIキーなしで実行可能。エージェント/チームの構築が正し
 
 from __future__ import annotations
 
+import os
+import subprocess
+import sys
+
 import pytest
 
 from agno.agent import Agent
 from agno.team import Team
 
+from ga_shift.agno_agents._mcp import DEFAULT_GA_MCP_COMMAND, _server_params
 from ga_shift.agno_agents.hearing import create_hearing_agent
-from ga_shift.agno_agents.optimizer import create_optimizer_agent
-from ga_shift.agno_agents.adjuster import create_adjuster_agent
 from ga_shift.agno_agents.team import create_shift_team
 
 
+_CORE_MEMBER_NAMES = frozenset({"ヒアリングAgent", "最適化Agent", "調整Agent"})
+
+
 # ===================================================================
 # HearingAgent
 # ===================================================================
 class TestHearingAgent:
-    def test_create_returns_agent(self):
+    def test_create_returns_agent(self, hearing_agent):
         """create_hearing_agent が Agent を返すこと。"""
-        agent = create_hearing_agent()
-        assert isinstance(agent, Agent)
+        assert isinstance(hearing_agent, Agent)
 
-    def test_agent_has_name(self):
+    def test_agent_has_name(self, hearing_agent):
         """Agent に名前が設定されていること。"""
-        agent = create_hearing_agent()
-        assert agent.name == "ヒアリングAgent"
+        assert hearing_agent.name == "ヒアリングAgent"
 
-    def test_agent_has_agent_id(self):
+    def test_agent_has_agent_id(self, hearing_agent):
         """Agent に agent_id が設定されていること。"""
-        agent = create_hearing_agent()
-        assert agent.id == "hearing-agent"
+        assert hearing_agent.id == "hearing-agent"
 
-    def test_agent_has_instructions(self):
+    def test_agent_has_instructions(self, hearing_agent):
         """Agent に日本語の instructions があること。"""
-        agent = create_hearing_agent()
-        assert agent.instructions is not None
-        assert len(agent.instructions) > 0
+        assert hearing_agent.instructions is not None
+        assert len(hearing_agent.instructions) > 0
 
-    def test_agent_has_tools(self):
+    def test_agent_has_tools(self, hearing_agent):
         """Agent に MCPTools がアタッチされていること。"""
-        agent = create_hearing_agent()
-        assert agent.tools is not None
-        assert len(agent.tools) > 0
+        assert hearing_agent.tools is not None
+        assert len(hearing_agent.tools) > 0
 
     def test_agent_with_custom_command(self):
         """カスタムMCPコマンドで作成できること。"""
@@ -58,83 +59,69 @@ class TestHearingAgent:
 # OptimizerAgent
 # ===================================================================
 class TestOptimizerAgent:
-    def test_create_returns_agent(self):
+    def test_create_returns_agent(self, optimizer_agent):
         """create_optimizer_agent が Agent を返すこと。"""
-        agent = create_optimizer_agent()
-        assert isinstance(agent, Agent)
+        assert isinstance(optimizer_agent, Agent)
 
-    def test_agent_has_name(self):
+    def test_agent_has_name(self, optimizer_agent):
         """Agent に名前が設定されていること。"""
-        agent = create_optimizer_agent()
-        assert agent.name == "最適化Agent"
+        assert optimizer_agent.name == "最適化Agent"
 
-    def test_agent_has_agent_id(self):
+    def test_agent_has_agent_id(self, optimizer_agent):
         """Agent に agent_id が設定されていること。"""
-        agent = create_optimizer_agent()
-        assert agent.id == "optimizer-agent"
+        assert optimizer_agent.id == "optimizer-agent"
 
-    def test_agent_has_instructions(self):
+    def test_agent_has_instructions(self, optimizer_agent):
         """Agent に instructions があること。"""
-        agent = create_optimizer_agent()
-        assert agent.instructions is not None
-        assert len(agent.instructions) > 0
+        assert optimizer_agent.instructions is not None
+        assert len(optimizer_agent.instructions) > 0
 
 
 # ===================================================================
 # AdjusterAgent
 # ===================================================================
 class TestAdjusterAgent:
-    def test_create_returns_agent(self):
+    def test_create_returns_agent(self, adjuster_agent):
         """create_adjuster_agent が Agent を返すこと。"""
-        agent = create_adjuster_agent()
-        assert isinstance(agent, Agent)
+        assert isinstance(adjuster_agent, Agent)
 
-    def test_agent_has_name(self):
+    def test_agent_has_name(self, adjuster_agent):
         """Agent に名前が設定されていること。"""
-        agent = create_adjuster_agent()
-        assert agent.name == "調整Agent"
+        assert adjuster_agent.name == "調整Agent"
 
-    def test_agent_has_agent_id(self):
+    def test_agent_has_agent_id(self, adjuster_agent):
         """Agent に agent_id が設定されていること。"""
-        agent = create_adjuster_agent()
-        assert agent.id == "adjuster-agent"
+        assert adjuster_agent.id == "adjuster-agent"
 
-    def test_agent_has_instructions(self):
+    def test_agent_has_instructions(self, adjuster_agent):
         """Agent に instructions があること。"""
-        agent = create_adjuster_agent()
-        assert agent.instructions is not None
-        assert len(agent.instructions) > 0
+        assert adjuster_agent.instructions is not None
+        assert len(adjuster_agent.instructions) > 0
 
 
 # ===================================================================
 # ShiftTeam
 # ===================================================================
 class TestShiftTeam:
-    def test_create_returns_team(self):
+    def test_create_returns_team(self, shift_team):
         """create_shift_team が Team を返すこと。"""
-        team = create_shift_team()
-        assert isinstance(team, Team)
+        assert isinstance(shift_team, Team)
 
-    def test_team_has_name(self):
+    def test_team_has_name(self, shift_team):
         """Team に名前が設定されていること。"""
-        team = create_shift_team()
-        assert team.name == "シフト最適化チーム"
+        assert shift_team.name == "シフト最適化チーム"
 
-    def test_team_has_three_members(self):
+    def test_team_has_three_members(self, shift_team):
         """Team に3つのメンバーがいること。"""
-        team = create_shift_team()
-        assert len(team.members) == 3
+        assert len(shift_team.members) == 3
 
-    def test_team_member_names(self):
+    def test_team_member_names(self, shift_team):
         """Team メンバーの名前が正しいこと。"""
-        team = create_shift_team()
-        member_names = sorted(m.name for m in team.members)
-        assert member_names == ["ヒアリングAgent", "最適化Agent", "調整Agent"]
+        assert {m.name for m in shift_team.members} == _CORE_MEMBER_NAMES
 
-    def test_team_has_model(self):
+    def test_team_has_model(self, shift_team):
         """Team にモデルが設定されていること。"""
-        team = create_shift_team()
-        assert team.model is not None
+        assert shift_team.model is not None
 
     def test_team_with_memory_disabled(self):
         """Memory無効でもTeamが作成できること。"""
@@ -154,47 +141,70 @@ class TestShiftTeam:
             )
             assert isinstance(team, Team)
 
-    def test_team_instructions_contain_key_phrases(self):
+    def test_team_instructions_contain_key_phrases(self, shift_team):
         """Team の instructions に重要なフレーズが含まれていること。"""
-        team = create_shift_team()
-        all_instructions = " ".join(team.instructions)
-
-        assert "ヒアリングAgent" in all_instructions
-        assert "最適化Agent" in all_instructions
-        assert "調整Agent" in all_instructions
-        assert "やさしい日本語" in all_instructions
+        assert any("ヒアリングAgent" in line for line in shift_team.instructions)
+        assert any("最適化Agent" in line for line in shift_team.instructions)
+        assert any("調整Agent" in line for line in shift_team.instructions)
+        assert any("やさしい日本語" in line for line in shift_team.instructions)
 
 
 # ===================================================================
 # クロスエージェントテスト
 # ===================================================================
 class TestAgentConsistency:
-    def test_all_agents_use_same_model(self):
+    def test_all_agents_use_same_model(self, all_agents):
         """全エージェントが同じモデルを使用していること。"""
-        hearing = create_hearing_agent()
-        optimizer = create_optimizer_agent()
-        adjuster = create_adjuster_agent()
-
         # All should use Claude
-        assert hearing.model is not None
-        assert optimizer.model is not None
-        assert adjuster.model is not None
+        assert all(agent.model is not None for agent in all_agents)
 
-    def test_all_agents_have_unique_ids(self):
+    def test_all_agents_have_unique_ids(self, all_agents):
         """全エージェントのIDがユニークであること。"""
-        hearing = create_hearing_agent()
-        optimizer = create_optimizer_agent()
-        adjuster = create_adjuster_agent()
-
-        ids = {hearing.id, optimizer.id, adjuster.id}
+        ids = {agent.id for agent in all_agents}
         assert len(ids) == 3
 
-    def test_all_agents_have_mcp_tools(self):
+    def test_all_agents_have_mcp_tools(self, all_agents):
         """全エージェントにMCPツールがアタッチされていること。"""
-        hearing = create_hearing_agent()
-        optimizer = create_optimizer_agent()
-        adjuster = create_adjuster_agent()
+        assert all(len(agent.tools) > 0 for agent in all_agents)
+
+    def test_agents_do_not_share_mcp_tools(self, all_agents):
+        """同じ起動コマンドでも MCPTools はエージェントごとに別インスタンスであること。"""
+        tools = [agent.tools[0] for agent in all_agents]
+        assert len({id(t) for t in tools}) == len(tools)
+        assert len({t.name for t in tools}) == 1
+
+    def test_agent_construction_does_not_connect_mcp(self, all_agents):
+        """構築時点では MCP サーバーを起動・接続していないこと（接続は実行時）。"""
+        assert all(agent.tools[0].session is None for agent in all_agents)
 
-        assert len(hearing.tools) > 0
-        assert len(optimizer.tools) > 0
-        assert len(adjuster.tools) > 0
+    def test_mcp_command_is_parsed_once(self):
+        """同じ起動コマンドの解析結果はキャッシュされ、使い回されること。"""
+        first = _server_params(DEFAULT_GA_MCP_COMMAND)
+        assert _server_params(DEFAULT_GA_MCP_COMMAND) is first
+        assert first.args[-2:] == ["-m", "ga_shift.mcp.server"]
+
+
+# ===================================================================
+# パッケージの遅延 import
+# ===================================================================
+class TestPackageLazyImport:
+    def test_package_import_does_not_load_agno(self):
+        """ga_shift.agno_agents の import だけでは agno を読み込まないこと。"""
+        code = "import sys, ga_shift.agno_agents; assert 'agno' not in sys.modules"
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        subprocess.run([sys.executable, "-c", code], check=True, env=env)
+
+    def test_lazy_attributes_resolve(self):
+        """パッケージ属性が定義元と同じオブジェクトを返すこと。"""
+        import ga_shift.agno_agents as agno_agents
+
+        assert agno_agents.create_shift_team is create_shift_team
+        assert agno_agents.Agent is Agent
+        with pytest.raises(AttributeError):
+            agno_agents.no_such_factory
+
+    def test_all_matches_lazy_attributes(self):
+        """__all__（静的なリスト）が遅延 import の対応表と一致すること。"""
+        import ga_shift.agno_agents as agno_agents
+
+        assert agno_agents.__all__ == list(agno_agents._LAZY_ATTRS)
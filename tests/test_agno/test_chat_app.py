@@ -6,9 +6,6 @@ Streamlit アプリとしての起動確認（UIレンダリングは行わな
 from __future__ import annotations
 
 import importlib
-import sys
-
-import pytest
 
 
 class TestChatAppImport:
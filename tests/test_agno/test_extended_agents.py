@@ -6,6 +6,8 @@ enable_extended=True 時の Team 統合を検証する。
 
 from __future__ import annotations
 
+from collections import Counter
+
 import pytest
 
 from agno.agent import Agent
@@ -13,197 +15,168 @@ from agno.team import Team
 
 from ga_shift.agno_agents.report import create_report_agent
 from ga_shift.agno_agents.simulation import create_simulation_agent
-from ga_shift.agno_agents.team import create_shift_team
+
+
+_EXTENDED_MEMBER_NAMES = frozenset({
+    "シミュレーションAgent",
+    "ヒアリングAgent",
+    "レポートAgent",
+    "最適化Agent",
+    "調整Agent",
+})
+_ALL_MEMBER_NAMES = frozenset({
+    "Neo4jブリッジAgent",
+    "コンプライアンスAgent",
+    "シミュレーションAgent",
+    "ヒアリングAgent",
+    "モニタリングAgent",
+    "レポートAgent",
+    "引き継ぎAgent",
+    "最適化Agent",
+    "調整Agent",
+})
 
 
 # ===================================================================
 # ReportAgent
 # ===================================================================
 class TestReportAgent:
-    def test_create_returns_agent(self):
+    def test_create_returns_agent(self, report_agent):
         """create_report_agent が Agent を返すこと。"""
-        agent = create_report_agent()
-        assert isinstance(agent, Agent)
+        assert isinstance(report_agent, Agent)
 
-    def test_agent_has_name(self):
+    def test_agent_has_name(self, report_agent):
         """Agent に名前が設定されていること。"""
-        agent = create_report_agent()
-        assert agent.name == "レポートAgent"
+        assert report_agent.name == "レポートAgent"
 
-    def test_agent_has_id(self):
+    def test_agent_has_id(self, report_agent):
         """Agent に id が設定されていること。"""
-        agent = create_report_agent()
-        assert agent.id == "report-agent"
+        assert report_agent.id == "report-agent"
 
-    def test_agent_has_instructions(self):
+    def test_agent_has_instructions(self, report_agent):
         """Agent に日本語の instructions があること。"""
-        agent = create_report_agent()
-        assert agent.instructions is not None
-        assert len(agent.instructions) > 0
+        assert report_agent.instructions is not None
+        assert len(report_agent.instructions) > 0
 
-    def test_agent_has_tools(self):
+    def test_agent_has_tools(self, report_agent):
         """Agent に MCPTools がアタッチされていること。"""
-        agent = create_report_agent()
-        assert agent.tools is not None
-        assert len(agent.tools) > 0
+        assert report_agent.tools is not None
+        assert len(report_agent.tools) > 0
 
     def test_agent_with_custom_command(self):
         """カスタムMCPコマンドで作成できること。"""
         agent = create_report_agent(mcp_server_command="echo test")
         assert isinstance(agent, Agent)
 
-    def test_instructions_mention_report(self):
-        """instructions にレポート生成に関する記述があること。"""
-        agent = create_report_agent()
-        all_instr = " ".join(agent.instructions)
-        assert "レポート" in all_instr
-
-    def test_instructions_mention_generate_shift_report(self):
-        """instructions に generate_shift_report ツールの記述があること。"""
-        agent = create_report_agent()
-        all_instr = " ".join(agent.instructions)
-        assert "generate_shift_report" in all_instr
+    @pytest.mark.parametrize(
+        "needles",
+        [
+            pytest.param(("レポート",), id="report"),
+            pytest.param(("generate_shift_report",), id="generate_shift_report"),
+        ],
+    )
+    def test_instructions_mention(self, report_agent, needles):
+        """instructions にいずれかの語句を含む行があること。"""
+        assert any(n in line for line in report_agent.instructions for n in needles)
 
 
 # ===================================================================
 # SimulationAgent
 # ===================================================================
 class TestSimulationAgent:
-    def test_create_returns_agent(self):
+    def test_create_returns_agent(self, simulation_agent):
         """create_simulation_agent が Agent を返すこと。"""
-        agent = create_simulation_agent()
-        assert isinstance(agent, Agent)
+        assert isinstance(simulation_agent, Agent)
 
-    def test_agent_has_name(self):
+    def test_agent_has_name(self, simulation_agent):
         """Agent に名前が設定されていること。"""
-        agent = create_simulation_agent()
-        assert agent.name == "シミュレーションAgent"
+        assert simulation_agent.name == "シミュレーションAgent"
 
-    def test_agent_has_id(self):
+    def test_agent_has_id(self, simulation_agent):
         """Agent に id が設定されていること。"""
-        agent = create_simulation_agent()
-        assert agent.id == "simulation-agent"
+        assert simulation_agent.id == "simulation-agent"
 
-    def test_agent_has_instructions(self):
+    def test_agent_has_instructions(self, simulation_agent):
         """Agent に instructions があること。"""
-        agent = create_simulation_agent()
-        assert agent.instructions is not None
-        assert len(agent.instructions) > 0
+        assert simulation_agent.instructions is not None
+        assert len(simulation_agent.instructions) > 0
 
-    def test_agent_has_tools(self):
+    def test_agent_has_tools(self, simulation_agent):
         """Agent に MCPTools がアタッチされていること。"""
-        agent = create_simulation_agent()
-        assert agent.tools is not None
-        assert len(agent.tools) > 0
+        assert simulation_agent.tools is not None
+        assert len(simulation_agent.tools) > 0
 
     def test_agent_with_custom_command(self):
         """カスタムMCPコマンドで作成できること。"""
         agent = create_simulation_agent(mcp_server_command="echo test")
         assert isinstance(agent, Agent)
 
-    def test_instructions_mention_scenario(self):
-        """instructions にシナリオシミュレーションに関する記述があること。"""
-        agent = create_simulation_agent()
-        all_instr = " ".join(agent.instructions)
-        assert "シナリオ" in all_instr or "simulate" in all_instr.lower()
-
-    def test_instructions_mention_simulate_scenario(self):
-        """instructions に simulate_scenario ツールの記述があること。"""
-        agent = create_simulation_agent()
-        all_instr = " ".join(agent.instructions)
-        assert "simulate_scenario" in all_instr
+    @pytest.mark.parametrize(
+        "needles",
+        [
+            pytest.param(("シナリオ", "simulate"), id="scenario"),
+            pytest.param(("simulate_scenario",), id="simulate_scenario"),
+        ],
+    )
+    def test_instructions_mention(self, simulation_agent, needles):
+        """instructions にいずれかの語句を含む行があること。"""
+        assert any(n in line for line in simulation_agent.instructions for n in needles)
 
 
 # ===================================================================
 # ShiftTeam with extended agents
 # ===================================================================
 class TestShiftTeamWithExtended:
-    def test_team_without_extended(self):
+    def test_team_without_extended(self, team_cache):
         """enable_extended=False で3メンバーのTeamが作成されること。"""
-        team = create_shift_team(enable_extended=False)
+        team = team_cache(enable_extended=False)
         assert len(team.members) == 3
 
-    def test_team_with_extended(self):
+    def test_team_with_extended(self, team_cache):
         """enable_extended=True で5メンバーのTeamが作成されること。"""
-        team = create_shift_team(enable_extended=True)
+        team = team_cache(enable_extended=True)
         assert len(team.members) == 5
 
-    def test_team_with_extended_member_names(self):
+    def test_team_with_extended_member_names(self, team_cache):
         """enable_extended=True のメンバー名が正しいこと。"""
-        team = create_shift_team(enable_extended=True)
-        member_names = sorted(m.name for m in team.members)
-        assert member_names == [
-            "シミュレーションAgent",
-            "ヒアリングAgent",
-            "レポートAgent",
-            "最適化Agent",
-            "調整Agent",
-        ]
-
-    def test_team_with_extended_returns_team(self):
+        team = team_cache(enable_extended=True)
+        assert {m.name for m in team.members} == _EXTENDED_MEMBER_NAMES
+
+    def test_team_with_extended_returns_team(self, team_cache):
         """enable_extended=True でも Team を返すこと。"""
-        team = create_shift_team(enable_extended=True)
+        team = team_cache(enable_extended=True)
         assert isinstance(team, Team)
 
-    def test_team_with_extended_instructions(self):
+    def test_team_with_extended_instructions(self, team_cache):
         """enable_extended=True の instructions にレポート・シミュレーション関連のルーティングがあること。"""
-        team = create_shift_team(enable_extended=True)
-        all_instr = " ".join(team.instructions)
-        assert "レポートAgent" in all_instr
-        assert "シミュレーションAgent" in all_instr
+        team = team_cache(enable_extended=True)
+        assert any("レポートAgent" in line for line in team.instructions)
+        assert any("シミュレーションAgent" in line for line in team.instructions)
 
-    def test_team_without_extended_no_extended_instructions(self):
+    def test_team_without_extended_no_extended_instructions(self, team_cache):
         """enable_extended=False の instructions に拡張Agent記述がないこと。"""
-        team = create_shift_team(enable_extended=False)
-        all_instr = " ".join(team.instructions)
-        assert "レポートAgent" not in all_instr
-        assert "シミュレーションAgent" not in all_instr
+        team = team_cache(enable_extended=False)
+        assert not any("レポートAgent" in line for line in team.instructions)
+        assert not any("シミュレーションAgent" in line for line in team.instructions)
 
-    def test_team_with_all_options(self):
+    def test_team_with_all_options(self, full_team):
         """全オプション有効時に9メンバーになること。"""
-        team = create_shift_team(
-            enable_neo4j=True,
-            enable_ops=True,
-            enable_extended=True,
-        )
-        assert len(team.members) == 9
-
-    def test_team_with_all_options_member_names(self):
+        assert len(full_team.members) == 9
+
+    def test_team_with_all_options_member_names(self, full_team):
         """全オプション有効時のメンバー名が正しいこと。"""
-        team = create_shift_team(
-            enable_neo4j=True,
-            enable_ops=True,
-            enable_extended=True,
-        )
-        member_names = sorted(m.name for m in team.members)
-        assert member_names == [
-            "Neo4jブリッジAgent",
-            "コンプライアンスAgent",
-            "シミュレーションAgent",
-            "ヒアリングAgent",
-            "モニタリングAgent",
-            "レポートAgent",
-            "引き継ぎAgent",
-            "最適化Agent",
-            "調整Agent",
-        ]
-
-    def test_team_with_all_options_instructions(self):
+        assert {m.name for m in full_team.members} == _ALL_MEMBER_NAMES
+
+    def test_team_with_all_options_instructions(self, full_team):
         """全オプション有効時に全メンバーのルーティングがあること。"""
-        team = create_shift_team(
-            enable_neo4j=True,
-            enable_ops=True,
-            enable_extended=True,
-        )
-        all_instr = " ".join(team.instructions)
-        assert "Neo4jブリッジAgent" in all_instr
-        assert "モニタリングAgent" in all_instr
-        assert "レポートAgent" in all_instr
-        assert "シミュレーションAgent" in all_instr
-
-    def test_team_ops_and_extended(self):
+        assert any("Neo4jブリッジAgent" in line for line in full_team.instructions)
+        assert any("モニタリングAgent" in line for line in full_team.instructions)
+        assert any("レポートAgent" in line for line in full_team.instructions)
+        assert any("シミュレーションAgent" in line for line in full_team.instructions)
+
+    def test_team_ops_and_extended(self, team_cache):
         """enable_ops=True + enable_extended=True で8メンバーになること。"""
-        team = create_shift_team(enable_ops=True, enable_extended=True)
+        team = team_cache(enable_ops=True, enable_extended=True)
         assert len(team.members) == 8
 
 
@@ -211,26 +184,17 @@ class TestShiftTeamWithExtended:
 # クロスエージェントテスト（拡張Agent群）
 # ===================================================================
 class TestExtendedAgentConsistency:
-    def test_all_extended_agents_have_unique_ids(self):
+    def test_all_extended_agents_have_unique_ids(self, report_agent, simulation_agent):
         """拡張Agent群のIDがすべてユニークであること。"""
-        report = create_report_agent()
-        simulation = create_simulation_agent()
-        ids = {report.id, simulation.id}
+        ids = {report_agent.id, simulation_agent.id}
         assert len(ids) == 2
 
-    def test_all_agents_have_unique_ids_with_all(self):
+    def test_all_agents_have_unique_ids_with_all(self, full_team):
         """全Agent（コア + neo4j + 運用 + 拡張）のIDがすべてユニークであること。"""
-        team = create_shift_team(
-            enable_neo4j=True,
-            enable_ops=True,
-            enable_extended=True,
-        )
-        ids = [m.id for m in team.members]
-        assert len(ids) == len(set(ids))
-
-    def test_all_extended_agents_have_model(self):
+        counts = Counter(m.id for m in full_team.members)
+        assert [agent_id for agent_id, n in counts.items() if n > 1] == []
+
+    def test_all_extended_agents_have_model(self, report_agent, simulation_agent):
         """拡張Agent群すべてにモデルが設定されていること。"""
-        report = create_report_agent()
-        simulation = create_simulation_agent()
-        assert report.model is not None
-        assert simulation.model is not None
+        assert report_agent.model is not None
+        assert simulation_agent.model is not None
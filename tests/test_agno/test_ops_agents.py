@@ -6,6 +6,8 @@ enable_ops=True 時の Team 統合を検証する。
 
 from __future__ import annotations
 
+from collections import Counter
+
 import pytest
 
 from agno.agent import Agent
@@ -14,241 +16,216 @@ from agno.team import Team
 from ga_shift.agno_agents.monitoring import create_monitoring_agent
 from ga_shift.agno_agents.compliance import create_compliance_agent
 from ga_shift.agno_agents.handover import create_handover_agent
-from ga_shift.agno_agents.team import create_shift_team
+
+
+_OPS_MEMBER_NAMES = frozenset({
+    "コンプライアンスAgent",
+    "ヒアリングAgent",
+    "モニタリングAgent",
+    "引き継ぎAgent",
+    "最適化Agent",
+    "調整Agent",
+})
 
 
 # ===================================================================
 # MonitoringAgent
 # ===================================================================
 class TestMonitoringAgent:
-    def test_create_returns_agent(self):
+    def test_create_returns_agent(self, monitoring_agent):
         """create_monitoring_agent が Agent を返すこと。"""
-        agent = create_monitoring_agent()
-        assert isinstance(agent, Agent)
+        assert isinstance(monitoring_agent, Agent)
 
-    def test_agent_has_name(self):
+    def test_agent_has_name(self, monitoring_agent):
         """Agent に名前が設定されていること。"""
-        agent = create_monitoring_agent()
-        assert agent.name == "モニタリングAgent"
+        assert monitoring_agent.name == "モニタリングAgent"
 
-    def test_agent_has_id(self):
+    def test_agent_has_id(self, monitoring_agent):
         """Agent に id が設定されていること。"""
-        agent = create_monitoring_agent()
-        assert agent.id == "monitoring-agent"
+        assert monitoring_agent.id == "monitoring-agent"
 
-    def test_agent_has_instructions(self):
+    def test_agent_has_instructions(self, monitoring_agent):
         """Agent に日本語の instructions があること。"""
-        agent = create_monitoring_agent()
-        assert agent.instructions is not None
-        assert len(agent.instructions) > 0
+        assert monitoring_agent.instructions is not None
+        assert len(monitoring_agent.instructions) > 0
 
-    def test_agent_has_tools(self):
+    def test_agent_has_tools(self, monitoring_agent):
         """Agent に MCPTools がアタッチされていること。"""
-        agent = create_monitoring_agent()
-        assert agent.tools is not None
-        assert len(agent.tools) > 0
+        assert monitoring_agent.tools is not None
+        assert len(monitoring_agent.tools) > 0
 
     def test_agent_with_custom_command(self):
         """カスタムMCPコマンドで作成できること。"""
         agent = create_monitoring_agent(mcp_server_command="echo test")
         assert isinstance(agent, Agent)
 
-    def test_instructions_mention_fairness(self):
-        """instructions に公平性分析に関する記述があること。"""
-        agent = create_monitoring_agent()
-        all_instr = " ".join(agent.instructions)
-        assert "公平性" in all_instr or "偏り" in all_instr
-
-    def test_instructions_mention_consecutive(self):
-        """instructions に連続勤務に関する記述があること。"""
-        agent = create_monitoring_agent()
-        all_instr = " ".join(agent.instructions)
-        assert "連続勤務" in all_instr
+    @pytest.mark.parametrize(
+        "needles",
+        [
+            pytest.param(("公平性", "偏り"), id="fairness"),
+            pytest.param(("連続勤務",), id="consecutive"),
+        ],
+    )
+    def test_instructions_mention(self, monitoring_agent, needles):
+        """instructions にいずれかの語句を含む行があること。"""
+        assert any(n in line for line in monitoring_agent.instructions for n in needles)
 
 
 # ===================================================================
 # ComplianceAgent
 # ===================================================================
 class TestComplianceAgent:
-    def test_create_returns_agent(self):
+    def test_create_returns_agent(self, compliance_agent):
         """create_compliance_agent が Agent を返すこと。"""
-        agent = create_compliance_agent()
-        assert isinstance(agent, Agent)
+        assert isinstance(compliance_agent, Agent)
 
-    def test_agent_has_name(self):
+    def test_agent_has_name(self, compliance_agent):
         """Agent に名前が設定されていること。"""
-        agent = create_compliance_agent()
-        assert agent.name == "コンプライアンスAgent"
+        assert compliance_agent.name == "コンプライアンスAgent"
 
-    def test_agent_has_id(self):
+    def test_agent_has_id(self, compliance_agent):
         """Agent に id が設定されていること。"""
-        agent = create_compliance_agent()
-        assert agent.id == "compliance-agent"
+        assert compliance_agent.id == "compliance-agent"
 
-    def test_agent_has_instructions(self):
+    def test_agent_has_instructions(self, compliance_agent):
         """Agent に instructions があること。"""
-        agent = create_compliance_agent()
-        assert agent.instructions is not None
-        assert len(agent.instructions) > 0
+        assert compliance_agent.instructions is not None
+        assert len(compliance_agent.instructions) > 0
 
-    def test_agent_has_tools(self):
+    def test_agent_has_tools(self, compliance_agent):
         """Agent に MCPTools がアタッチされていること。"""
-        agent = create_compliance_agent()
-        assert agent.tools is not None
-        assert len(agent.tools) > 0
+        assert compliance_agent.tools is not None
+        assert len(compliance_agent.tools) > 0
 
     def test_agent_with_custom_command(self):
         """カスタムMCPコマンドで作成できること。"""
         agent = create_compliance_agent(mcp_server_command="echo test")
         assert isinstance(agent, Agent)
 
-    def test_instructions_mention_staffing_standards(self):
-        """instructions に人員配置基準に関する記述があること。"""
-        agent = create_compliance_agent()
-        all_instr = " ".join(agent.instructions)
-        assert "人員配置" in all_instr
-
-    def test_instructions_mention_b_type(self):
-        """instructions に就労継続支援B型に関する記述があること。"""
-        agent = create_compliance_agent()
-        all_instr = " ".join(agent.instructions)
-        assert "就労継続支援B型" in all_instr
+    @pytest.mark.parametrize(
+        "needles",
+        [
+            pytest.param(("人員配置",), id="staffing_standards"),
+            pytest.param(("就労継続支援B型",), id="b_type"),
+        ],
+    )
+    def test_instructions_mention(self, compliance_agent, needles):
+        """instructions にいずれかの語句を含む行があること。"""
+        assert any(n in line for line in compliance_agent.instructions for n in needles)
 
 
 # ===================================================================
 # HandoverAgent
 # ===================================================================
 class TestHandoverAgent:
-    def test_create_returns_agent(self):
+    def test_create_returns_agent(self, handover_agent):
         """create_handover_agent が Agent を返すこと。"""
-        agent = create_handover_agent()
-        assert isinstance(agent, Agent)
+        assert isinstance(handover_agent, Agent)
 
-    def test_agent_has_name(self):
+    def test_agent_has_name(self, handover_agent):
         """Agent に名前が設定されていること。"""
-        agent = create_handover_agent()
-        assert agent.name == "引き継ぎAgent"
+        assert handover_agent.name == "引き継ぎAgent"
 
-    def test_agent_has_id(self):
+    def test_agent_has_id(self, handover_agent):
         """Agent に id が設定されていること。"""
-        agent = create_handover_agent()
-        assert agent.id == "handover-agent"
+        assert handover_agent.id == "handover-agent"
 
-    def test_agent_has_instructions(self):
+    def test_agent_has_instructions(self, handover_agent):
         """Agent に instructions があること。"""
-        agent = create_handover_agent()
-        assert agent.instructions is not None
-        assert len(agent.instructions) > 0
+        assert handover_agent.instructions is not None
+        assert len(handover_agent.instructions) > 0
 
-    def test_agent_has_tools(self):
+    def test_agent_has_tools(self, handover_agent):
         """Agent に MCPTools がアタッチされていること。"""
-        agent = create_handover_agent()
-        assert agent.tools is not None
-        assert len(agent.tools) > 0
+        assert handover_agent.tools is not None
+        assert len(handover_agent.tools) > 0
 
     def test_agent_with_custom_command(self):
         """カスタムMCPコマンドで作成できること。"""
         agent = create_handover_agent(mcp_server_command="echo test")
         assert isinstance(agent, Agent)
 
-    def test_instructions_mention_transfer(self):
-        """instructions に人事異動に関する記述があること。"""
-        agent = create_handover_agent()
-        all_instr = " ".join(agent.instructions)
-        assert "入退社" in all_instr or "異動" in all_instr
-
-    def test_instructions_mention_transfer_staff(self):
-        """instructions に transfer_staff ツールの記述があること。"""
-        agent = create_handover_agent()
-        all_instr = " ".join(agent.instructions)
-        assert "transfer_staff" in all_instr
+    @pytest.mark.parametrize(
+        "needles",
+        [
+            pytest.param(("入退社", "異動"), id="transfer"),
+            pytest.param(("transfer_staff",), id="transfer_staff"),
+        ],
+    )
+    def test_instructions_mention(self, handover_agent, needles):
+        """instructions にいずれかの語句を含む行があること。"""
+        assert any(n in line for line in handover_agent.instructions for n in needles)
 
 
 # ===================================================================
 # ShiftTeam with ops agents
 # ===================================================================
 class TestShiftTeamWithOps:
-    def test_team_without_ops(self):
+    def test_team_without_ops(self, team_cache):
         """enable_ops=False で3メンバーのTeamが作成されること。"""
-        team = create_shift_team(enable_ops=False)
+        team = team_cache(enable_ops=False)
         assert len(team.members) == 3
 
-    def test_team_with_ops(self):
+    def test_team_with_ops(self, team_cache):
         """enable_ops=True で6メンバーのTeamが作成されること。"""
-        team = create_shift_team(enable_ops=True)
+        team = team_cache(enable_ops=True)
         assert len(team.members) == 6
 
-    def test_team_with_ops_member_names(self):
+    def test_team_with_ops_member_names(self, team_cache):
         """enable_ops=True のメンバー名が正しいこと。"""
-        team = create_shift_team(enable_ops=True)
-        member_names = sorted(m.name for m in team.members)
-        assert member_names == [
-            "コンプライアンスAgent",
-            "ヒアリングAgent",
-            "モニタリングAgent",
-            "引き継ぎAgent",
-            "最適化Agent",
-            "調整Agent",
-        ]
-
-    def test_team_with_ops_returns_team(self):
+        team = team_cache(enable_ops=True)
+        assert {m.name for m in team.members} == _OPS_MEMBER_NAMES
+
+    def test_team_with_ops_returns_team(self, team_cache):
         """enable_ops=True でも Team を返すこと。"""
-        team = create_shift_team(enable_ops=True)
+        team = team_cache(enable_ops=True)
         assert isinstance(team, Team)
 
-    def test_team_with_ops_instructions(self):
+    def test_team_with_ops_instructions(self, team_cache):
         """enable_ops=True の instructions にモニタリング関連のルーティングがあること。"""
-        team = create_shift_team(enable_ops=True)
-        all_instr = " ".join(team.instructions)
-        assert "モニタリングAgent" in all_instr
-        assert "コンプライアンスAgent" in all_instr
-        assert "引き継ぎAgent" in all_instr
+        team = team_cache(enable_ops=True)
+        assert any("モニタリングAgent" in line for line in team.instructions)
+        assert any("コンプライアンスAgent" in line for line in team.instructions)
+        assert any("引き継ぎAgent" in line for line in team.instructions)
 
-    def test_team_without_ops_no_ops_instructions(self):
+    def test_team_without_ops_no_ops_instructions(self, team_cache):
         """enable_ops=False の instructions に運用Agent記述がないこと。"""
-        team = create_shift_team(enable_ops=False)
-        all_instr = " ".join(team.instructions)
-        assert "モニタリングAgent" not in all_instr
-        assert "コンプライアンスAgent" not in all_instr
-        assert "引き継ぎAgent" not in all_instr
+        team = team_cache(enable_ops=False)
+        assert not any("モニタリングAgent" in line for line in team.instructions)
+        assert not any("コンプライアンスAgent" in line for line in team.instructions)
+        assert not any("引き継ぎAgent" in line for line in team.instructions)
 
-    def test_team_with_both_neo4j_and_ops(self):
+    def test_team_with_both_neo4j_and_ops(self, team_cache):
         """enable_neo4j=True + enable_ops=True で7メンバーになること。"""
-        team = create_shift_team(enable_neo4j=True, enable_ops=True)
+        team = team_cache(enable_neo4j=True, enable_ops=True)
         assert len(team.members) == 7
 
-    def test_team_with_both_instructions(self):
+    def test_team_with_both_instructions(self, team_cache):
         """両方有効時に全メンバーのルーティングがあること。"""
-        team = create_shift_team(enable_neo4j=True, enable_ops=True)
-        all_instr = " ".join(team.instructions)
-        assert "Neo4jブリッジAgent" in all_instr
-        assert "モニタリングAgent" in all_instr
-        assert "引き継ぎAgent" in all_instr
+        team = team_cache(enable_neo4j=True, enable_ops=True)
+        assert any("Neo4jブリッジAgent" in line for line in team.instructions)
+        assert any("モニタリングAgent" in line for line in team.instructions)
+        assert any("引き継ぎAgent" in line for line in team.instructions)
 
 
 # ===================================================================
 # クロスエージェントテスト（運用Agent群）
 # ===================================================================
 class TestOpsAgentConsistency:
-    def test_all_ops_agents_have_unique_ids(self):
+    def test_all_ops_agents_have_unique_ids(
+        self, monitoring_agent, compliance_agent, handover_agent
+    ):
         """運用Agent群のIDがすべてユニークであること。"""
-        monitoring = create_monitoring_agent()
-        compliance = create_compliance_agent()
-        handover = create_handover_agent()
-        ids = {monitoring.id, compliance.id, handover.id}
+        ids = {monitoring_agent.id, compliance_agent.id, handover_agent.id}
         assert len(ids) == 3
 
-    def test_all_agents_have_unique_ids_with_core(self):
+    def test_all_agents_have_unique_ids_with_core(self, team_cache):
         """全Agent（コア + 運用）のIDがすべてユニークであること。"""
-        team = create_shift_team(enable_ops=True)
-        ids = [m.id for m in team.members]
-        assert len(ids) == len(set(ids))
+        counts = Counter(m.id for m in team_cache(enable_ops=True).members)
+        assert [agent_id for agent_id, n in counts.items() if n > 1] == []
 
-    def test_all_ops_agents_have_model(self):
+    def test_all_ops_agents_have_model(self, monitoring_agent, compliance_agent, handover_agent):
         """運用Agent群すべてにモデルが設定されていること。"""
-        monitoring = create_monitoring_agent()
-        compliance = create_compliance_agent()
-        handover = create_handover_agent()
-        assert monitoring.model is not None
-        assert compliance.model is not None
-        assert handover.model is not None
+        assert monitoring_agent.model is not None
+        assert compliance_agent.model is not None
+        assert handover_agent.model is not None
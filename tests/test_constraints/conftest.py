@@ -0,0 +1,38 @@
+"""Fixtures shared by the constraint tests."""
+
+from __future__ import annotations
+
+import functools
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from ga_shift.constraints._kernels import warmup
+from ga_shift.constraints.base import ConstraintTemplate, PenaltyFunction
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup_kernels() -> None:
+    """Pay the numba compile cost once, before the first constraint test runs."""
+    warmup()
+
+
+@pytest.fixture(scope="session")
+def compiled_constraint() -> Callable[[type[ConstraintTemplate], dict[str, Any]], PenaltyFunction]:
+    """Compile each (template class, params) pair once per session.
+
+    Compiled penalty functions are pure functions of the ScheduleContext, so
+    tests with identical parameters can share them.
+    """
+
+    @functools.lru_cache(maxsize=None)
+    def _compile(
+        template_cls: type[ConstraintTemplate], items: tuple[tuple[str, Any], ...]
+    ) -> PenaltyFunction:
+        return template_cls().compile(dict(items))
+
+    def compile_(template_cls: type[ConstraintTemplate], params: dict[str, Any]) -> PenaltyFunction:
+        return _compile(template_cls, tuple(sorted(params.items())))
+
+    return compile_
@@ -0,0 +1,89 @@
+"""Tests for constraint base types."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from ga_shift.constraints.base import PenaltyResult, rowwise_delta, rowwise_penalty
+from ga_shift.models.schedule import ScheduleContext
+
+
+class TestPenaltyResult:
+    def test_plain_details(self):
+        assert PenaltyResult(penalty=1.0, details="x").details == "x"
+        assert PenaltyResult().details == ""
+
+    def test_callable_details_are_formatted_once_on_first_read(self):
+        calls = []
+
+        def format_details() -> str:
+            calls.append(1)
+            return "formatted"
+
+        result = PenaltyResult(penalty=1.0, details=format_details)
+        assert calls == []
+        assert result.details == "formatted"
+        assert result.details == "formatted"
+        assert calls == [1]
+
+
+def _holiday_count_rows(calls: list):
+    """Rows function: penalty = holidays per row, detail only for rows with holidays."""
+
+    def rows_fn(binary, emp_indices):
+        calls.append(None if emp_indices is None else list(emp_indices))
+        indices = range(len(binary)) if emp_indices is None else emp_indices
+        rows = binary if emp_indices is None else binary[emp_indices]
+        counts = rows.sum(axis=1).astype(np.float64)
+        return counts, [f"e{i}={int(c)}" if c else "" for i, c in zip(indices, counts)]
+
+    return rows_fn
+
+
+_PREV = np.array([[0, 1, 0], [0, 0, 0], [1, 1, 0]], dtype=np.int8)
+
+
+class TestRowwiseHelpers:
+    def test_penalty_scores_all_rows_in_one_call(self, small_shift_input):
+        calls = []
+        ctx = ScheduleContext(schedule=_PREV, shift_input=small_shift_input)
+        result = rowwise_penalty(ctx, _holiday_count_rows(calls))
+        assert calls == [None]
+        assert result.penalty == 3.0
+        assert result.row_penalties.tolist() == [1.0, 0.0, 2.0]
+        assert result.row_details == ["e0=1", "", "e2=2"]
+        assert result.details == "e0=1; e2=2"
+
+    def test_delta_rescores_only_touched_rows(self, small_shift_input):
+        calls = []
+        rows_fn = _holiday_count_rows(calls)
+        prev = rowwise_penalty(
+            ScheduleContext(schedule=_PREV, shift_input=small_shift_input), rows_fn
+        )
+        schedule = _PREV.copy()
+        schedule[1, 0] = 1
+        schedule[2, 0] = 0
+        schedule[2, 1] = 0
+        ctx = ScheduleContext(
+            schedule=schedule,
+            shift_input=small_shift_input,
+            prev_schedule=_PREV,
+            changed_cells=[(2, 0), (1, 0), (2, 1)],
+        )
+        result = rowwise_delta(ctx, prev, rows_fn)
+        assert calls == [None, [1, 2]]
+        assert result.penalty == 2.0
+        assert result.row_penalties.tolist() == [1.0, 1.0, 0.0]
+        assert result.details == "e0=1; e1=1"
+        # The previous result's caches are left untouched
+        assert prev.row_penalties.tolist() == [1.0, 0.0, 2.0]
+        assert prev.row_details == ["e0=1", "", "e2=2"]
+
+    def test_delta_without_row_cache_falls_back_to_full(self, small_shift_input):
+        calls = []
+        ctx = ScheduleContext(
+            schedule=_PREV, shift_input=small_shift_input, changed_cells=[(0, 0)]
+        )
+        result = rowwise_delta(ctx, PenaltyResult(penalty=99.0), _holiday_count_rows(calls))
+        assert calls == [None]
+        assert result.penalty == 3.0
@@ -5,36 +5,62 @@ from __future__ import annotations
 import numpy as np
 import pytest
 
+from ga_shift.constraints.base import PenaltyFunction
 from ga_shift.constraints.day_constraints import RequiredWorkersMatch
 from ga_shift.models.schedule import ScheduleContext
 
+# 3 employees, required=2 → exactly 1 person off per day
+_PERFECT_MATCH = np.array([
+    [0, 0, 1, 0, 0, 1, 0],
+    [0, 1, 0, 0, 1, 0, 0],
+    [1, 0, 0, 1, 0, 0, 1],
+], dtype=np.int8)
+# All workers present every day → 3 workers vs required 2
+_ALL_PRESENT = np.zeros((3, 7), dtype=np.int8)
+_PERFECT_MATCH.setflags(write=False)
+_ALL_PRESENT.setflags(write=False)
+
+
+@pytest.fixture(scope="module")
+def required_workers_fn() -> PenaltyFunction:
+    return RequiredWorkersMatch().compile({"penalty_per_diff": 4.0})
+
 
 class TestRequiredWorkersMatch:
-    def test_perfect_match_no_penalty(self, small_shift_input):
-        # 3 employees, required=2 → 1 person off per day
-        schedule = np.array([
-            [0, 0, 0, 0, 0, 1, 1],
-            [1, 0, 0, 0, 0, 0, 1],
-            [0, 1, 1, 1, 1, 0, 0],  # This doesn't match perfectly, but let's test
-        ])
-        # Actually make it match: 2 workers each day
+    @pytest.mark.parametrize(
+        ("schedule", "expected"),
+        [
+            pytest.param(_PERFECT_MATCH, 0.0, id="perfect_match_no_penalty"),
+            # Each day: diff=1 → penalty = 7 * 4.0 = 28.0
+            pytest.param(_ALL_PRESENT, 28.0, id="penalty_for_mismatch"),
+        ],
+    )
+    def test_penalty(self, required_workers_fn, small_shift_input, schedule, expected):
+        ctx = ScheduleContext(schedule=schedule, shift_input=small_shift_input)
+        np.testing.assert_allclose(required_workers_fn(ctx).penalty, expected, atol=1e-9)
+
+
+class TestScheduleContextWorkersPerDay:
+    def test_counts_workers_and_is_cached(self, small_shift_input):
         schedule = np.array([
-            [0, 0, 1, 0, 0, 1, 0],
-            [0, 1, 0, 0, 1, 0, 0],
-            [1, 0, 0, 1, 0, 0, 1],
-        ])
+            [0, 2, 1, 0, 0, 0, 0],
+            [0, 0, 3, 0, 1, 0, 0],
+            [1, 0, 0, 0, 0, 0, 0],
+        ], dtype=np.int8)
         ctx = ScheduleContext(schedule=schedule, shift_input=small_shift_input)
-        template = RequiredWorkersMatch()
-        fn = template.compile({"penalty_per_diff": 4.0})
-        result = fn(ctx)
-        assert result.penalty == 0.0
-
-    def test_penalty_for_mismatch(self, small_shift_input):
-        # All workers present every day → 3 workers vs required 2
-        schedule = np.zeros((3, 7), dtype=int)
+        assert ctx.workers_per_day.tolist() == [2, 2, 1, 3, 2, 3, 3]
+        assert ctx.workers_per_day is ctx.workers_per_day
+
+    def test_schedule_is_coerced_to_contiguous_int8(self, small_shift_input):
+        schedule = np.asfortranarray(_ALL_PRESENT.astype(np.int64))
         ctx = ScheduleContext(schedule=schedule, shift_input=small_shift_input)
-        template = RequiredWorkersMatch()
-        fn = template.compile({"penalty_per_diff": 4.0})
-        result = fn(ctx)
-        # Each day: 3 workers vs 2 required → diff=1 → penalty = 7 * 4.0 = 28.0
-        assert result.penalty == 28.0
+        assert ctx.schedule.dtype == np.int8
+        assert ctx.schedule.flags.c_contiguous
+
+    def test_with_schedule_shares_shift_input_and_resets_caches(self, small_shift_input):
+        ctx = ScheduleContext(schedule=_ALL_PRESENT, shift_input=small_shift_input)
+        assert ctx.workers_per_day.tolist() == [3] * 7
+        other = ctx.with_schedule(_PERFECT_MATCH)
+        assert other.shift_input is ctx.shift_input
+        assert other.schedule is _PERFECT_MATCH
+        assert other.workers_per_day.tolist() == [2] * 7
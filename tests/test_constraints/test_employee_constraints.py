@@ -0,0 +1,49 @@
+"""Tests for employee constraints."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from ga_shift.constraints.employee_constraints import MaxConsecutiveWork
+from ga_shift.models.schedule import ScheduleContext
+
+_PARAMS = {"max_days": 3, "penalty_per_day": 10.0}
+
+# Employee 0: 5 work days in a row (2 over), employee 1: trailing run of 4 (1 over)
+_SCHEDULE = np.array([
+    [0, 0, 0, 0, 0, 1, 0],
+    [1, 0, 1, 0, 0, 0, 0],
+    [0, 1, 0, 1, 0, 1, 0],
+], dtype=np.int8)
+_SCHEDULE.setflags(write=False)
+
+
+class TestMaxConsecutiveWork:
+    def test_penalty_and_details(self, small_shift_input):
+        ctx = ScheduleContext(schedule=_SCHEDULE, shift_input=small_shift_input)
+        result = MaxConsecutiveWork().compile(_PARAMS)(ctx)
+        np.testing.assert_allclose(result.penalty, 30.0, atol=1e-9)
+        np.testing.assert_allclose(result.row_penalties, [20.0, 10.0, 0.0], atol=1e-9)
+        # A run still open at the end of the month is penalized but not described
+        assert result.row_details == ["社員0: 5連勤(上限3)", "", ""]
+
+    @pytest.mark.parametrize("cells", [[(2, 3)], [(0, 2), (2, 1)]])
+    def test_delta_matches_full(self, small_shift_input, cells):
+        template = MaxConsecutiveWork()
+        penalty_fn = template.compile(_PARAMS)
+        prev = penalty_fn(ScheduleContext(schedule=_SCHEDULE, shift_input=small_shift_input))
+        schedule = _SCHEDULE.copy()
+        for i, j in cells:
+            schedule[i, j] ^= 1
+        ctx = ScheduleContext(
+            schedule=schedule,
+            shift_input=small_shift_input,
+            prev_schedule=_SCHEDULE,
+            changed_cells=cells,
+        )
+        delta = template.compile_delta(_PARAMS)(ctx, prev)
+        full = penalty_fn(ScheduleContext(schedule=schedule, shift_input=small_shift_input))
+        np.testing.assert_allclose(delta.row_penalties, full.row_penalties, atol=1e-9)
+        assert delta.row_details == full.row_details
+        assert delta.details == full.details
@@ -14,168 +14,170 @@ from ga_shift.constraints.kimachi_constraints import (
 )
 from ga_shift.models.schedule import ScheduleContext, ShiftInput
 
+# Everyone working, except 島村 (index 3) on their unavailable Wednesdays.
+_BASE_WORKING = np.zeros((5, 14), dtype=np.int8)
+_BASE_WORKING[3, [3, 10]] = 3
+_BASE_WORKING.setflags(write=False)
+# Mon-Fri columns of the two-week kimachiya calendar (Sat/Sun are 5, 6, 12, 13)
+_WORKING_DAYS_MASK = np.zeros(14, dtype=bool)
+_WORKING_DAYS_MASK[[0, 1, 2, 3, 4, 7, 8, 9, 10, 11]] = True
+_WORKING_DAYS_MASK.setflags(write=False)
+# _BASE_WORKING with everyone off on every Sat/Sun
+_BASE_WEEKENDS_OFF = _BASE_WORKING.copy()
+_BASE_WEEKENDS_OFF[:, ~_WORKING_DAYS_MASK] = 1
+_BASE_WEEKENDS_OFF.setflags(write=False)
+
+_KITCHEN_PARAMS = {"min_workers": 3, "penalty_per_missing": 50.0}
+_SUBSTITUTE_PARAMS = {
+    "primary_name": "島村誠",
+    "substitute_name": "斎藤駿児",
+    "penalty_weight": 40.0,
+}
+
+
+def _make_schedule(
+    base: np.ndarray, edits: dict[tuple[int, int], int] | None = None
+) -> np.ndarray:
+    """Writable copy of ``base`` with ``{(employee, day): code}`` edits applied."""
+    schedule = base.copy()
+    for (emp, day), code in (edits or {}).items():
+        schedule[emp, day] = code
+    return schedule
+
+
+def test_base_schedule_matches_fixture(kimachiya_shift_input: ShiftInput):
+    """_BASE_WORKING must encode exactly the fixture's unavailable days."""
+    np.testing.assert_array_equal(_BASE_WORKING, kimachiya_shift_input.base_schedule)
+    assert _BASE_WORKING.dtype == kimachiya_shift_input.base_schedule.dtype
+
+
+@pytest.fixture
+def kimachiya_shift_input_excess_vacation(kimachiya_shift_input: ShiftInput) -> ShiftInput:
+    """kimachiya_shift_input where 橋本 (index 4, 5 vacation days) wants 7 days off.
+
+    Built as a new ShiftInput so the source fixture is never modified.
+    """
+    employees = list(kimachiya_shift_input.employees)
+    employees[4] = employees[4].model_copy(update={"preferred_days_off": (1, 2, 3, 5, 6, 7, 8)})
+    return ShiftInput.model_validate(kimachiya_shift_input.model_dump() | {"employees": employees})
 
-class TestKitchenMinWorkers:
-    def test_no_penalty_when_enough_workers(self, kimachiya_shift_input: ShiftInput):
-        """All 5 employees working → 5 kitchen workers (>= 3) → no penalty."""
-        schedule = np.zeros((5, 14), dtype=int)
-        # Set unavailable days
-        schedule[3, 3] = 3
-        schedule[3, 10] = 3
-        ctx = ScheduleContext(schedule=schedule, shift_input=kimachiya_shift_input)
-        template = KitchenMinWorkers()
-        fn = template.compile({"min_workers": 3, "penalty_per_missing": 50.0})
-        result = fn(ctx)
-        assert result.penalty == 0.0
-
-    def test_penalty_when_too_few_workers(self, kimachiya_shift_input: ShiftInput):
-        """Only 2 kitchen workers on a day → penalty."""
-        schedule = np.zeros((5, 14), dtype=int)
-        schedule[3, 3] = 3  # unavailable
-        schedule[3, 10] = 3
-
-        # Day 0: 3 people off → only 2 working
-        schedule[0, 0] = 1  # Kawasaki off
-        schedule[1, 0] = 1  # Saito off
-        schedule[2, 0] = 1  # Hirata off
-        # Only Shimamura (LUNCH) and Hashimoto (LUNCH) working → 2 kitchen workers
-
-        ctx = ScheduleContext(schedule=schedule, shift_input=kimachiya_shift_input)
-        template = KitchenMinWorkers()
-        fn = template.compile({"min_workers": 3, "penalty_per_missing": 50.0})
-        result = fn(ctx)
-        assert result.penalty > 0
 
-    def test_code3_counts_as_absent(self, kimachiya_shift_input: ShiftInput):
-        """Code 3 (unavailable) should count as absent for kitchen count."""
-        schedule = np.zeros((5, 14), dtype=int)
-        schedule[3, 3] = 3  # Shimamura unavailable on Wed
-        schedule[3, 10] = 3
+def test_excess_vacation_fixture_leaves_source_untouched(
+    kimachiya_shift_input: ShiftInput, kimachiya_shift_input_excess_vacation: ShiftInput
+):
+    assert not kimachiya_shift_input.employees[4].preferred_days_off
+    assert kimachiya_shift_input_excess_vacation.preferred_off_mask[4].sum() == 7
 
-        # Day 3 (Wed): Shimamura unavailable + 2 others off → only 2 kitchen workers
-        schedule[0, 3] = 1  # Kawasaki off
-        schedule[2, 3] = 1  # Hirata off
 
+class TestKitchenMinWorkers:
+    @pytest.mark.parametrize(
+        ("edits", "expected"),
+        [
+            # All 5 employees working → 5 kitchen workers (>= 3) → no penalty
+            pytest.param({}, 0.0, id="no_penalty_when_enough_workers"),
+            # Day 0: Kawasaki, Saito, Hirata off → only Shimamura and Hashimoto (LUNCH)
+            pytest.param(
+                {(0, 0): 1, (1, 0): 1, (2, 0): 1}, 50.0, id="penalty_when_too_few_workers"
+            ),
+            # Day 3 (Wed): Shimamura unavailable (code 3) + Kawasaki, Hirata off
+            # → only Saito and Hashimoto → penalty for 1 missing
+            pytest.param({(0, 3): 1, (2, 3): 1}, 50.0, id="code3_counts_as_absent"),
+        ],
+    )
+    def test_penalty(
+        self, kimachiya_shift_input: ShiftInput, compiled_constraint, edits, expected
+    ):
+        schedule = _make_schedule(_BASE_WORKING, edits)
         ctx = ScheduleContext(schedule=schedule, shift_input=kimachiya_shift_input)
-        template = KitchenMinWorkers()
-        fn = template.compile({"min_workers": 3, "penalty_per_missing": 50.0})
-        result = fn(ctx)
-        # Day 3: Shimamura absent (code 3), Kawasaki off, Hirata off
-        # Only Saito and Hashimoto → 2 kitchen workers → penalty for 1 missing
-        assert result.penalty == 50.0
+        fn = compiled_constraint(KitchenMinWorkers, _KITCHEN_PARAMS)
+        np.testing.assert_allclose(fn(ctx).penalty, expected, atol=1e-9)
 
 
 class TestSubstituteConstraint:
-    def test_no_penalty_when_substitute_works(self, kimachiya_shift_input: ShiftInput):
-        """When Shimamura is absent, Saito is working → no penalty."""
-        schedule = np.zeros((5, 14), dtype=int)
-        schedule[3, 3] = 3  # Shimamura unavailable Wed
-        schedule[3, 10] = 3
-        # Saito (index=1) is working on both days (default=0)
-
+    @pytest.mark.parametrize(
+        ("edits", "expected"),
+        [
+            # Shimamura absent on both Wednesdays, Saito (index=1) working → no penalty
+            pytest.param({}, 0.0, id="no_penalty_when_substitute_works"),
+            # Saito also off on Wed week 1 → one violation
+            pytest.param({(1, 3): 1}, 40.0, id="penalty_when_both_absent"),
+            # Saito off on both Wednesdays → two violations
+            pytest.param({(1, 3): 1, (1, 10): 1}, 80.0, id="multiple_violations"),
+        ],
+    )
+    def test_penalty(
+        self, kimachiya_shift_input: ShiftInput, compiled_constraint, edits, expected
+    ):
+        schedule = _make_schedule(_BASE_WORKING, edits)
         ctx = ScheduleContext(schedule=schedule, shift_input=kimachiya_shift_input)
-        template = SubstituteConstraint()
-        fn = template.compile({
-            "primary_name": "島村誠",
-            "substitute_name": "斎藤駿児",
-            "penalty_weight": 40.0,
-        })
-        result = fn(ctx)
-        assert result.penalty == 0.0
-
-    def test_penalty_when_both_absent(self, kimachiya_shift_input: ShiftInput):
-        """When both Shimamura and Saito are absent → penalty."""
-        schedule = np.zeros((5, 14), dtype=int)
-        schedule[3, 3] = 3  # Shimamura unavailable Wed
-        schedule[3, 10] = 3
-        schedule[1, 3] = 1  # Saito also off on Wed
+        fn = compiled_constraint(SubstituteConstraint, _SUBSTITUTE_PARAMS)
+        np.testing.assert_allclose(fn(ctx).penalty, expected, atol=1e-9)
 
+    def test_details_name_violation_days(
+        self, kimachiya_shift_input: ShiftInput, compiled_constraint
+    ):
+        schedule = _make_schedule(_BASE_WORKING, {(1, 3): 1, (1, 10): 1})
         ctx = ScheduleContext(schedule=schedule, shift_input=kimachiya_shift_input)
-        template = SubstituteConstraint()
-        fn = template.compile({
-            "primary_name": "島村誠",
-            "substitute_name": "斎藤駿児",
-            "penalty_weight": 40.0,
-        })
-        result = fn(ctx)
-        assert result.penalty == 40.0  # One day violation
-
-    def test_multiple_violations(self, kimachiya_shift_input: ShiftInput):
-        """Both absent on multiple days."""
-        schedule = np.zeros((5, 14), dtype=int)
-        schedule[3, 3] = 3  # Shimamura unavailable Wed week 1
-        schedule[3, 10] = 3  # Shimamura unavailable Wed week 2
-        schedule[1, 3] = 1  # Saito off Wed week 1
-        schedule[1, 10] = 1  # Saito off Wed week 2
+        result = compiled_constraint(SubstituteConstraint, _SUBSTITUTE_PARAMS)(ctx)
+        assert result.details == "4日: 島村誠不在で斎藤駿児も休み; 11日: 島村誠不在で斎藤駿児も休み"
 
+    def test_unknown_name_has_no_penalty(
+        self, kimachiya_shift_input: ShiftInput, compiled_constraint
+    ):
+        schedule = _make_schedule(_BASE_WORKING, {(1, 3): 1})
         ctx = ScheduleContext(schedule=schedule, shift_input=kimachiya_shift_input)
-        template = SubstituteConstraint()
-        fn = template.compile({
-            "primary_name": "島村誠",
-            "substitute_name": "斎藤駿児",
-            "penalty_weight": 40.0,
-        })
-        result = fn(ctx)
-        assert result.penalty == 80.0  # Two violations
+        params = {**_SUBSTITUTE_PARAMS, "substitute_name": "存在しない"}
+        result = compiled_constraint(SubstituteConstraint, params)(ctx)
+        np.testing.assert_allclose(result.penalty, 0.0, atol=1e-9)
 
 
 class TestVacationDaysLimit:
-    def test_no_penalty_within_limit(self, kimachiya_shift_input: ShiftInput):
+    def test_no_penalty_within_limit(self, kimachiya_shift_input: ShiftInput, compiled_constraint):
         """Preferred days within limit → no penalty."""
         # kimachiya_shift_input has no preferred_days_off
-        schedule = np.zeros((5, 14), dtype=int)
-        schedule[3, 3] = 3
-        schedule[3, 10] = 3
+        schedule = _make_schedule(_BASE_WORKING)
         ctx = ScheduleContext(schedule=schedule, shift_input=kimachiya_shift_input)
-        template = VacationDaysLimit()
-        fn = template.compile({"penalty_per_excess": 20.0})
+        fn = compiled_constraint(VacationDaysLimit, {"penalty_per_excess": 20.0})
         result = fn(ctx)
-        assert result.penalty == 0.0
+        np.testing.assert_allclose(result.penalty, 0.0, atol=1e-9)
 
-    def test_penalty_when_over_limit(self, kimachiya_shift_input: ShiftInput):
+    def test_penalty_when_over_limit(
+        self, kimachiya_shift_input_excess_vacation: ShiftInput, compiled_constraint
+    ):
         """More preferred days than available → penalty."""
-        # Modify employee to have excess preferred days
-        si = kimachiya_shift_input
-        # Hashimoto (index=4) has 5 vacation days
-        # Give her 7 preferred days off
-        si.employees[4].preferred_days_off = [1, 2, 3, 5, 6, 7, 8]
-
-        schedule = np.zeros((5, 14), dtype=int)
-        schedule[3, 3] = 3
-        schedule[3, 10] = 3
-        ctx = ScheduleContext(schedule=schedule, shift_input=si)
-        template = VacationDaysLimit()
-        fn = template.compile({"penalty_per_excess": 20.0})
+        schedule = _make_schedule(_BASE_WORKING)
+        ctx = ScheduleContext(schedule=schedule, shift_input=kimachiya_shift_input_excess_vacation)
+        fn = compiled_constraint(VacationDaysLimit, {"penalty_per_excess": 20.0})
         result = fn(ctx)
         # 7 preferred - 5 available = 2 excess → 2 * 20 = 40
-        assert result.penalty == 40.0
+        np.testing.assert_allclose(result.penalty, 40.0, atol=1e-9)
 
 
 class TestUnavailableDayHard:
-    def test_no_penalty_when_respected(self, kimachiya_shift_input: ShiftInput):
+    def test_no_penalty_when_respected(
+        self, kimachiya_shift_input: ShiftInput, compiled_constraint
+    ):
         """Unavailable days kept as code 3 → no penalty."""
-        schedule = np.zeros((5, 14), dtype=int)
-        schedule[3, 3] = 3  # Shimamura Wed
-        schedule[3, 10] = 3
+        schedule = _make_schedule(_BASE_WORKING)
 
         ctx = ScheduleContext(schedule=schedule, shift_input=kimachiya_shift_input)
-        template = UnavailableDayHard()
-        fn = template.compile({"penalty_per_violation": 1000.0})
+        fn = compiled_constraint(UnavailableDayHard, {"penalty_per_violation": 1000.0})
         result = fn(ctx)
-        assert result.penalty == 0.0
+        np.testing.assert_allclose(result.penalty, 0.0, atol=1e-9)
 
-    def test_extreme_penalty_when_violated(self, kimachiya_shift_input: ShiftInput):
+    def test_extreme_penalty_when_violated(
+        self, kimachiya_shift_input: ShiftInput, compiled_constraint
+    ):
         """Code 3 changed to work → extreme penalty."""
-        schedule = np.zeros((5, 14), dtype=int)
-        # Intentionally set unavailable day to work (violation!)
-        schedule[3, 3] = 0  # Should be 3 (unavailable)
-        schedule[3, 10] = 3  # This one is correct
+        schedule = _make_schedule(_BASE_WORKING, {
+            # Intentionally set unavailable day to work (violation!)
+            (3, 3): 0,  # Should be 3 (unavailable)
+        })
 
         ctx = ScheduleContext(schedule=schedule, shift_input=kimachiya_shift_input)
-        template = UnavailableDayHard()
-        fn = template.compile({"penalty_per_violation": 1000.0})
+        fn = compiled_constraint(UnavailableDayHard, {"penalty_per_violation": 1000.0})
         result = fn(ctx)
-        assert result.penalty == 1000.0  # One violation
+        np.testing.assert_allclose(result.penalty, 1000.0, atol=1e-9)  # One violation
 
 
 class TestClosedDayConstraint:
@@ -188,8 +190,8 @@ class TestClosedDayConstraint:
 
     def _default_params(self, **overrides):
         params = {
-            "closed_weekdays": "5,6",
-            "override_open_days": "",
+            "closed_weekdays": (5, 6),
+            "override_open_days": (),
             "penalty_closed_day": 500.0,
             "penalty_parttime_override": 100.0,
         }
@@ -197,153 +199,117 @@ class TestClosedDayConstraint:
         return params
 
     def test_no_penalty_when_all_off_on_closed_days(
-        self, kimachiya_shift_input: ShiftInput
+        self, kimachiya_shift_input: ShiftInput, compiled_constraint
     ):
         """All employees off on Sat/Sun → no penalty."""
-        schedule = np.zeros((5, 14), dtype=int)
-        schedule[3, 3] = 3
-        schedule[3, 10] = 3
-        # Set all employees to holiday on closed days (5, 6, 12, 13)
-        for d in [5, 6, 12, 13]:
-            schedule[:, d] = 1
-
+        schedule = _make_schedule(_BASE_WEEKENDS_OFF)
         ctx = ScheduleContext(schedule=schedule, shift_input=kimachiya_shift_input)
-        template = ClosedDayConstraint()
-        fn = template.compile(self._default_params())
+        fn = compiled_constraint(ClosedDayConstraint, self._default_params())
         result = fn(ctx)
-        assert result.penalty == 0.0
-
-    def test_penalty_when_working_on_closed_day(
-        self, kimachiya_shift_input: ShiftInput
+        np.testing.assert_allclose(result.penalty, 0.0, atol=1e-9)
+
+    @pytest.fixture
+    def weekday_schedule(self) -> np.ndarray:
+        """Everyone working Mon-Fri and off on every Sat/Sun."""
+        return _make_schedule(_BASE_WEEKENDS_OFF)
+
+    @pytest.mark.parametrize(
+        ("edits", "overrides", "expected", "detail_words"),
+        [
+            # 川崎(正規) working on a normal closed day (Sat, index 5) → hard penalty
+            pytest.param(
+                {(0, 5): 0}, {}, 500.0, ("定休日", "川崎聡"), id="working_on_closed_day"
+            ),
+            # 川崎 and 斎藤 working on Sunday (index 6) → 2 × penalty
+            pytest.param({(0, 6): 0, (1, 6): 0}, {}, 1000.0, (), id="multiple_violations"),
+            # 川崎(正規) on Saturday index 5 = override day 6 (1-indexed) → OK
+            pytest.param(
+                {(0, 5): 0}, {"override_open_days": (6,)}, 0.0, (),
+                id="override_day_fulltime_no_penalty",
+            ),
+            # 平田(パート) on override day 6 → soft penalty
+            pytest.param(
+                {(2, 5): 0}, {"override_open_days": (6,)}, 100.0, ("臨時営業", "パート"),
+                id="override_day_parttime_penalty",
+            ),
+            # 川崎 on override Saturday (OK) and on the following Sunday (hard penalty)
+            pytest.param(
+                {(0, 5): 0, (0, 6): 0}, {"override_open_days": (6,)}, 500.0, (),
+                id="override_only_affects_specified_days",
+            ),
+            # 斎藤(正規) on both Saturdays, both overridden (days 6 and 13, 1-indexed)
+            pytest.param(
+                {(1, 5): 0, (1, 12): 0}, {"override_open_days": (6, 13)}, 0.0, (),
+                id="multiple_override_days",
+            ),
+        ],
+    )
+    def test_work_on_closed_day(
+        self,
+        kimachiya_shift_input: ShiftInput,
+        compiled_constraint,
+        weekday_schedule,
+        edits,
+        overrides,
+        expected,
+        detail_words,
     ):
-        """One employee working on a normal closed day → hard penalty."""
-        schedule = np.ones((5, 14), dtype=int)  # all off
-        schedule[3, 3] = 3
-        schedule[3, 10] = 3
-        # Set weekdays to work
-        for d in [0, 1, 2, 3, 4, 7, 8, 9, 10, 11]:
-            schedule[:, d] = 0
-        # Employee 0 (正規) working on Saturday (index 5)
-        schedule[0, 5] = 0
-
-        ctx = ScheduleContext(schedule=schedule, shift_input=kimachiya_shift_input)
-        template = ClosedDayConstraint()
-        fn = template.compile(self._default_params())
+        for (emp, day), code in edits.items():
+            weekday_schedule[emp, day] = code
+        ctx = ScheduleContext(schedule=weekday_schedule, shift_input=kimachiya_shift_input)
+        fn = compiled_constraint(ClosedDayConstraint, self._default_params(**overrides))
         result = fn(ctx)
-        assert result.penalty == 500.0
-        assert "定休日" in result.details
-        assert "川崎聡" in result.details
+        np.testing.assert_allclose(result.penalty, expected, atol=1e-9)
+        for word in detail_words:
+            assert word in result.details
 
-    def test_penalty_multiple_violations(
-        self, kimachiya_shift_input: ShiftInput
-    ):
-        """Two employees working on closed day → 2 × penalty."""
-        schedule = np.ones((5, 14), dtype=int)
-        schedule[3, 3] = 3
-        schedule[3, 10] = 3
-        for d in [0, 1, 2, 3, 4, 7, 8, 9, 10, 11]:
-            schedule[:, d] = 0
-        # Two employees working on Sunday (index 6)
-        schedule[0, 6] = 0  # 川崎
-        schedule[1, 6] = 0  # 斎藤
+    def test_no_closed_weekdays(self, kimachiya_shift_input: ShiftInput, compiled_constraint):
+        """Empty closed_weekdays → no penalty ever."""
+        schedule = _make_schedule(_BASE_WORKING)  # everyone working every day
 
         ctx = ScheduleContext(schedule=schedule, shift_input=kimachiya_shift_input)
-        template = ClosedDayConstraint()
-        fn = template.compile(self._default_params())
+        fn = compiled_constraint(
+            ClosedDayConstraint, self._default_params(closed_weekdays=())
+        )
         result = fn(ctx)
-        assert result.penalty == 1000.0  # 2 * 500
+        np.testing.assert_allclose(result.penalty, 0.0, atol=1e-9)
 
-    def test_override_day_fulltime_no_penalty(
-        self, kimachiya_shift_input: ShiftInput
+    def test_details_list_violations_day_by_day(
+        self, kimachiya_shift_input: ShiftInput, compiled_constraint, weekday_schedule
     ):
-        """Regular employee working on override day → no penalty."""
-        schedule = np.ones((5, 14), dtype=int)
-        schedule[3, 3] = 3
-        schedule[3, 10] = 3
-        for d in [0, 1, 2, 3, 4, 7, 8, 9, 10, 11]:
-            schedule[:, d] = 0
-        # 川崎(正規) working on Saturday (index 5), which is override day (day 6 in 1-indexed)
-        schedule[0, 5] = 0
-
-        ctx = ScheduleContext(schedule=schedule, shift_input=kimachiya_shift_input)
-        template = ClosedDayConstraint()
-        fn = template.compile(self._default_params(override_open_days="6"))
-        result = fn(ctx)
-        assert result.penalty == 0.0  # Full-time on override → OK
-
-    def test_override_day_parttime_penalty(
-        self, kimachiya_shift_input: ShiftInput
+        weekday_schedule[[0, 2], 5] = 0  # 川崎(正規), 平田(パート) on override Saturday
+        weekday_schedule[1, 6] = 0  # 斎藤 on a normal Sunday
+        ctx = ScheduleContext(schedule=weekday_schedule, shift_input=kimachiya_shift_input)
+        fn = compiled_constraint(ClosedDayConstraint, self._default_params(override_open_days=(6,)))
+        assert fn(ctx).details == (
+            "6日(臨時営業): 平田園美(パート)は出勤不可; 7日(定休日): 斎藤駿児が出勤"
+        )
+
+    def test_accepts_comma_separated_strings(
+        self, kimachiya_shift_input: ShiftInput, compiled_constraint, weekday_schedule
     ):
-        """Part-time employee working on override day → soft penalty."""
-        schedule = np.ones((5, 14), dtype=int)
-        schedule[3, 3] = 3
-        schedule[3, 10] = 3
-        for d in [0, 1, 2, 3, 4, 7, 8, 9, 10, 11]:
-            schedule[:, d] = 0
-        # 平田(パート, index=2) working on Saturday (index 5), override day 6
-        schedule[2, 5] = 0
-
-        ctx = ScheduleContext(schedule=schedule, shift_input=kimachiya_shift_input)
-        template = ClosedDayConstraint()
-        fn = template.compile(self._default_params(override_open_days="6"))
-        result = fn(ctx)
-        assert result.penalty == 100.0  # Part-time on override → soft penalty
-        assert "臨時営業" in result.details
-        assert "パート" in result.details
-
-    def test_override_only_affects_specified_days(
-        self, kimachiya_shift_input: ShiftInput
+        """Comma-separated strings, as stored by the UI, give the same result."""
+        weekday_schedule[1, [5, 6, 12]] = 0
+        ctx = ScheduleContext(schedule=weekday_schedule, shift_input=kimachiya_shift_input)
+        params = self._default_params(closed_weekdays="5,6", override_open_days=" 6, 13 ")
+        result = compiled_constraint(ClosedDayConstraint, params)(ctx)
+        # index 6 (Sun) is not an override day
+        np.testing.assert_allclose(result.penalty, 500.0, atol=1e-9)
+
+    def test_accepts_single_int(
+        self, kimachiya_shift_input: ShiftInput, compiled_constraint, weekday_schedule
     ):
-        """Override only on one Saturday, other closed days still hard penalty."""
-        schedule = np.ones((5, 14), dtype=int)
-        schedule[3, 3] = 3
-        schedule[3, 10] = 3
-        for d in [0, 1, 2, 3, 4, 7, 8, 9, 10, 11]:
-            schedule[:, d] = 0
-        # 川崎(正規) on Saturday week1 (index 5) → override day 6
-        schedule[0, 5] = 0
-        # 川崎(正規) on Sunday week1 (index 6) → NOT override → hard penalty
-        schedule[0, 6] = 0
-
-        ctx = ScheduleContext(schedule=schedule, shift_input=kimachiya_shift_input)
-        template = ClosedDayConstraint()
-        fn = template.compile(self._default_params(override_open_days="6"))
-        result = fn(ctx)
-        # index 5 is override → 0 penalty (full-time)
-        # index 6 is NOT override → 500 penalty
-        assert result.penalty == 500.0
-
-    def test_multiple_override_days(
-        self, kimachiya_shift_input: ShiftInput
-    ):
-        """Multiple override days specified."""
-        schedule = np.ones((5, 14), dtype=int)
-        schedule[3, 3] = 3
-        schedule[3, 10] = 3
-        for d in [0, 1, 2, 3, 4, 7, 8, 9, 10, 11]:
-            schedule[:, d] = 0
-        # 斎藤(正規) on Sat week1 (index 5) and Sat week2 (index 12)
-        schedule[1, 5] = 0
-        schedule[1, 12] = 0
-
-        ctx = ScheduleContext(schedule=schedule, shift_input=kimachiya_shift_input)
-        template = ClosedDayConstraint()
-        # Override both Saturdays: day 6 and day 13 (1-indexed)
-        fn = template.compile(self._default_params(override_open_days="6,13"))
-        result = fn(ctx)
-        assert result.penalty == 0.0  # Both are override days, full-time employee
-
-    def test_no_closed_weekdays(self, kimachiya_shift_input: ShiftInput):
-        """Empty closed_weekdays → no penalty ever."""
-        schedule = np.zeros((5, 14), dtype=int)  # everyone working every day
-        schedule[3, 3] = 3
-        schedule[3, 10] = 3
-
-        ctx = ScheduleContext(schedule=schedule, shift_input=kimachiya_shift_input)
-        template = ClosedDayConstraint()
-        fn = template.compile(self._default_params(closed_weekdays=""))
-        result = fn(ctx)
-        assert result.penalty == 0.0
+        """A bare int (e.g. sent by an LLM via MCP) is treated as a one-element list."""
+        weekday_schedule[1, [5, 6, 12]] = 0
+        ctx = ScheduleContext(schedule=weekday_schedule, shift_input=kimachiya_shift_input)
+        results = [
+            compiled_constraint(ClosedDayConstraint, self._default_params(**overrides))(ctx)
+            for overrides in (
+                {"closed_weekdays": 6, "override_open_days": 13},
+                {"closed_weekdays": (6,), "override_open_days": (13,)},
+            )
+        ]
+        assert results[0].penalty == results[1].penalty > 0
 
     def test_template_id(self):
         """Verify template_id."""
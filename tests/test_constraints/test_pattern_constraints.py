@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import itertools
+
 import numpy as np
 import pytest
 
@@ -13,10 +15,24 @@ from ga_shift.constraints.pattern_constraints import (
 from ga_shift.models.schedule import ScheduleContext, ShiftInput
 
 
+def expected_consecutive_penalty(schedule: np.ndarray, threshold: int, weight: float) -> float:
+    """Reference penalty: (run - (threshold - 1))^2 * weight for each work run >= threshold."""
+    total = 0.0
+    for row in schedule:
+        for is_work, run in itertools.groupby(row == 0):
+            length = sum(1 for _ in run)
+            if is_work and length >= threshold:
+                total += (length - (threshold - 1)) ** 2 * weight
+    return total
+
+
 @pytest.fixture
 def make_context(small_shift_input):
     def _make(schedule: np.ndarray) -> ScheduleContext:
-        return ScheduleContext(schedule=schedule, shift_input=small_shift_input)
+        ctx = ScheduleContext(schedule=schedule, shift_input=small_shift_input)
+        # int8 schedules must reach the constraints as-is (no upcast or copy)
+        assert ctx.schedule is schedule
+        return ctx
     return _make
 
 
@@ -27,12 +43,12 @@ class TestAvoidLongConsecutiveWork:
             [0, 0, 0, 0, 1, 1, 0],
             [0, 0, 0, 0, 1, 1, 0],
             [0, 0, 0, 0, 1, 1, 0],
-        ])
+        ], dtype=np.int8)
         ctx = make_context(schedule)
         template = AvoidLongConsecutiveWork()
         fn = template.compile({"threshold": 5, "penalty_weight": 1.0})
         result = fn(ctx)
-        assert result.penalty == 0.0
+        np.testing.assert_allclose(result.penalty, 0.0, atol=1e-9)
 
     def test_penalty_at_threshold(self, make_context):
         # 5 consecutive work days (threshold=5)
@@ -40,26 +56,39 @@ class TestAvoidLongConsecutiveWork:
             [0, 0, 0, 0, 0, 1, 1],
             [1, 1, 0, 0, 0, 0, 0],
             [0, 0, 1, 1, 0, 0, 0],
-        ])
+        ], dtype=np.int8)
         ctx = make_context(schedule)
         template = AvoidLongConsecutiveWork()
         fn = template.compile({"threshold": 5, "penalty_weight": 1.0})
         result = fn(ctx)
         # Employee 0: 5 consecutive → (5-4)^2 = 1
         # Employee 1: 5 consecutive → 1
-        assert result.penalty > 0.0
+        np.testing.assert_allclose(result.penalty, 2.0, atol=1e-9)
+        np.testing.assert_allclose(
+            result.penalty, expected_consecutive_penalty(schedule, 5, 1.0), atol=1e-9
+        )
 
     def test_weight_multiplier(self, make_context):
         schedule = np.array([
             [0, 0, 0, 0, 0, 1, 1],
             [1, 1, 1, 1, 1, 1, 1],
             [1, 1, 1, 1, 1, 1, 1],
-        ])
+        ], dtype=np.int8)
         ctx = make_context(schedule)
         template = AvoidLongConsecutiveWork()
         fn1 = template.compile({"threshold": 5, "penalty_weight": 1.0})
         fn2 = template.compile({"threshold": 5, "penalty_weight": 2.0})
-        assert fn2(ctx).penalty == fn1(ctx).penalty * 2
+        np.testing.assert_allclose(fn2(ctx).penalty, fn1(ctx).penalty * 2, atol=1e-9)
+
+    @pytest.mark.parametrize("threshold", [3, 5, 7])
+    def test_matches_reference_on_random_schedules(self, small_shift_input, threshold):
+        rng = np.random.default_rng(threshold)
+        fn = AvoidLongConsecutiveWork().compile({"threshold": threshold, "penalty_weight": 1.5})
+        for _ in range(20):
+            schedule = (rng.random((3, 7)) < 0.2).astype(np.int8)
+            ctx = ScheduleContext(schedule=schedule, shift_input=small_shift_input)
+            expected = expected_consecutive_penalty(schedule, threshold, 1.5)
+            np.testing.assert_allclose(fn(ctx).penalty, expected, atol=1e-9)
 
 
 class TestNoIsolatedHolidays:
@@ -68,12 +97,12 @@ class TestNoIsolatedHolidays:
             [0, 0, 0, 0, 0, 1, 1],
             [1, 1, 0, 0, 0, 0, 0],
             [0, 0, 0, 0, 0, 1, 1],
-        ])
+        ], dtype=np.int8)
         ctx = make_context(schedule)
         template = NoIsolatedHolidays()
         fn = template.compile({"penalty_weight": 10.0})
         result = fn(ctx)
-        assert result.penalty == 0.0
+        np.testing.assert_allclose(result.penalty, 0.0, atol=1e-9)
 
     def test_detects_tobishi_pattern(self, make_context):
         # 1-0-1 pattern: holiday-work-holiday
@@ -81,13 +110,13 @@ class TestNoIsolatedHolidays:
             [0, 1, 0, 1, 0, 0, 0],
             [0, 0, 0, 0, 0, 0, 0],
             [0, 0, 0, 0, 0, 0, 0],
-        ])
+        ], dtype=np.int8)
         ctx = make_context(schedule)
         template = NoIsolatedHolidays()
         fn = template.compile({"penalty_weight": 10.0})
         result = fn(ctx)
         # One pattern at positions 1,2,3
-        assert result.penalty == 10.0
+        np.testing.assert_allclose(result.penalty, 10.0, atol=1e-9)
 
 
 class TestConsecutiveHolidayBonus:
@@ -96,7 +125,7 @@ class TestConsecutiveHolidayBonus:
             [0, 0, 0, 0, 0, 1, 1],
             [0, 0, 0, 0, 0, 0, 0],
             [0, 0, 0, 0, 0, 0, 0],
-        ])
+        ], dtype=np.int8)
         ctx = make_context(schedule)
         template = ConsecutiveHolidayBonus()
         fn = template.compile({"threshold": 2, "bonus_per_day": 2.0})
@@ -12,30 +12,31 @@ from ga_shift.models.ga_config import GAConfig
 from ga_shift.models.schedule import ShiftInput
 
 
-class TestGARunner:
-    def test_produces_valid_result(self, small_shift_input, fast_ga_config):
-        registry = get_registry()
-        compiled = registry.compile_set(ConstraintSet.default_set())
-        runner = GARunner(small_shift_input, compiled, fast_ga_config)
-        result = runner.run()
+@pytest.fixture(scope="module")
+def ga_result_small(shared_small_shift_input, fast_ga_config):
+    """One GA run on the small input, with the progress callback calls it produced."""
+    compiled = get_registry().compile_set(ConstraintSet.default_set())
+    calls = []
+
+    def callback(gen, score, top):
+        calls.append((gen, score, top))
+
+    runner = GARunner(shared_small_shift_input, compiled, fast_ga_config, callback)
+    return runner.run(), calls
 
+
+class TestGARunner:
+    def test_produces_valid_result(self, shared_small_shift_input, fast_ga_config, ga_result_small):
+        result, _ = ga_result_small
         assert result.best_schedule.shape == (
-            small_shift_input.num_employees,
-            small_shift_input.num_days,
+            shared_small_shift_input.num_employees,
+            shared_small_shift_input.num_days,
         )
         assert result.best_score <= 0
         assert len(result.score_history) == fast_ga_config.generation_count
 
-    def test_progress_callback_called(self, small_shift_input, fast_ga_config):
-        registry = get_registry()
-        compiled = registry.compile_set(ConstraintSet.default_set())
-        calls = []
-
-        def callback(gen, score, top):
-            calls.append((gen, score, top))
-
-        runner = GARunner(small_shift_input, compiled, fast_ga_config, callback)
-        runner.run()
+    def test_progress_callback_called(self, fast_ga_config, ga_result_small):
+        _, calls = ga_result_small
         assert len(calls) == fast_ga_config.generation_count
 
     def test_score_improves_or_stable(self, sample_shift_input):
@@ -46,5 +47,15 @@ class TestGARunner:
         result = runner.run()
 
         # Score history should be non-decreasing (improving)
-        for i in range(1, len(result.score_history)):
-            assert result.score_history[i] >= result.score_history[i - 1]
+        assert np.all(np.diff(result.score_history) >= 0)
+
+    def test_same_seed_gives_same_result(self, shared_small_shift_input, fast_ga_config):
+        compiled = get_registry().compile_set(ConstraintSet.default_set())
+        results = [
+            GARunner(
+                shared_small_shift_input, compiled, fast_ga_config, rng=np.random.default_rng(7)
+            ).run()
+            for _ in range(2)
+        ]
+        np.testing.assert_array_equal(results[0].best_schedule, results[1].best_schedule)
+        assert results[0].score_history == results[1].score_history
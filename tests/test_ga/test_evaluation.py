@@ -0,0 +1,42 @@
+"""Tests for constraint evaluation."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from ga_shift.constraints.registry import get_registry
+from ga_shift.ga.evaluation import evaluate_delta_with_constraints, evaluate_with_constraints
+from ga_shift.ga.operators import holiday_fix, mutation
+from ga_shift.ga.population import create_individual
+from ga_shift.models.constraint import ConstraintSet
+
+
+class TestDeltaEvaluation:
+    def test_delta_matches_full_evaluation(self, sample_shift_input):
+        rng = np.random.default_rng(0)
+        compiled = get_registry().compile_set(ConstraintSet.default_set())
+        parent = holiday_fix(create_individual(sample_shift_input, rng), sample_shift_input, rng)
+        _, prev_results = evaluate_with_constraints(parent, sample_shift_input, compiled)
+
+        child = mutation(parent, mutation_rate=1.0, gene_ratio=0.1, rng=rng)
+        full_score, full_results = evaluate_with_constraints(child, sample_shift_input, compiled)
+        delta_score, delta_results = evaluate_delta_with_constraints(
+            child, sample_shift_input, compiled, parent, prev_results
+        )
+
+        assert delta_score == pytest.approx(full_score)
+        for (cid, full), (_, delta) in zip(full_results, delta_results):
+            assert delta.penalty == pytest.approx(full.penalty), cid
+            assert delta.details == full.details, cid
+
+    def test_unchanged_schedule_reuses_previous_results(self, sample_shift_input):
+        compiled = get_registry().compile_set(ConstraintSet.default_set())
+        schedule = holiday_fix(create_individual(sample_shift_input), sample_shift_input)
+        score, prev_results = evaluate_with_constraints(schedule, sample_shift_input, compiled)
+
+        delta_score, delta_results = evaluate_delta_with_constraints(
+            schedule.copy(), sample_shift_input, compiled, schedule, prev_results
+        )
+        assert delta_score == score
+        assert all(d is p for (_, d), (_, p) in zip(delta_results, prev_results))
@@ -0,0 +1,47 @@
+"""Tests for GA operator kernels."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from ga_shift.ga._kernels import _fix_holidays_loop, _fix_holidays_numpy, fix_holidays
+
+
+def _random_case(seed: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    schedule = rng.choice(np.arange(4, dtype=np.int8), size=(9, 21), p=[0.6, 0.3, 0.05, 0.05])
+    targets = rng.integers(-1, 12, size=9)
+    return schedule, targets, rng.random(schedule.shape)
+
+
+class TestFixHolidays:
+    def test_loop_and_numpy_agree(self):
+        for seed in range(20):
+            schedule, targets, keys = _random_case(seed)
+            expected = schedule.copy()
+            _fix_holidays_loop(expected, targets, keys)
+            for fn in (_fix_holidays_numpy, fix_holidays):
+                actual = schedule.copy()
+                fn(actual, targets, keys)
+                np.testing.assert_array_equal(actual, expected)
+
+    def test_reaches_target_and_keeps_codes_2_and_3(self):
+        schedule, targets, keys = _random_case(0)
+        fixed = schedule.copy()
+        fix_holidays(fixed, targets, keys)
+        fixed_codes = schedule >= 2
+        np.testing.assert_array_equal(fixed[fixed_codes], schedule[fixed_codes])
+        skipped = targets < 0
+        np.testing.assert_array_equal(fixed[skipped], schedule[skipped])
+        # Reachable targets are met exactly.
+        lo = np.count_nonzero(schedule >= 2, axis=1)
+        hi = lo + np.count_nonzero(schedule < 2, axis=1)
+        reachable = ~skipped & (lo <= targets) & (targets <= hi)
+        counts = np.count_nonzero(fixed, axis=1)
+        np.testing.assert_array_equal(counts[reachable], targets[reachable])
+
+    def test_flips_cells_with_smallest_keys(self):
+        schedule = np.array([[1, 1, 1, 0]], dtype=np.int8)
+        keys = np.array([[0.9, 0.1, 0.5, 0.0]])
+        fix_holidays(schedule, np.array([1]), keys)
+        assert schedule.tolist() == [[1, 0, 0, 0]]
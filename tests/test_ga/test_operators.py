@@ -6,83 +6,128 @@ import numpy as np
 import pytest
 
 from ga_shift.ga.operators import crossover_uniform, holiday_fix, mutation
+from ga_shift.models.schedule import ShiftInput
 
 
 class TestCrossoverUniform:
     def test_same_parents_produce_same_children(self):
-        p1 = np.array([[0, 1, 0, 1], [1, 0, 1, 0]])
+        p1 = np.array([[0, 1, 0, 1], [1, 0, 1, 0]], dtype=np.int8)
         ch1, ch2 = crossover_uniform(p1, p1.copy())
         np.testing.assert_array_equal(ch1, p1)
         np.testing.assert_array_equal(ch2, p1)
 
     def test_children_have_same_shape(self):
-        p1 = np.array([[0, 1, 0], [1, 0, 1]])
-        p2 = np.array([[1, 0, 1], [0, 1, 0]])
+        p1 = np.array([[0, 1, 0], [1, 0, 1]], dtype=np.int8)
+        p2 = np.array([[1, 0, 1], [0, 1, 0]], dtype=np.int8)
         ch1, ch2 = crossover_uniform(p1, p2)
         assert ch1.shape == p1.shape
         assert ch2.shape == p2.shape
 
     def test_children_contain_parent_genes(self):
-        np.random.seed(42)
-        p1 = np.array([[0, 0, 0], [0, 0, 0]])
-        p2 = np.array([[1, 1, 1], [1, 1, 1]])
-        ch1, ch2 = crossover_uniform(p1, p2)
+        rng = np.random.default_rng(42)
+        p1 = np.array([[0, 0, 0], [0, 0, 0]], dtype=np.int8)
+        p2 = np.array([[1, 1, 1], [1, 1, 1]], dtype=np.int8)
+        ch1, ch2 = crossover_uniform(p1, p2, rng=rng)
         # Each gene should come from one parent
         for i in range(ch1.size):
             assert ch1.flat[i] in (0, 1)
             assert ch2.flat[i] in (0, 1)
 
+    def test_rate_extremes(self):
+        p1 = np.zeros((3, 7), dtype=np.int8)
+        p2 = np.ones((3, 7), dtype=np.int8)
+        ch1, ch2 = crossover_uniform(p1, p2, rate=1.0)
+        np.testing.assert_array_equal(ch1, p1)
+        np.testing.assert_array_equal(ch2, p2)
+        ch1, ch2 = crossover_uniform(p1, p2, rate=0.0)
+        np.testing.assert_array_equal(ch1, p2)
+        np.testing.assert_array_equal(ch2, p1)
+
+    def test_default_rate_swaps_about_half(self):
+        rng = np.random.default_rng(0)
+        p1 = np.zeros((50, 40), dtype=np.int8)
+        ch1, ch2 = crossover_uniform(p1, p1 + 1, rng=rng)
+        assert 0.45 < ch1.mean() < 0.55
+        np.testing.assert_array_equal(ch1 + ch2, 1)
+
+    def test_crosses_stacked_pairs(self):
+        rng = np.random.default_rng(5)
+        p1 = rng.integers(0, 4, size=(6, 3, 7), dtype=np.int8)
+        p2 = rng.integers(0, 4, size=(6, 3, 7), dtype=np.int8)
+        ch1, ch2 = crossover_uniform(p1, p2, rng=rng)
+        assert ch1.shape == ch2.shape == p1.shape
+        assert np.all((ch1 == p1) | (ch1 == p2))
+        np.testing.assert_array_equal(ch1 + ch2, p1 + p2)
+
 
 class TestMutation:
     def test_no_mutation_with_zero_rate(self):
-        child = np.array([[0, 1, 0, 1, 2]])
+        child = np.array([[0, 1, 0, 1, 2]], dtype=np.int8)
         result = mutation(child, mutation_rate=0.0)
         np.testing.assert_array_equal(result, child)
 
     def test_preserves_preferred_off(self):
-        np.random.seed(42)
-        child = np.array([[2, 2, 2, 2, 2]])
-        result = mutation(child, mutation_rate=1.0, gene_ratio=1.0)
+        rng = np.random.default_rng(42)
+        child = np.array([[2, 2, 2, 2, 2]], dtype=np.int8)
+        result = mutation(child, mutation_rate=1.0, gene_ratio=1.0, rng=rng)
         # All 2s should be preserved
         np.testing.assert_array_equal(result, child)
 
     def test_preserves_unavailable_code3(self):
         """Code 3 (unavailable) must never be mutated."""
-        np.random.seed(42)
-        child = np.array([[3, 3, 3, 3, 3]])
-        result = mutation(child, mutation_rate=1.0, gene_ratio=1.0)
+        rng = np.random.default_rng(42)
+        child = np.array([[3, 3, 3, 3, 3]], dtype=np.int8)
+        result = mutation(child, mutation_rate=1.0, gene_ratio=1.0, rng=rng)
         np.testing.assert_array_equal(result, child)
 
     def test_preserves_mixed_codes_2_and_3(self):
         """Both code 2 and code 3 must be preserved."""
-        np.random.seed(42)
-        child = np.array([[2, 3, 2, 3, 2]])
-        result = mutation(child, mutation_rate=1.0, gene_ratio=1.0)
+        rng = np.random.default_rng(42)
+        child = np.array([[2, 3, 2, 3, 2]], dtype=np.int8)
+        result = mutation(child, mutation_rate=1.0, gene_ratio=1.0, rng=rng)
         np.testing.assert_array_equal(result, child)
 
     def test_mutation_flips_genes(self):
-        np.random.seed(42)
-        child = np.array([[0, 0, 0, 0, 0, 1, 1, 1, 1, 1]])
-        result = mutation(child, mutation_rate=1.0, gene_ratio=0.5)
+        rng = np.random.default_rng(42)
+        child = np.array([[0, 0, 0, 0, 0, 1, 1, 1, 1, 1]], dtype=np.int8)
+        result = mutation(child, mutation_rate=1.0, gene_ratio=0.5, rng=rng)
         # Some genes should have flipped
         assert not np.array_equal(result, child)
 
     def test_mutation_only_flips_0_and_1(self):
         """Even with high mutation rate, only 0↔1 are changed."""
-        np.random.seed(42)
-        child = np.array([[0, 1, 2, 3, 0, 1, 2, 3]])
-        result = mutation(child, mutation_rate=1.0, gene_ratio=1.0)
+        rng = np.random.default_rng(42)
+        child = np.array([[0, 1, 2, 3, 0, 1, 2, 3]], dtype=np.int8)
+        result = mutation(child, mutation_rate=1.0, gene_ratio=1.0, rng=rng)
         # 2s and 3s must be unchanged
         assert result.flat[2] == 2
         assert result.flat[3] == 3
         assert result.flat[6] == 2
         assert result.flat[7] == 3
 
+    def test_mutation_flips_at_least_one_gene(self):
+        rng = np.random.default_rng(42)
+        child = np.array([[0, 1, 2, 3, 0, 1, 2, 3]], dtype=np.int8)
+        result = mutation(child, mutation_rate=1.0, gene_ratio=0.0, rng=rng)
+        changed = np.flatnonzero(result != child)
+        assert len(changed) == 1
+        assert child.flat[changed[0]] in (0, 1)
+
+    def test_flips_by_xor_without_touching_input(self):
+        rng = np.random.default_rng(3)
+        child = np.tile(np.array([0, 1, 2, 3], dtype=np.int8), (6, 5))
+        original = child.copy()
+        result = mutation(child, mutation_rate=1.0, gene_ratio=0.5, rng=rng)
+        np.testing.assert_array_equal(child, original)
+        changed = result != child
+        assert changed.any()
+        np.testing.assert_array_equal(result[changed], 1 - child[changed])
+
 
 class TestHolidayFix:
     def test_corrects_excess_holidays(self, small_shift_input):
         # Give everyone 5 holidays (need 2)
-        schedule = np.ones((3, 7), dtype=int)
+        schedule = np.ones((3, 7), dtype=np.int8)
         schedule[:, :2] = 0
         # Preserve preferred off
         schedule[0, 2] = 2
@@ -93,7 +138,7 @@ class TestHolidayFix:
 
     def test_corrects_deficit_holidays(self, small_shift_input):
         # Give everyone 0 holidays (need 2)
-        schedule = np.zeros((3, 7), dtype=int)
+        schedule = np.zeros((3, 7), dtype=np.int8)
         schedule[0, 2] = 2  # Preserve preferred off
         result = holiday_fix(schedule, small_shift_input)
         for emp in small_shift_input.employees:
@@ -101,14 +146,14 @@ class TestHolidayFix:
             assert actual == emp.required_holidays
 
     def test_preserves_preferred_off(self, small_shift_input):
-        schedule = np.zeros((3, 7), dtype=int)
+        schedule = np.zeros((3, 7), dtype=np.int8)
         schedule[0, 2] = 2
         result = holiday_fix(schedule, small_shift_input)
         assert result[0, 2] == 2
 
     def test_preserves_unavailable_code3(self, kimachiya_shift_input):
         """Code 3 cells must not be changed by holiday_fix."""
-        schedule = np.zeros((5, 14), dtype=int)
+        schedule = np.zeros((5, 14), dtype=np.int8)
         schedule[3, 3] = 3  # Shimamura Wed
         schedule[3, 10] = 3
         result = holiday_fix(schedule, kimachiya_shift_input)
@@ -117,10 +162,51 @@ class TestHolidayFix:
 
     def test_code3_counts_toward_holidays(self, kimachiya_shift_input):
         """Code 3 should count as non-work in holiday total."""
-        schedule = np.zeros((5, 14), dtype=int)
+        schedule = np.zeros((5, 14), dtype=np.int8)
         schedule[3, 3] = 3  # counts as 1 non-work day
         schedule[3, 10] = 3  # counts as 1 non-work day
         result = holiday_fix(schedule, kimachiya_shift_input)
         # Shimamura needs 4 holidays total; has 2 code-3 → needs 2 more code-1
         actual = int(np.count_nonzero(result[3]))
         assert actual == 4
+
+    def test_does_not_modify_input_when_candidates_run_out(self, small_shift_input):
+        """Too few 1s to remove → all GA holidays become work; 2s stay, input untouched."""
+        schedule = np.full((3, 7), 2, dtype=np.int8)
+        schedule[:, 0] = 1
+        original = schedule.copy()
+        result = holiday_fix(schedule, small_shift_input)
+        np.testing.assert_array_equal(schedule, original)
+        np.testing.assert_array_equal(result[:, 0], 0)
+        np.testing.assert_array_equal(result[:, 1:], 2)
+
+    def test_leaves_rows_without_employee_alone(self, small_shift_input):
+        si = ShiftInput.model_validate(
+            small_shift_input.model_dump() | {"employees": small_shift_input.employees[:2]}
+        )
+        schedule = np.ones((3, 7), dtype=np.int8)
+        result = holiday_fix(schedule, si, rng=np.random.default_rng(0))
+        assert si.holiday_targets[2] == -1
+        np.testing.assert_array_equal(result[2], schedule[2])
+        assert np.count_nonzero(result[:2], axis=1).tolist() == si.holiday_targets[:2].tolist()
+
+
+class TestInt8Genes:
+    def test_operators_return_int8(self, small_shift_input):
+        p1 = np.zeros((3, 7), dtype=np.int8)
+        ch1, ch2 = crossover_uniform(p1, p1 + 1)
+        assert ch1.dtype == ch2.dtype == np.int8
+        assert mutation(ch1, mutation_rate=1.0).dtype == np.int8
+        assert holiday_fix(ch2, small_shift_input).dtype == np.int8
+
+    @pytest.mark.parametrize(
+        "call",
+        [
+            pytest.param(lambda s, si: crossover_uniform(s, s), id="crossover"),
+            pytest.param(lambda s, si: mutation(s, mutation_rate=1.0), id="mutation"),
+            pytest.param(lambda s, si: holiday_fix(s, si), id="holiday_fix"),
+        ],
+    )
+    def test_rejects_wider_dtype(self, small_shift_input, call):
+        with pytest.raises(TypeError, match="int8"):
+            call(np.zeros((3, 7), dtype=np.int64), small_shift_input)
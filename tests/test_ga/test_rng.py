@@ -0,0 +1,13 @@
+"""Tests for the shared GA random generator."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from ga_shift.ga.rng import DEFAULT_RNG, resolve_rng
+
+
+def test_resolve_rng_falls_back_to_shared_default():
+    assert resolve_rng(None) is DEFAULT_RNG
+    rng = np.random.default_rng(0)
+    assert resolve_rng(rng) is rng
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import io
 import tempfile
 from pathlib import Path
 
 import numpy as np
 import pytest
+from openpyxl import load_workbook
+from pydantic import ValidationError
 
 from ga_shift.io.excel_reader import read_shift_input
 from ga_shift.io.template_generator import generate_kimachiya_template
@@ -15,6 +18,11 @@ from ga_shift.models.schedule import ShiftInput
 
 
 class TestReadShiftInput:
+    @pytest.fixture
+    def sample_shift_input(self, sample_shift_input_from_excel: ShiftInput) -> ShiftInput:
+        """Exercise the reader path rather than the in-memory conftest copy."""
+        return sample_shift_input_from_excel
+
     def test_loads_correct_dimensions(self, sample_shift_input: ShiftInput):
         assert sample_shift_input.num_employees >= 1
         assert sample_shift_input.num_days >= 1
@@ -37,6 +45,31 @@ class TestReadShiftInput:
         # Valid values: 0 (work), 2 (preferred off), 3 (unavailable)
         assert all(v in (0, 2, 3) for v in unique)
 
+    def test_arrays_are_contiguous_int8(self, sample_shift_input: ShiftInput):
+        for arr in (sample_shift_input.base_schedule, sample_shift_input.required_workers):
+            assert arr.dtype == np.int8
+            assert arr.flags.c_contiguous
+
+    def test_employee_arrays_mirror_employees(self, sample_shift_input: ShiftInput):
+        si = sample_shift_input
+        for emp in si.employees:
+            assert si.required_holidays_arr[emp.index] == emp.required_holidays
+            assert si.holiday_targets[emp.index] == emp.required_holidays
+            preferred_days = tuple(np.flatnonzero(si.preferred_off_mask[emp.index]) + 1)
+            assert preferred_days == emp.preferred_days_off
+            assert tuple(np.flatnonzero(si.unavailable_mask[emp.index]) + 1) == emp.unavailable_days
+
+    def test_weekend_mask_matches_weekdays(self, sample_shift_input: ShiftInput):
+        si = sample_shift_input
+        assert si.is_weekend.shape == (si.num_days,)
+        assert si.is_weekend.tolist() == [w in (5, 6) for w in si.weekdays]
+
+    def test_employees_are_frozen_and_hashable(self, sample_shift_input: ShiftInput):
+        emp = sample_shift_input.employees[0]
+        assert len(set(sample_shift_input.employees)) == sample_shift_input.num_employees
+        with pytest.raises(ValidationError):
+            emp.name = "changed"
+
     def test_employees_list(self, sample_shift_input: ShiftInput):
         assert len(sample_shift_input.employees) == sample_shift_input.num_employees
         for emp in sample_shift_input.employees:
@@ -44,6 +77,22 @@ class TestReadShiftInput:
             assert emp.name
 
 
+class TestSampleFixture:
+    def test_in_memory_fixture_matches_reader(
+        self, sample_shift_input: ShiftInput, sample_shift_input_from_excel: ShiftInput
+    ):
+        built, read = sample_shift_input, sample_shift_input_from_excel
+        assert built.employees == read.employees
+        assert built.employee_names == read.employee_names
+        assert built.day_labels == read.day_labels
+        assert built.weekdays == read.weekdays
+        np.testing.assert_array_equal(built.base_schedule, read.base_schedule)
+        np.testing.assert_array_equal(built.required_workers, read.required_workers)
+        np.testing.assert_array_equal(
+            built.required_kitchen_workers, read.required_kitchen_workers
+        )
+
+
 class TestKimachiyaRoundTrip:
     """Tests for kimachiya-specific Excel round-trip."""
 
@@ -55,6 +104,21 @@ class TestKimachiyaRoundTrip:
         yield filepath
         Path(filepath).unlink(missing_ok=True)
 
+    def test_template_written_to_buffer_matches_file(self, kimachiya_excel):
+        buf = io.BytesIO()
+        assert generate_kimachiya_template(buf, 2026, 3) is buf
+        buf.seek(0)
+        from_buffer = load_workbook(buf)["シフト表"]
+        from_file = load_workbook(kimachiya_excel)["シフト表"]
+        assert list(from_buffer.values) == list(from_file.values)
+
+    def test_reads_from_file_like(self, kimachiya_excel):
+        from_file = read_shift_input(kimachiya_excel)
+        from_buffer = read_shift_input(io.BytesIO(Path(kimachiya_excel).read_bytes()))
+        assert from_buffer.employees == from_file.employees
+        np.testing.assert_array_equal(from_buffer.base_schedule, from_file.base_schedule)
+        np.testing.assert_array_equal(from_buffer.required_workers, from_file.required_workers)
+
     def test_kimachiya_dimensions(self, kimachiya_excel):
         si = read_shift_input(kimachiya_excel)
         assert si.num_employees == 5
@@ -1106,6 +1106,22 @@ class TestSimulateScenario:
         assert "staff_gap" in result["scenario"]
         assert "meets_new_minimum" in result["scenario"]
 
+    def test_staff_scenarios_have_risk_level(self, kimachiya_template_path, kimachiya_staff):
+        """追加・利用者数変更シミュレーションにもリスクレベルが含まれること。"""
+        setup_facility(name="木町家", staff=kimachiya_staff)
+        added = simulate_scenario(
+            base_template_path=str(kimachiya_template_path),
+            scenario_type="add_staff",
+            scenario_params={"staff_name": "新人"},
+        )
+        changed = simulate_scenario(
+            base_template_path=str(kimachiya_template_path),
+            scenario_type="change_users",
+            scenario_params={"new_user_count": 60},
+        )
+        assert added["scenario"]["risk_level"] == "低"
+        assert changed["scenario"]["risk_level"] == "高"
+
     def test_change_constraint_basic(self, kimachiya_template_path):
         """制約変更シミュレーションが成功すること。"""
         result = simulate_scenario(
@@ -1116,6 +1132,16 @@ class TestSimulateScenario:
         assert result["status"] == "ok"
         assert result["scenario"]["scenario_type"] == "change_constraint"
 
+    def test_change_constraint_skips_baseline(self, kimachiya_template_path):
+        """制約変更シミュレーションではベースライン分析を行わないこと。"""
+        result = simulate_scenario(
+            base_template_path=str(kimachiya_template_path),
+            scenario_type="change_constraint",
+            scenario_params={"constraint_type": "kitchen_min_workers"},
+        )
+        assert "note" in result["baseline"]
+        assert "staff_count" not in result["baseline"]
+
     def test_change_constraint_invalid(self, kimachiya_template_path):
         """存在しない制約でエラーを返すこと。"""
         result = simulate_scenario(